@@ -25,11 +25,11 @@ import sys
 import time
 from pathlib import Path
 
-import yaml
-
 # Add src to path
 REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT / "src"))
+SRC_ROOT = str(REPO_ROOT / "src")
+if SRC_ROOT not in sys.path:
+    sys.path.insert(0, SRC_ROOT)
 
 logger = logging.getLogger(__name__)
 
@@ -43,8 +43,10 @@ def _handle_signal(signum: int, frame: object) -> None:
 
 
 def load_config(config_file: str) -> dict:
+    from utils.yaml_loader import safe_load
+
     with open(config_file, "r") as f:
-        return yaml.safe_load(f)
+        return safe_load(f)
 
 
 def main() -> None:
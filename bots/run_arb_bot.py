@@ -20,63 +20,207 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import random
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from decimal import ROUND_UP, Decimal
+from decimal import (
+    ROUND_DOWN,
+    ROUND_UP,
+    Decimal,
+    InvalidOperation,
+    localcontext,
+)
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-
-import yaml
+from typing import Any, Callable
 
 # Add src to path
 REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT / "src"))
+SRC_ROOT = str(REPO_ROOT / "src")
+if SRC_ROOT not in sys.path:
+    sys.path.insert(0, SRC_ROOT)
 
 logger = logging.getLogger(__name__)
 
 REQUIRED_FEE_RATE = Decimal("0.002")
 
+DEFAULT_POLL_INTERVAL = 5.0
+
+# Significant digits used for cycle math. Exchange prices and quantities carry
+# well under 18 significant digits, so 20 keeps a guard digit while making every
+# Decimal multiply/divide cheaper than the default 28-digit context. Override
+# with ``decimal_precision`` in the config if a market needs more headroom.
+DEFAULT_DECIMAL_PRECISION = 20
+
+# Order statuses (lower-cased) that end fill polling between arbitrage legs.
+FILLED_ORDER_STATUSES = frozenset({"filled", "closed"})
+CLOSED_ORDER_STATUSES = frozenset({"cancelled", "canceled", "rejected", "expired"})
+# Order payload fields that carry the average fill price.
+FILL_PRICE_KEYS = ("avgPrice", "avg_price", "averagePrice", "average")
+
+# Margin below min_profitability within which the float pre-check defers to
+# the exact Decimal calculation instead of rejecting a cycle outright.
+FLOAT_PREFILTER_SLACK = 1e-9
+CYCLE_SEPARATOR = "=" * 80
+# Cycle header timestamps go through time.strftime on the current struct_time
+# rather than building a datetime each cycle.
+CYCLE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Ceiling, in seconds, of the exponential backoff after failed price fetches.
+PRICE_BACKOFF_MAX_SEC = 60.0
+
 
 def load_config(config_file):
     """Load configuration from YAML file."""
+    from utils.yaml_loader import safe_load
+
     with open(config_file, "r") as f:
-        return yaml.safe_load(f)
+        return safe_load(f)
+
+
+@dataclass(frozen=True)
+class _CycleSettings:
+    """Config values used on every cycle, parsed once per config."""
+
+    pair_ab: str
+    pair_bc: str
+    pair_ac: str
+    fee_rate: Decimal
+    fee_factor: Decimal
+    fee_factor_cubed: Decimal
+    # Float pre-check: a TriangleScanner compiled once for the configured
+    # triangle, and the threshold it is compared against.
+    triangle_scanner: Any
+    min_ratio_float: float
+    min_profit_pct: float
+    min_notional: Decimal
+    min_profit: Decimal
+    # Rounders specialised for the market's step size or precision: minimums
+    # round up, order quantities round down.
+    round_min_quantity: Callable[[Decimal], Decimal]
+    round_order_quantity: Callable[[Decimal], Decimal]
+    user_provided_id: str | None
+    strict_validate: bool | None
+
+
+def _build_cycle_settings(config):
+    """Return the per-cycle settings parsed from ``config``.
+
+    Fee rate, minimum notional, quantity rounding and pair names are resolved
+    here; the bot builds them once at startup and passes them down to every
+    cycle instead of re-parsing the config.
+    """
+    from strategies.triangular_arb import TriangleScanner
+    from utils.notional import resolve_quantity_rounding
+
+    fee_rate = _resolve_fee_rate(config)
+    step_size, precision = resolve_quantity_rounding(config)
+    fee_factor = Decimal("1") - fee_rate
+    min_profit = Decimal(str(config["min_profitability"]))
+    # USDT -> ETH buys the base of pair_ab; the other two legs sell.
+    triangle = (
+        (config["pair_ab"], True),
+        (config["pair_bc"], False),
+        (config["pair_ac"], False),
+    )
+    settings = _CycleSettings(
+        pair_ab=config["pair_ab"],
+        pair_bc=config["pair_bc"],
+        pair_ac=config["pair_ac"],
+        fee_rate=fee_rate,
+        fee_factor=fee_factor,
+        fee_factor_cubed=fee_factor * fee_factor * fee_factor,
+        triangle_scanner=TriangleScanner([triangle]),
+        min_ratio_float=1.0 + float(min_profit) - FLOAT_PREFILTER_SLACK,
+        min_profit_pct=float(min_profit) * 100,
+        min_notional=_resolve_min_notional(config),
+        min_profit=min_profit,
+        round_min_quantity=_make_rounder(step_size, precision, ROUND_UP),
+        round_order_quantity=_make_rounder(step_size, precision, ROUND_DOWN),
+        user_provided_id=(
+            config.get("userProvidedId") or config.get("user_provided_id")
+        ),
+        strict_validate=(
+            config["strictValidate"]
+            if "strictValidate" in config
+            else config.get("strict_validate")
+        ),
+    )
+    return settings
+
+
+def _to_decimal(value):
+    # Settings already hold Decimals; only foreign values need parsing.
+    return value if isinstance(value, Decimal) else Decimal(str(value))
 
 
-def _round_quantity(value, step_size, precision):
-    from nonkyc_client.pricing import round_up_to_step
+@lru_cache(maxsize=32)
+def _quantizer(precision):
+    return Decimal("1").scaleb(-precision)
 
+
+def _identity(value):
+    return value
+
+
+def _make_rounder(step_size, precision, rounding):
+    """Return a function rounding a quantity to ``step_size`` or ``precision``.
+
+    The step or quantum is parsed and the branch chosen once, so the returned
+    function does a single Decimal operation per call.
+    """
     if step_size is not None:
-        return round_up_to_step(value, Decimal(str(step_size)))
+        step = _to_decimal(step_size)
+        if step <= 0:
+            return _identity
+
+        def round_to_step(value):
+            return (value / step).to_integral_value(rounding=rounding) * step
+
+        return round_to_step
     if precision is None:
-        return value
-    quantizer = Decimal("1").scaleb(-precision)
-    return value.quantize(quantizer, rounding=ROUND_UP)
+        return _identity
+    quantum = _quantizer(precision)
 
+    def round_to_precision(value):
+        return value.quantize(quantum, rounding=rounding)
 
-def _min_quantities_for_cycle(config, prices, step_size, precision):
-    from nonkyc_client.pricing import min_quantity_for_notional
+    return round_to_precision
 
-    min_notional = Decimal(str(config.get("min_notional_usd", "1.0")))
-    fee_rate = _resolve_fee_rate(config)
+
+def _min_quantities_for_cycle(settings, prices):
+    """Return the rounded minimum order quantity for each pair of the cycle.
+
+    Only the price-dependent part is computed per call: the minimum notional,
+    fee factor and rounding come from the prebuilt cycle settings.
+    """
+    min_notional = settings.min_notional
+    fee_factor = settings.fee_factor
+    round_min_quantity = settings.round_min_quantity
     min_quantities = {}
-    for pair in (config["pair_ab"], config["pair_bc"], config["pair_ac"]):
-        min_qty = min_quantity_for_notional(
-            price=prices[pair],
-            min_notional=min_notional,
-            fee_rate=fee_rate,
-        )
-        min_quantities[pair] = _round_quantity(min_qty, step_size, precision)
+    for pair in (settings.pair_ab, settings.pair_bc, settings.pair_ac):
+        price = prices[pair]
+        denominator = price * fee_factor
+        if denominator <= 0:
+            min_qty = Decimal("0")
+        else:
+            min_qty = min_notional / denominator
+            if min_qty * denominator < min_notional:
+                min_qty = min_qty.next_plus()
+        min_quantities[pair] = round_min_quantity(min_qty)
     return min_quantities
 
 
-def _simulate_fee_adjusted_cycle(config, prices, start_amount, min_quantities):
-    fee_rate = _resolve_fee_rate(config)
-    pair_ab = config["pair_ab"]
-    pair_bc = config["pair_bc"]
-    pair_ac = config["pair_ac"]
+def _simulate_fee_adjusted_cycle(settings, prices, start_amount, min_quantities):
+    fee_factor = settings.fee_factor
+    pair_ab = settings.pair_ab
+    pair_bc = settings.pair_bc
+    pair_ac = settings.pair_ac
 
     min_eth = max(min_quantities[pair_ab], min_quantities[pair_bc])
     min_start_usdt = min_eth * prices[pair_ab]
@@ -84,34 +228,58 @@ def _simulate_fee_adjusted_cycle(config, prices, start_amount, min_quantities):
 
     eth_amount = adjusted_start / prices[pair_ab]
     eth_amount = max(eth_amount, min_eth)
-    eth_amount = eth_amount * (Decimal("1") - fee_rate)
+    eth_amount = eth_amount * fee_factor
 
     btc_amount = eth_amount * prices[pair_bc]
     btc_amount = max(btc_amount, min_quantities[pair_ac])
-    btc_amount = btc_amount * (Decimal("1") - fee_rate)
+    btc_amount = btc_amount * fee_factor
 
     final_usdt = btc_amount * prices[pair_ac]
-    final_usdt = final_usdt * (Decimal("1") - fee_rate)
+    final_usdt = final_usdt * fee_factor
 
     profit = final_usdt - adjusted_start
     profit_ratio = profit / adjusted_start
     return adjusted_start, final_usdt, profit_ratio
 
 
-def _should_skip_notional(config, symbol, side, quantity, price, order_type):
-    from nonkyc_client.pricing import effective_notional
+def _resolve_min_notional(config):
+    return Decimal(str(config.get("min_notional_usd", "1.0")))
 
-    min_notional = Decimal(str(config.get("min_notional_usd", "1.0")))
-    fee_rate = _resolve_fee_rate(config)
-    notional = effective_notional(quantity, price, fee_rate)
-    if notional < min_notional:
-        print(
-            "⚠️  Skipping order below min notional: "
-            f"symbol={symbol} side={side} order_type={order_type} "
-            f"price={price} quantity={quantity} notional={notional}"
-        )
-        return True
-    return False
+
+def _should_skip_notional(
+    min_notional,
+    fee_factor,
+    symbol,
+    side,
+    quantity,
+    price,
+    order_type,
+    min_quantity=None,
+):
+    """Return True when an order's after-fee notional is below ``min_notional``.
+
+    ``min_notional`` and ``fee_factor`` (``1 - fee_rate``) are resolved once per
+    execution by the caller so the passing case does no parsing or formatting.
+    ``min_quantity`` is the pair's precomputed minimum from
+    :func:`_min_quantities_for_cycle`; any quantity at or above it clears the
+    minimum notional, so the check is a single comparison.
+    """
+    if min_quantity is not None and quantity >= min_quantity:
+        return False
+    notional = quantity * price * fee_factor
+    if notional >= min_notional:
+        return False
+    logger.warning(
+        "⚠️  Skipping order below min notional: "
+        "symbol=%s side=%s order_type=%s price=%s quantity=%s notional=%s",
+        symbol,
+        side,
+        order_type,
+        price,
+        quantity,
+        notional,
+    )
+    return True
 
 
 def _resolve_signing_enabled(config):
@@ -131,31 +299,32 @@ def _resolve_fee_rate(config):
         return REQUIRED_FEE_RATE
     parsed = Decimal(str(configured))
     if parsed != REQUIRED_FEE_RATE:
-        print(
+        logger.warning(
             "⚠️  Fee rate mismatch detected. "
-            f"Configured fee_rate={parsed} but exchange fee is {REQUIRED_FEE_RATE}. "
-            "Using the exchange fee."
+            "Configured fee_rate=%s but exchange fee is %s. Using the exchange fee.",
+            parsed,
+            REQUIRED_FEE_RATE,
         )
         config["fee_rate"] = str(REQUIRED_FEE_RATE)
         return REQUIRED_FEE_RATE
     return parsed
 
 
-_NUMERIC_RE = re.compile(r"^[+-]?\d+(\.\d+)?([eE][+-]?\d+)?$")
+@lru_cache(maxsize=1024)
+def _parse_price_string(candidate):
+    try:
+        parsed = Decimal(candidate)
+    except (InvalidOperation, ValueError):
+        return None
+    return parsed if parsed.is_finite() else None
 
 
 def _coerce_price_value(value):
     if value is None:
         return None
-    if isinstance(value, str):
-        candidate = value.strip()
-    else:
-        candidate = str(value).strip()
-    if not candidate:
-        return None
-    if not _NUMERIC_RE.match(candidate):
-        return None
-    return Decimal(candidate)
+    # Orderbook rows repeat the same price/size strings heavily, so parsed
+    # values are memoized; Decimal is immutable, so sharing them is safe.
+    return _parse_price_string(value if isinstance(value, str) else str(value))
 
 
 def _fallback_price_from_ticker(ticker):
@@ -176,8 +345,20 @@ def _fallback_price_from_ticker(ticker):
     return None
 
 
+def _extract_book_price(level):
+    # Orderbook levels are [price, size, ...] or {"price": price, ...}.
+    if isinstance(level, (list, tuple)):
+        return _coerce_price_value(level[0]) if level else None
+    if isinstance(level, dict):
+        return _coerce_price_value(level.get("price"))
+    return None
+
+
 def _get_orderbook_mid_price(client, pair):
-    """Fetch mid-price from orderbook as final fallback."""
+    """Fetch mid-price from orderbook as final fallback.
+
+    Requests a single level per side and reads only the top of each side.
+    """
     try:
         from nonkyc_client.rest import RestRequest
 
@@ -188,39 +369,63 @@ def _get_orderbook_mid_price(client, pair):
                 params={"ticker_id": pair, "depth": "1"},
             )
         )
-        payload = response.get("data", response.get("result", response))
+        if "data" in response:
+            payload = response["data"]
+        elif "result" in response:
+            payload = response["result"]
+        else:
+            payload = response
         if not isinstance(payload, dict):
             return None
 
-        bids = payload.get("bids", [])
-        asks = payload.get("asks", [])
-
+        bids = payload.get("bids")
+        asks = payload.get("asks")
         if not bids or not asks:
             return None
 
-        # Extract best bid and ask prices
-        # Orderbook format can be [[price, size], ...] or [{"price": price, "size": size}, ...]
-        def extract_price(item):
-            if isinstance(item, (list, tuple)) and len(item) >= 2:
-                return _coerce_price_value(item[0])
-            elif isinstance(item, dict):
-                return _coerce_price_value(item.get("price"))
-            return None
-
-        best_bid = extract_price(bids[0])
-        best_ask = extract_price(asks[0])
-
+        best_bid = _extract_book_price(bids[0])
+        best_ask = _extract_book_price(asks[0])
         if best_bid is not None and best_ask is not None:
             return (best_bid + best_ask) / Decimal("2")
 
         return None
     except Exception as e:
-        print(f"    DEBUG: orderbook fallback failed: {e}")
+        logger.debug("Orderbook fallback failed for %s: %s", pair, e)
         return None
 
 
-def get_price(client, pair):
-    """Fetch current market price for a trading pair."""
+# pair -> (time.monotonic() when fetched, price)
+_PRICE_CACHE: dict[str, tuple[float, Decimal]] = {}
+_PRICE_CACHE_STATS = {"hits": 0, "misses": 0}
+# Longest Retry-After the exchange sent with a rate-limited price request since
+# the loop last read it; see _price_failure_backoff.
+_PRICE_RETRY_AFTER: dict[str, float | None] = {"value": None}
+
+
+def get_price(client, pair, cache_ttl=0.0):
+    """Fetch current market price for a trading pair.
+
+    When ``cache_ttl`` is positive, a price fetched less than ``cache_ttl``
+    seconds ago is returned without another request. A failed fetch evicts
+    the pair so a stale price is never served after an error.
+    """
+    if cache_ttl > 0:
+        cached = _PRICE_CACHE.get(pair)
+        if cached is not None and time.monotonic() - cached[0] < cache_ttl:
+            _PRICE_CACHE_STATS["hits"] += 1
+            return cached[1]
+        _PRICE_CACHE_STATS["misses"] += 1
+    price = _fetch_price(client, pair)
+    if price is None:
+        _PRICE_CACHE.pop(pair, None)
+    elif cache_ttl > 0:
+        _PRICE_CACHE[pair] = (time.monotonic(), price)
+    return price
+
+
+def _fetch_price(client, pair):
+    from nonkyc_client.rest import RateLimitError
+
     try:
         ticker = client.get_market_data(pair)
         price = _coerce_price_value(ticker.last_price)
@@ -229,217 +434,590 @@ def get_price(client, pair):
             if fallback_result is None:
                 # Try orderbook as final fallback
                 logger.debug(
-                    f"Invalid last_price for {pair}: {ticker.last_price!r}, "
-                    "trying orderbook..."
+                    "Invalid last_price for %s: %r, trying orderbook...",
+                    pair,
+                    ticker.last_price,
                 )
                 orderbook_price = _get_orderbook_mid_price(client, pair)
                 if orderbook_price is not None:
-                    logger.debug(f"{pair}: {orderbook_price} (from orderbook)")
+                    logger.debug("%s: %s (from orderbook)", pair, orderbook_price)
                     return orderbook_price
-                logger.warning(f"No price data available for {pair}")
+                logger.warning("No price data available for %s", pair)
                 return None
             fallback_price, fallback_source = fallback_result
             logger.debug(
-                f"Invalid last_price for {pair}: {ticker.last_price!r}, "
-                f"using fallback {fallback_price} from {fallback_source}"
+                "Invalid last_price for %s: %r, using fallback %s from %s",
+                pair,
+                ticker.last_price,
+                fallback_price,
+                fallback_source,
             )
             price = fallback_price
-        logger.debug(f"{pair}: {price}")
+        logger.debug("%s: %s", pair, price)
         return price
+    except RateLimitError as e:
+        logger.error("Rate limited fetching price for %s: %s", pair, e)
+        if e.retry_after is not None:
+            previous = _PRICE_RETRY_AFTER["value"]
+            _PRICE_RETRY_AFTER["value"] = max(previous or 0.0, e.retry_after)
+        return None
     except Exception as e:
-        logger.error(f"Failed to fetch price for {pair}: {e}")
+        logger.error("Failed to fetch price for %s: %s", pair, e)
         return None
 
 
-def calculate_conversion_rates(config, prices):
-    """Calculate conversion rates for the triangular cycle."""
-    # USDT → ETH → BTC → USDT
-    pair_ab = config["pair_ab"]  # ETH-USDT
-    pair_bc = config["pair_bc"]  # ETH-BTC
-    pair_ac = config["pair_ac"]  # BTC-USDT
+def _prices_moved(prices, reference, delta):
+    """Return True if any price differs from ``reference`` by more than ``delta``.
+
+    ``delta`` is relative (``0.0001`` = 0.01%); ``0`` counts any change. Both
+    arguments are price tuples in the same pair order.
+    """
+    if reference is None:
+        return True
+    if not delta:
+        return prices != reference
+    for price, old in zip(prices, reference):
+        if not old or abs((price - old) / old) > delta:
+            return True
+    return False
+
+
+def _describe_cycle(legs):
+    """Render cycle legs from find_negative_cycle as ``A -> B -> ... -> A``."""
+    assets = []
+    for pair, invert in legs:
+        base, quote = re.split(r"[/_-]", pair, maxsplit=1)
+        assets.append(quote if invert else base)
+    return " -> ".join(assets + assets[:1])
+
+
+def _price_failure_backoff(consecutive_failures):
+    """Return how long to wait after ``consecutive_failures`` failed fetches.
+
+    The wait doubles with each failure up to ``PRICE_BACKOFF_MAX_SEC`` plus up
+    to a second of jitter, so an outage is not polled at the cycle cadence. A
+    ``Retry-After`` sent with a rate-limit response is honoured if longer.
+    """
+    # Cap the exponent too: 2.0**n overflows once n reaches 1024.
+    exponent = min(consecutive_failures, 16)
+    delay = min(PRICE_BACKOFF_MAX_SEC, 2.0**exponent) + random.random()
+    retry_after = _PRICE_RETRY_AFTER["value"]
+    _PRICE_RETRY_AFTER["value"] = None
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
 
-    # For each step, calculate how much we get
-    # Step 1: USDT → ETH (buy ETH with USDT)
-    # ETH-USDT means price in USDT (how much USDT for 1 ETH), so we invert for ETH per USDT
-    eth_usdt_price = prices[pair_ab]  # USDT per ETH
-    usdt_eth_rate = Decimal("1") / eth_usdt_price  # ETH per USDT
 
-    # Step 2: ETH → BTC (sell ETH for BTC)
-    # ETH-BTC means price in BTC (how much BTC for 1 ETH), so BTC per ETH
-    eth_btc_rate = prices[pair_bc]  # BTC per ETH
+def _normalize_pair(pair):
+    return pair.upper().replace("/", "_").replace("-", "_")
+
+
+def get_all_prices(client, pairs):
+    """Fetch prices for ``pairs`` from the all-markets ``/tickers`` endpoint.
+
+    One request covers every pair. Returns ``{pair: price}`` for the pairs
+    found in the response; missing or unpriced pairs are left out.
+    """
+    from nonkyc_client.rest import RestRequest
+
+    response = client.send(RestRequest(method="GET", path="/tickers"))
+    payload = response
+    if isinstance(response, dict):
+        payload = response.get("data", response.get("result", response))
+    if not isinstance(payload, list):
+        return {}
+
+    wanted = {_normalize_pair(pair): pair for pair in pairs}
+    prices = {}
+    for item in payload:
+        if not isinstance(item, dict):
+            continue
+        ticker_id = item.get("ticker_id") or item.get("symbol") or ""
+        pair = wanted.get(_normalize_pair(str(ticker_id)))
+        if pair is None:
+            continue
+        price = _coerce_price_value(item.get("last_price", item.get("last")))
+        if price is None:
+            bid = _coerce_price_value(item.get("bid"))
+            ask = _coerce_price_value(item.get("ask"))
+            if bid is not None and ask is not None:
+                price = (bid + ask) / Decimal("2")
+        if price is not None:
+            prices[pair] = price
+    return prices
 
-    # Step 3: BTC → USDT (sell BTC for USDT)
-    # BTC-USDT means price in USDT (how much USDT for 1 BTC), so USDT per BTC
-    btc_usdt_rate = prices[pair_ac]  # USDT per BTC
 
-    return {
-        "step1": usdt_eth_rate,  # USDT → ETH
-        "step2": eth_btc_rate,  # ETH → BTC
-        "step3": btc_usdt_rate,  # BTC → USDT
-    }
+# Cleared when /tickers answers with a non-transient error, so a missing
+# endpoint costs one request per run rather than one per cycle.
+_BATCH_TICKERS = {"available": True}
+
+
+def _fetch_batch_prices(client, pairs, cache_ttl):
+    from nonkyc_client.rest import RestError, TransientApiError
+
+    if cache_ttl > 0:
+        now = time.monotonic()
+        cached = {pair: _PRICE_CACHE.get(pair) for pair in pairs}
+        if all(
+            entry is not None and now - entry[0] < cache_ttl
+            for entry in cached.values()
+        ):
+            _PRICE_CACHE_STATS["hits"] += len(pairs)
+            return {pair: entry[1] for pair, entry in cached.items()}
+    try:
+        prices = get_all_prices(client, pairs)
+    except TransientApiError as exc:
+        logger.warning("Batch /tickers fetch failed: %s", exc)
+        return {}
+    except RestError as exc:
+        logger.warning(
+            "Batch /tickers endpoint unavailable (%s); using per-pair requests", exc
+        )
+        _BATCH_TICKERS["available"] = False
+        return {}
+    if cache_ttl > 0:
+        fetched_at = time.monotonic()
+        for pair, price in prices.items():
+            _PRICE_CACHE[pair] = (fetched_at, price)
+    return prices
+
+
+def fetch_prices(client, pairs, executor=None, cache_ttl=0.0, batch=False):
+    """Fetch prices for ``pairs``, concurrently when ``executor`` is given.
+
+    With ``batch``, all pairs are first requested in a single ``/tickers``
+    call; only pairs missing from that response fall back to per-pair
+    requests. Returns a dict of the prices that were fetched; pairs whose
+    fetch failed are left out so the caller can report them.
+    """
+    prices = {}
+    if batch and _BATCH_TICKERS["available"]:
+        prices = _fetch_batch_prices(client, pairs, cache_ttl)
+    missing = [pair for pair in pairs if pair not in prices]
+    if not missing:
+        return prices
+
+    def fetch(pair):
+        return get_price(client, pair, cache_ttl)
+
+    if executor is None or len(missing) == 1:
+        results = [fetch(pair) for pair in missing]
+    else:
+        results = list(executor.map(fetch, missing))
+    prices.update(
+        (pair, price) for pair, price in zip(missing, results) if price is not None
+    )
+    return prices
+
+
+def _current_prices(
+    client,
+    pairs,
+    price_feed,
+    max_age,
+    executor=None,
+    cache_ttl=0.0,
+    batch=False,
+):
+    """Return prices for ``pairs``, preferring fresh streamed prices.
+
+    A pair whose streamed price is older than ``max_age`` seconds (e.g. after
+    the WebSocket silently dropped) is fetched over REST instead.
+    """
+    prices = {}
+    if price_feed is not None:
+        for pair in pairs:
+            price = price_feed.price(pair, max_age)
+            if price is not None:
+                prices[pair] = price
+    missing = tuple(pair for pair in pairs if pair not in prices)
+    if missing:
+        prices.update(fetch_prices(client, missing, executor, cache_ttl, batch))
+    return prices
+
+
+class _PricePrefetcher:
+    """Refresh cached prices in the background shortly before they expire.
+
+    Each pair is re-fetched once its cache entry is ``ttl - lead`` seconds
+    old, so ``get_price`` with the same ``ttl`` finds a fresh entry instead
+    of blocking on a request. A failed refresh leaves the entry to expire
+    and the loop then fetches (and reports) the pair itself.
+
+    A refresh that moves a price by more than ``wake_delta`` (relative)
+    wakes :meth:`wait_for_update`, so the loop can evaluate it at once.
+    """
+
+    def __init__(self, client, pairs, ttl, lead, wake_delta=0.0):
+        self._client = client
+        self._wake_delta = wake_delta
+        self._price_changed = threading.Event()
+        self._pairs = tuple(pairs)
+        # Separate workers so refreshes never queue behind the loop's fetches.
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self._pairs), thread_name_prefix="arb-prefetch"
+        )
+        self._refresh_after = max(ttl - lead, 0.05)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name="arb-price-prefetch", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+        self._executor.shutdown(wait=False)
+
+    def wait_for_update(self, timeout):
+        """Block until a refresh moves a price; return False on timeout."""
+        changed = self._price_changed.wait(timeout)
+        self._price_changed.clear()
+        return changed
+
+    def _refresh(self, pair):
+        price = _fetch_price(self._client, pair)
+        if price is None:
+            return
+        previous = _PRICE_CACHE.get(pair)
+        _PRICE_CACHE[pair] = (time.monotonic(), price)
+        if previous is not None and previous[1] != price:
+            old = previous[1]
+            if old and abs((price - old) / old) > self._wake_delta:
+                self._price_changed.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            now = time.monotonic()
+            due = []
+            next_refresh = now + self._refresh_after
+            for pair in self._pairs:
+                cached = _PRICE_CACHE.get(pair)
+                if cached is None or cached[0] + self._refresh_after <= now:
+                    due.append(pair)
+                else:
+                    next_refresh = min(next_refresh, cached[0] + self._refresh_after)
+            if due:
+                # Failed refreshes are retried on the same schedule rather
+                # than in a tight loop.
+                list(self._executor.map(self._refresh, due))
+            self._stop.wait(max(next_refresh - time.monotonic(), 0.0))
+
+
+@lru_cache(maxsize=32)
+def _leg_order_prototype(symbol, side, order_type, user_provided_id, strict_validate):
+    """Return a validated order for the leg, built once per leg shape."""
+    from nonkyc_client.models import OrderRequest
+
+    return OrderRequest(
+        symbol=symbol,
+        side=side,
+        order_type=order_type,
+        quantity="1",
+        user_provided_id=user_provided_id,
+        strict_validate=strict_validate,
+    )
+
+
+def _build_leg_order(settings, symbol, side, order_type, quantity):
+    # Only the quantity changes between cycles: copy the leg's prototype
+    # instead of re-running model validation on every field for every order.
+    if quantity <= 0:
+        raise ValueError(f"Invalid amount: {quantity}")
+    prototype = _leg_order_prototype(
+        symbol, side, order_type, settings.user_provided_id, settings.strict_validate
+    )
+    return prototype.model_copy(update={"quantity": str(quantity)})
+
+
+def _fill_avg_price(payload):
+    """Return the average fill price reported in an order payload, if any."""
+    for key in FILL_PRICE_KEYS:
+        price = _coerce_price_value(payload.get(key))
+        if price:
+            return price
+    return None
+
+
+def _wait_for_fill(
+    client, order_id, quantity, timeout, initial_delay, max_delay, placed=None
+):
+    """Poll an order with exponential backoff until it fills.
+
+    Returns ``(filled_quantity, avg_price)``: the quantity falls back to
+    ``quantity`` and the price to None when the exchange omits them. Returns
+    None if the order was cancelled unfilled or is still open at ``timeout``;
+    an order still open is cancelled so a late fill cannot leave a position
+    the aborted cycle no longer tracks.
+    ``placed`` is the ``place_order`` response: market orders often come back
+    already filled, in which case no status request is made at all.
+    """
+    if placed is not None:
+        normalized = (placed.status or "").lower()
+        if normalized in FILLED_ORDER_STATUSES:
+            payload = placed.raw_payload
+            filled = _coerce_price_value(payload.get("filled"))
+            return (
+                filled if filled is not None else quantity,
+                _fill_avg_price(payload),
+            )
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    while True:
+        status = client.get_order_status(order_id)
+        normalized = (status.status or "").lower()
+        filled = _coerce_price_value(status.filled_quantity)
+        if normalized in FILLED_ORDER_STATUSES:
+            return (
+                filled if filled is not None else quantity,
+                _fill_avg_price(status.raw_payload),
+            )
+        if normalized in CLOSED_ORDER_STATUSES:
+            if not filled:
+                return None
+            return filled, _fill_avg_price(status.raw_payload)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            _cancel_timed_out_order(client, order_id, filled)
+            return None
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+
+
+def _cancel_timed_out_order(client, order_id, filled):
+    """Cancel a leg order still open at its fill timeout.
+
+    Anything that already filled, or that fills because the cancel failed, is
+    left outside the cycle, so both cases are logged as errors.
+    """
+    try:
+        result = client.cancel_order(order_id)
+    except Exception as exc:
+        logger.error(
+            "  Failed to cancel timed-out order %s; it may still fill: %s",
+            order_id,
+            exc,
+        )
+        return
+    if not result.success:
+        logger.error(
+            "  Timed-out order %s was not cancelled; it may still fill: %s",
+            order_id,
+            result.raw_payload,
+        )
+    elif filled:
+        logger.error(
+            "  Cancelled timed-out order %s after a partial fill of %s",
+            order_id,
+            filled,
+        )
+
 
+def _execute_legs_in_sequence(
+    client, config, settings, legs, prices, min_quantities, order_type
+):
+    """Place the legs one at a time, sizing each from the previous fill.
 
-def execute_arbitrage(client, config, prices, start_amount, mode="live"):
+    Returns the final amount received, or None if a leg did not fill.
+    """
+    fee_factor = settings.fee_factor
+    round_order_quantity = settings.round_order_quantity
+    timeout = float(config.get("fill_timeout_sec", 5.0))
+    initial_delay = float(config.get("fill_poll_initial_sec", 0.01))
+    max_delay = float(config.get("fill_poll_max_sec", 0.5))
+
+    # Orders for every leg are built from the planned quantities before the
+    # first one is sent; a later leg is only rebuilt when its fill-based size
+    # differs, so nothing but place_order sits between a fill and the next leg.
+    orders = [
+        _build_leg_order(settings, symbol, side, order_type, quantity)
+        for symbol, side, quantity, _, _ in legs
+    ]
+    amount_out = None
+    for step, (leg, order) in enumerate(zip(legs, orders), start=1):
+        symbol, side, quantity, base, quote = leg
+        if amount_out is not None:
+            resized = round_order_quantity(max(amount_out, min_quantities[symbol]))
+            if resized != quantity:
+                quantity = resized
+                order = _build_leg_order(settings, symbol, side, order_type, quantity)
+        logger.info("\nStep %d: %s %s %s on %s", step, side, quantity, base, symbol)
+        response = client.place_order(order)
+        logger.info(
+            "  Order ID: %s, Status: %s", response.order_id, response.status
+        )
+        fill = _wait_for_fill(
+            client,
+            response.order_id,
+            quantity,
+            timeout,
+            initial_delay,
+            max_delay,
+            placed=response,
+        )
+        if fill is None:
+            logger.error(
+                "  Order %s did not fill within %ss; stopping cycle",
+                response.order_id,
+                timeout,
+            )
+            return None
+        filled, avg_price = fill
+        if side == "buy":
+            amount_out = filled * fee_factor
+            logger.info("  Received: ~%s %s", amount_out, base)
+        else:
+            # Size the next leg from the price the exchange actually filled
+            # at; the pre-trade quote is only used when it is not reported.
+            amount_out = filled * (avg_price or prices[symbol]) * fee_factor
+            logger.info("  Received: ~%s %s", amount_out, quote)
+    return amount_out
+
+
+def execute_arbitrage(
+    client,
+    config,
+    prices,
+    start_amount,
+    mode="live",
+    min_quantities=None,
+    settings=None,
+):
     """Execute the arbitrage cycle.
 
+    All three legs are sized and checked against the minimum notional before
+    any order is sent, so a cycle is never abandoned after the first leg.
+
     Args:
         client: REST client
         config: Configuration dictionary
         prices: Price dictionary
         start_amount: Starting USDT amount for the cycle
         mode: Execution mode (monitor, dry-run, or live)
+        min_quantities: Minimum order quantity per pair for these prices, as
+            already computed by the caller; computed here when omitted.
+        settings: Cycle settings built from ``config`` at startup; built
+            here when omitted.
 
     Returns:
         Decimal: Final USDT amount if successful, None if failed
     """
-    from nonkyc_client.models import OrderRequest
-    from utils.notional import resolve_quantity_rounding
-
     if mode == "monitor":
         logger.info("MONITOR MODE: Would execute cycle but skipping")
         return None
 
-    user_provided_id = config.get("userProvidedId") or config.get("user_provided_id")
-    strict_validate = (
-        config["strictValidate"]
-        if "strictValidate" in config
-        else config.get("strict_validate")
-    )
-    fee_rate = _resolve_fee_rate(config)
-    step_size, precision = resolve_quantity_rounding(config)
-    min_quantities = _min_quantities_for_cycle(
-        config,
-        prices,
-        step_size,
-        precision,
-    )
-    min_eth = max(min_quantities[config["pair_ab"]], min_quantities[config["pair_bc"]])
-    min_start_usdt = min_eth * prices[config["pair_ab"]]
+    if settings is None:
+        settings = _build_cycle_settings(config)
+    fee_factor = settings.fee_factor
+    min_notional = settings.min_notional
+    if min_quantities is None:
+        min_quantities = _min_quantities_for_cycle(settings, prices)
+    pair_ab = settings.pair_ab
+    pair_bc = settings.pair_bc
+    pair_ac = settings.pair_ac
+    min_eth = max(min_quantities[pair_ab], min_quantities[pair_bc])
+    min_start_usdt = min_eth * prices[pair_ab]
     start_amount = max(start_amount, min_start_usdt)
 
     logger.info("\n🔄 EXECUTING ARBITRAGE CYCLE")
-    logger.info(f"Starting amount: {start_amount} {config['asset_a']}")
+    logger.info("Starting amount: %s %s", start_amount, config["asset_a"])
 
     try:
         order_type = config.get("order_type", "market")
-        # Step 1: Buy ETH with USDT
-        logger.info(f"\nStep 1: Buying {config['asset_b']} with {config['asset_a']}...")
-        eth_amount = start_amount / prices[config["pair_ab"]]
-        eth_amount = max(eth_amount, min_eth)
-        if _should_skip_notional(
-            config,
-            config["pair_ab"],
-            "buy",
-            eth_amount,
-            prices[config["pair_ab"]],
-            order_type,
-        ):
-            return None
-
-        if mode == "dry-run":
-            logger.info(f"DRY RUN: Would buy {eth_amount} {config['asset_b']}")
-        else:
-            order1 = OrderRequest(
-                symbol=config["pair_ab"],
-                side="buy",
-                order_type=order_type,
-                quantity=str(eth_amount),
-                user_provided_id=user_provided_id,
-                strict_validate=strict_validate,
-            )
-            response1 = client.place_order(order1)
-            logger.info(f"  Order ID: {response1.order_id}, Status: {response1.status}")
-
-        # TODO: Wait for order to fill and get actual ETH amount received
-        # For now, estimate based on price
-        eth_amount = eth_amount * (Decimal("1") - fee_rate)
-        logger.info(f"  Received: ~{eth_amount} {config['asset_b']}")
-
-        if mode != "dry-run":
-            time.sleep(2)  # Brief pause between orders
 
+        # Size every leg from the quoted prices up front.
+        # Step 1: Buy ETH with USDT
+        round_order_quantity = settings.round_order_quantity
+        buy_eth = round_order_quantity(max(start_amount / prices[pair_ab], min_eth))
         # Step 2: Sell ETH for BTC
-        logger.info(f"\nStep 2: Selling {config['asset_b']} for {config['asset_c']}...")
-        eth_amount = max(eth_amount, min_quantities[config["pair_bc"]])
-        if _should_skip_notional(
-            config,
-            config["pair_bc"],
-            "sell",
-            eth_amount,
-            prices[config["pair_bc"]],
-            order_type,
-        ):
-            return None
-
-        if mode == "dry-run":
-            logger.info(f"DRY RUN: Would sell {eth_amount} {config['asset_b']}")
-        else:
-            order2 = OrderRequest(
-                symbol=config["pair_bc"],
-                side="sell",
-                order_type=order_type,
-                quantity=str(eth_amount),
-                user_provided_id=user_provided_id,
-                strict_validate=strict_validate,
-            )
-            response2 = client.place_order(order2)
-            logger.info(f"  Order ID: {response2.order_id}, Status: {response2.status}")
-
-        btc_amount = eth_amount * prices[config["pair_bc"]]
-        btc_amount = btc_amount * (Decimal("1") - fee_rate)
-        logger.info(f"  Received: ~{btc_amount} {config['asset_c']}")
-
-        if mode != "dry-run":
-            time.sleep(2)
-
+        sell_eth = round_order_quantity(
+            max(buy_eth * fee_factor, min_quantities[pair_bc])
+        )
         # Step 3: Sell BTC for USDT
-        logger.info(f"\nStep 3: Selling {config['asset_c']} for {config['asset_a']}...")
-        btc_amount = max(btc_amount, min_quantities[config["pair_ac"]])
-        if _should_skip_notional(
-            config,
-            config["pair_ac"],
-            "sell",
-            btc_amount,
-            prices[config["pair_ac"]],
-            order_type,
-        ):
-            return None
+        btc_amount = sell_eth * prices[pair_bc] * fee_factor
+        sell_btc = round_order_quantity(max(btc_amount, min_quantities[pair_ac]))
+        final_usdt = sell_btc * prices[pair_ac] * fee_factor
+
+        legs = (
+            (pair_ab, "buy", buy_eth, config["asset_b"], config["asset_a"]),
+            (pair_bc, "sell", sell_eth, config["asset_b"], config["asset_c"]),
+            (pair_ac, "sell", sell_btc, config["asset_c"], config["asset_a"]),
+        )
+        for symbol, side, quantity, _, _ in legs:
+            if _should_skip_notional(
+                min_notional,
+                fee_factor,
+                symbol,
+                side,
+                quantity,
+                prices[symbol],
+                order_type,
+                min_quantities[symbol],
+            ):
+                return None
 
+        received = (buy_eth * fee_factor, btc_amount, final_usdt)
         if mode == "dry-run":
-            logger.info(f"DRY RUN: Would sell {btc_amount} {config['asset_c']}")
+            for step, (leg, amount_out) in enumerate(zip(legs, received), start=1):
+                symbol, side, quantity, base, quote = leg
+                received_asset = base if side == "buy" else quote
+                logger.info(
+                    "\nStep %d: DRY RUN: Would %s %s %s", step, side, quantity, base
+                )
+                logger.info("  Received: ~%s %s", amount_out, received_asset)
         else:
-            order3 = OrderRequest(
-                symbol=config["pair_ac"],
-                side="sell",
-                order_type=order_type,
-                quantity=str(btc_amount),
-                user_provided_id=user_provided_id,
-                strict_validate=strict_validate,
+            # Each leg waits for the previous one to fill (instead of a fixed
+            # pause) and spends what was actually received.
+            final_usdt = _execute_legs_in_sequence(
+                client, config, settings, legs, prices, min_quantities, order_type
             )
-            response3 = client.place_order(order3)
-            logger.info(f"  Order ID: {response3.order_id}, Status: {response3.status}")
-
-        final_usdt = btc_amount * prices[config["pair_ac"]]
-        final_usdt = final_usdt * (Decimal("1") - fee_rate)
-        logger.info(f"  Received: ~{final_usdt} {config['asset_a']}")
+            if final_usdt is None:
+                return None
 
         profit = final_usdt - start_amount
         profit_pct = (profit / start_amount) * 100
 
         logger.info("\n✅ CYCLE COMPLETE!")
-        logger.info(f"Started with: {start_amount} {config['asset_a']}")
-        logger.info(f"Ended with: {final_usdt} {config['asset_a']}")
-        logger.info(f"Profit: {profit} {config['asset_a']} ({profit_pct:.2f}%)")
+        asset_a = config["asset_a"]
+        logger.info("Started with: %s %s", start_amount, asset_a)
+        logger.info("Ended with: %s %s", final_usdt, asset_a)
+        logger.info("Profit: %s %s (%.2f%%)", profit, asset_a, profit_pct)
 
         return final_usdt
 
     except Exception as e:
-        logger.error(f"\n❌ ERROR during execution: {e}", exc_info=True)
+        logger.error("\n❌ ERROR during execution: %s", e, exc_info=True)
         return None
 
 
+def _float_cycle_ratio(settings, prices):
+    """Return the fee-adjusted cycle return ratio using float arithmetic.
+
+    Same product as the Decimal check, p_bc * p_ac * (1 - fee)^3 / p_ab,
+    scored by the settings' triangle scanner; an unpriced leg scores 0.0.
+    """
+    return settings.triangle_scanner.scan(prices, settings.fee_rate)[0]
+
+
+def _log_profit_analysis(config, settings, start_amount, amount, profit, profit_pct):
+    # Runs every cycle: bail out before touching any arguments when INFO is
+    # off, and leave formatting of the rest to the handler.
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    asset_a = config["asset_a"]
+    logger.info("\n💰 Profit Analysis:")
+    logger.info("  Start: %s %s", start_amount, asset_a)
+    logger.info("  End: %.8f %s", amount, asset_a)
+    logger.info("  Profit: %.8f %s (%.4f%%)", profit, asset_a, profit_pct)
+    logger.info("  Threshold: %s%%", settings.min_profit_pct)
+
+
 def evaluate_profitability_and_execute(
-    client, config, prices, current_balance, mode="live"
+    client, config, prices, current_balance, mode="live", settings=None
 ):
     """Evaluate profit and execute arbitrage when thresholds are met.
 
@@ -449,84 +1027,128 @@ def evaluate_profitability_and_execute(
         prices: Price dictionary
         current_balance: Current USDT balance to trade with
         mode: Execution mode (monitor, dry-run, or live)
+        settings: Cycle settings built from ``config`` at startup; built
+            here when omitted.
 
     Returns:
         Decimal: New balance if successful profitable trade, None otherwise
     """
-    from utils.notional import resolve_quantity_rounding
-
-    # Calculate conversion rates
-    rates = calculate_conversion_rates(config, prices)
-
-    # Calculate expected profit
+    if settings is None:
+        settings = _build_cycle_settings(config)
     start_amount = current_balance
-    fee_rate = _resolve_fee_rate(config)
-    step_size, precision = resolve_quantity_rounding(config)
-
-    # Simulate the cycle
-    amount = start_amount
-    amount = amount * rates["step1"]  # USDT → ETH
-    amount = amount * (Decimal("1") - fee_rate)  # Fee
-
-    amount = amount * rates["step2"]  # ETH → BTC
-    amount = amount * (Decimal("1") - fee_rate)  # Fee
-
-    amount = amount * rates["step3"]  # BTC → USDT
-    amount = amount * (Decimal("1") - fee_rate)  # Fee
+    min_profit = settings.min_profit
+
+    # Float pre-check: the cycle return collapses to one product of rates,
+    # so clear non-opportunities are rejected without any Decimal math.
+    # Decimal stays authoritative for anything that could be traded.
+    gross_ratio = _float_cycle_ratio(settings, prices)
+    if gross_ratio < settings.min_ratio_float:
+        amount = float(start_amount) * gross_ratio
+        profit_pct = (gross_ratio - 1.0) * 100
+        _log_profit_analysis(
+            config,
+            settings,
+            start_amount,
+            amount,
+            amount - float(start_amount),
+            profit_pct,
+        )
+        logger.info("\n⏸️  No opportunity - profit %.4f%% below threshold", profit_pct)
+        return None
 
+    # Simulate the cycle: USDT → ETH → BTC → USDT with the fee on each leg
+    # collapses to one return ratio, p_bc * p_ac * (1 - fee)^3 / p_ab. The
+    # profit ratio follows from it directly; amounts are only for the log.
+    return_ratio = (
+        prices[settings.pair_bc]
+        * prices[settings.pair_ac]
+        * settings.fee_factor_cubed
+        / prices[settings.pair_ab]
+    )
+    profit_ratio = return_ratio - 1
+    amount = start_amount * return_ratio
     profit = amount - start_amount
-    profit_ratio = profit / start_amount
     profit_pct = profit_ratio * 100
 
-    logger.info("\n💰 Profit Analysis:")
-    logger.info(f"  Start: {start_amount} {config['asset_a']}")
-    logger.info(f"  End: {amount:.8f} {config['asset_a']}")
-    logger.info(f"  Profit: {profit:.8f} {config['asset_a']} ({profit_pct:.4f}%)")
-    logger.info(f"  Threshold: {float(config['min_profitability'])*100}%")
+    _log_profit_analysis(config, settings, start_amount, amount, profit, profit_pct)
 
     # Check if profitable
-    min_profit = Decimal(str(config["min_profitability"]))
-
     if profit_ratio >= min_profit:
-        logger.info(f"\n🚀 OPPORTUNITY FOUND! Profit: {profit_pct:.4f}%")
-        min_quantities = _min_quantities_for_cycle(
-            config,
-            prices,
-            step_size,
-            precision,
-        )
+        logger.info("\n🚀 OPPORTUNITY FOUND! Profit: %.4f%%", profit_pct)
+        min_quantities = _min_quantities_for_cycle(settings, prices)
         (
             adjusted_start,
             adjusted_final,
             adjusted_profit_ratio,
         ) = _simulate_fee_adjusted_cycle(
-            config,
+            settings,
             prices,
             start_amount,
             min_quantities,
         )
         adjusted_profit_pct = adjusted_profit_ratio * 100
+        asset_a = config["asset_a"]
         logger.info("\n🔎 Fee-Adjusted Cycle Check:")
-        logger.info(f"  Start (adjusted): {adjusted_start} {config['asset_a']}")
-        logger.info(f"  End (adjusted): {adjusted_final:.8f} {config['asset_a']}")
+        logger.info("  Start (adjusted): %s %s", adjusted_start, asset_a)
+        logger.info("  End (adjusted): %.8f %s", adjusted_final, asset_a)
         logger.info(
-            "  Profit (adjusted): "
-            f"{adjusted_final - adjusted_start:.8f} {config['asset_a']} "
-            f"({adjusted_profit_pct:.4f}%)"
+            "  Profit (adjusted): %.8f %s (%.4f%%)",
+            adjusted_final - adjusted_start,
+            asset_a,
+            adjusted_profit_pct,
         )
 
         if adjusted_profit_ratio < min_profit:
             logger.info("\n⏸️  Fee-adjusted profit below threshold. Skipping execution.")
-            logger.info(f"  Threshold: {float(config['min_profitability'])*100}%")
+            logger.info("  Threshold: %s%%", settings.min_profit_pct)
             return None
 
-        final_balance = execute_arbitrage(client, config, prices, start_amount, mode)
+        final_balance = execute_arbitrage(
+            client, config, prices, start_amount, mode, min_quantities, settings
+        )
         return final_balance
 
-    logger.info(f"\n⏸️  No opportunity - profit {profit_pct:.4f}% below threshold")
+    logger.info("\n⏸️  No opportunity - profit %.4f%% below threshold", profit_pct)
     return None
 
 
+def _sleep_until(deadline: float, price_feed=None) -> None:
+    """Sleep until the ``time.monotonic()`` deadline; return at once if passed.
+
+    With a ``price_feed`` (a streaming feed or the price prefetcher) the wait
+    also ends as soon as a price changes, so the next cycle evaluates the
+    update straight away.
+    """
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        return
+    if price_feed is not None:
+        price_feed.wait_for_update(remaining)
+    else:
+        time.sleep(remaining)
+
+
+def _warm_up(client, pairs, executor):
+    """Open connections before the first cycle so it runs at steady latency.
+
+    One price request per pair, through the same executor the loop uses,
+    pays DNS, TCP and TLS setup for each worker's pooled connection up front.
+    Failures are only logged; the loop handles missing prices itself.
+    """
+    started = time.perf_counter()
+    try:
+        prices = fetch_prices(client, pairs, executor)
+    except Exception as exc:
+        logger.debug("Warm-up request failed: %s", exc)
+        prices = {}
+    logger.info(
+        "  Warm-up: %d/%d prices in %.0f ms",
+        len(prices),
+        len(pairs),
+        (time.perf_counter() - started) * 1000,
+    )
+
+
 def _save_state(state_path: Path, payload: dict[str, Any]) -> None:
     state_path.write_text(
         json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8"
@@ -534,7 +1156,16 @@ def _save_state(state_path: Path, payload: dict[str, Any]) -> None:
 
 
 def run_arbitrage_bot(config: dict[str, Any]) -> None:
-    """Main bot loop."""
+    """Main bot loop, run under a reduced-precision Decimal context."""
+    with localcontext() as decimal_context:
+        decimal_context.prec = int(
+            config.get("decimal_precision", DEFAULT_DECIMAL_PRECISION)
+        )
+        _run_arbitrage_loop(config)
+
+
+def _run_arbitrage_loop(config: dict[str, Any]) -> None:
+    from engine.price_feed import build_price_feed
     from engine.rest_client_factory import build_exchange_client, build_rest_client
     from utils.profit_store import build_profit_store, execute_exit_liquidation
 
@@ -551,14 +1182,28 @@ def run_arbitrage_bot(config: dict[str, Any]) -> None:
     )
     logger.info(f"  Trade amount: {config['trade_amount_a']} {config['asset_a']}")
     logger.info(f"  Min profitability: {float(config['min_profitability'])*100}%")
-    fee_rate = _resolve_fee_rate(config)
+    # Config is read-only while running: parse the per-cycle settings once.
+    settings = _build_cycle_settings(config)
+    fee_rate = settings.fee_rate
     logger.info(f"  Fee rate: {float(fee_rate)*100}%")
-    poll_interval = config.get("poll_interval_seconds", config.get("refresh_time", 2))
+    poll_interval = float(
+        config.get(
+            "poll_interval_seconds", config.get("refresh_time", DEFAULT_POLL_INTERVAL)
+        )
+    )
     logger.info(f"  Poll interval: {poll_interval}s")
+    price_cache_ttl = float(config.get("price_cache_ttl", 1.0))
+    batch_tickers = bool(config.get("batch_tickers", False))
+    price_prefetch = bool(config.get("price_prefetch", False)) and price_cache_ttl > 0
+    price_change_delta = Decimal(str(config.get("price_change_delta", "0")))
+    # Extra markets for an any-length cycle scan (Bellman-Ford) and a scan of
+    # every triangle from asset_a, reported alongside the configured
+    # triangle, which stays the only executed cycle.
+    scan_pairs = tuple(config.get("scan_pairs") or ())
 
     # Setup client
     client = build_rest_client(config)
-    exchange_client = build_exchange_client(config)
+    exchange_client = build_exchange_client(config, rest_client=client)
     profit_store = build_profit_store(config, exchange_client, mode)
 
     logger.info("\n✅ Connected to NonKYC API")
@@ -574,37 +1219,131 @@ def run_arbitrage_bot(config: dict[str, Any]) -> None:
     cycle_count = 0
     successful_profit_cycles = 0
     opportunities_found = 0
+    rejected_price_key = None
+    price_failures = 0
+
+    # Config is read-only while running: resolve what the loop reads once.
+    asset_a = config["asset_a"]
+    pair_ac = config["pair_ac"]
+    pairs = (config["pair_ab"], config["pair_bc"], pair_ac)
+    # Price requests are independent, so fetch them concurrently: a cycle then
+    # waits for the slowest round-trip instead of the sum of all three.
+    price_executor = ThreadPoolExecutor(
+        max_workers=len(pairs), thread_name_prefix="arb-price"
+    )
+    # Optional push feed: orderbook updates from the WebSocket replace polling,
+    # with REST as the fallback until every pair has a streamed price.
+    price_feed = build_price_feed(config, pairs)
+    price_feed_max_age = float(config.get("price_feed_max_age_sec", 5.0))
+    _warm_up(client, pairs, price_executor)
+    prefetcher = None
+    if price_prefetch:
+        prefetcher = _PricePrefetcher(
+            client,
+            pairs,
+            price_cache_ttl,
+            float(config.get("price_prefetch_lead_sec", price_cache_ttl / 2)),
+            float(config.get("price_wake_delta", 0.0)),
+        )
+        prefetcher.start()
+    # Between cycles, wait on whichever source pushes price changes.
+    wake_source = price_feed if price_feed is not None else prefetcher
+    cycle_detector = None
+    if scan_pairs:
+        from strategies.triangular_arb import (
+            NegativeCycleDetector,
+            TriangleScanner,
+            find_triangles,
+        )
+
+        scan_pairs = tuple(pair for pair in scan_pairs if pair not in pairs)
+        cycle_detector = NegativeCycleDetector(pairs + scan_pairs, fee_rate)
+        last_scanned_cycle = None
+        # Triangles are enumerated once; each cycle only rescores them.
+        triangle_scanner = TriangleScanner(find_triangles(pairs + scan_pairs, asset_a))
+        last_best_triangle = None
 
     try:
         while True:
+            # Cycles start on a fixed cadence: time spent fetching and trading
+            # is taken out of the wait rather than added to it.
+            next_cycle_at = time.monotonic() + poll_interval
             cycle_count += 1
-            logger.info(f"\n{'=' * 80}")
-            logger.info(
-                f"Cycle #{cycle_count} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-            )
-            logger.info(f"{'=' * 80}")
-            logger.debug(f"💼 Current balance: {current_balance} {config['asset_a']}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("\n%s", CYCLE_SEPARATOR)
+                logger.info(
+                    "Cycle #%d - %s",
+                    cycle_count,
+                    time.strftime(CYCLE_TIME_FORMAT),
+                )
+                logger.info(CYCLE_SEPARATOR)
+            logger.debug("💼 Current balance: %s %s", current_balance, asset_a)
 
-            # Fetch current prices
+            # Fetch current prices (all pairs in parallel)
             logger.debug("\n📊 Fetching prices...")
-            prices = {}
-
-            for pair in [config["pair_ab"], config["pair_bc"], config["pair_ac"]]:
-                price = get_price(client, pair)
-                if price is None:
-                    logger.warning(
-                        f"⚠️  Skipping cycle - failed to fetch price for {pair}"
-                    )
-                    time.sleep(poll_interval)
-                    continue
-                prices[pair] = price
-
-            if len(prices) != 3:
-                continue
-
-            new_balance = evaluate_profitability_and_execute(
-                client, config, prices, current_balance, mode
+            prices = _current_prices(
+                client,
+                pairs,
+                price_feed,
+                price_feed_max_age,
+                price_executor,
+                price_cache_ttl,
+                batch_tickers,
             )
+            if len(prices) != len(pairs):
+                price_failures += 1
+                backoff = _price_failure_backoff(price_failures)
+                missing = ", ".join(pair for pair in pairs if pair not in prices)
+                logger.warning(
+                    "⚠️  Skipping cycle - failed to fetch price for %s; "
+                    "retrying in %.1fs",
+                    missing,
+                    backoff,
+                )
+                _sleep_until(max(next_cycle_at, time.monotonic() + backoff))
+                continue
+            price_failures = 0
+
+            if cycle_detector is not None:
+                scan_prices = dict(prices)
+                scan_prices.update(
+                    fetch_prices(
+                        client,
+                        scan_pairs,
+                        price_executor,
+                        price_cache_ttl,
+                        batch_tickers,
+                    )
+                )
+                scanned_cycle = cycle_detector.detect(scan_prices)
+                if scanned_cycle is not None and scanned_cycle != last_scanned_cycle:
+                    logger.info(
+                        "🔍 Profitable cycle across scanned markets: %s",
+                        _describe_cycle(scanned_cycle),
+                    )
+                last_scanned_cycle = scanned_cycle
+                best = triangle_scanner.best(scan_prices, fee_rate)
+                best_triangle = best[1] if best is not None and best[0] > 1 else None
+                if best_triangle is not None and best_triangle != last_best_triangle:
+                    logger.info(
+                        "🔺 Best triangle across scanned markets: %s (%.4f%%)",
+                        _describe_cycle(best_triangle),
+                        (best[0] - 1) * 100,
+                    )
+                last_best_triangle = best_triangle
+
+            # A rejected set of prices stays rejected: skip straight past the
+            # evaluation (and its logging) until one of them moves by more
+            # than price_change_delta from the prices that were rejected.
+            price_key = tuple(prices[pair] for pair in pairs)
+            if not _prices_moved(price_key, rejected_price_key, price_change_delta):
+                logger.debug("Prices unchanged since last cycle; not re-evaluating")
+                new_balance = None
+            else:
+                new_balance = evaluate_profitability_and_execute(
+                    client, config, prices, current_balance, mode, settings
+                )
+                rejected_price_key = price_key if new_balance is None else None
 
             # Update balance if the cycle was successful and profitable
             if new_balance is not None:
@@ -622,28 +1361,29 @@ def run_arbitrage_bot(config: dict[str, Any]) -> None:
                         (current_balance - initial_balance) / initial_balance
                     ) * 100
                     logger.info("\n🎉 PROFIT REINVESTED!")
+                    logger.info("  Previous balance: %s %s", previous_balance, asset_a)
+                    logger.info("  New balance: %s %s", current_balance, asset_a)
                     logger.info(
-                        f"  Previous balance: {previous_balance} {config['asset_a']}"
-                    )
-                    logger.info(f"  New balance: {current_balance} {config['asset_a']}")
-                    logger.info(
-                        f"  Cycle profit: {profit} {config['asset_a']} ({profit_pct:.2f}%)"
+                        "  Cycle profit: %s %s (%.2f%%)", profit, asset_a, profit_pct
                     )
                     logger.info(
-                        f"  Total profit: {total_profit} {config['asset_a']} ({total_profit_pct:.2f}%)"
+                        "  Total profit: %s %s (%.2f%%)",
+                        total_profit,
+                        asset_a,
+                        total_profit_pct,
                     )
                     logger.info(
-                        f"  Successful profit cycles: {successful_profit_cycles}"
+                        "  Successful profit cycles: %d", successful_profit_cycles
                     )
                     if profit_store is not None:
-                        profit_store.record_profit(profit, config["asset_a"])
+                        profit_store.record_profit(profit, asset_a)
             if profit_store is not None:
                 profit_store.process()
                 if profit_store.should_trigger_exit():
                     handled = execute_exit_liquidation(
                         exchange_client,
                         profit_store,
-                        config["pair_ac"],
+                        pair_ac,
                         mode,
                     )
                     if handled:
@@ -668,10 +1408,17 @@ def run_arbitrage_bot(config: dict[str, Any]) -> None:
                     f"Stats: {cycle_count} cycles evaluated, "
                     f"{opportunities_found} opportunities found"
                 )
+                logger.debug(
+                    "Price cache: %d hits, %d misses",
+                    _PRICE_CACHE_STATS["hits"],
+                    _PRICE_CACHE_STATS["misses"],
+                )
 
             # Wait before next cycle
-            logger.debug(f"\n⏰ Waiting {poll_interval} seconds...")
-            time.sleep(poll_interval)
+            logger.debug(
+                "\n⏰ Waiting until next cycle (%ss interval)...", poll_interval
+            )
+            _sleep_until(next_cycle_at, wake_source)
 
     except KeyboardInterrupt:
         logger.info("\n\n🛑 Bot stopped by user")
@@ -701,6 +1448,13 @@ def run_arbitrage_bot(config: dict[str, Any]) -> None:
         )
     except Exception as e:
         logger.error(f"\n❌ Fatal error: {e}", exc_info=True)
+    finally:
+        if prefetcher is not None:
+            prefetcher.stop()
+        if price_feed is not None:
+            price_feed.stop()
+        price_executor.shutdown(wait=False)
+        client.close()
 
 
 def main() -> None:
@@ -731,7 +1485,7 @@ def main() -> None:
     args = parser.parse_args()
 
     # Setup logging
-    setup_logging(level=args.log_level)
+    setup_logging(level=args.log_level, queued=True)
 
     # Load config
     config = load_config(args.config)
@@ -23,15 +23,17 @@ import argparse
 import sys
 from pathlib import Path
 
-import yaml
-
 REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT / "src"))
+SRC_ROOT = str(REPO_ROOT / "src")
+if SRC_ROOT not in sys.path:
+    sys.path.insert(0, SRC_ROOT)
 
 
 def load_config(config_file: str) -> dict:
+    from utils.yaml_loader import safe_load
+
     with open(config_file, "r") as handle:
-        return yaml.safe_load(handle)
+        return safe_load(handle)
 
 
 def run_grid_from_file(config_file: str) -> None:
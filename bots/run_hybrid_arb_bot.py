@@ -23,18 +23,25 @@ import json
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import yaml
-
 if TYPE_CHECKING:
-    from strategies.hybrid_triangular_arb import ArbitrageCycle, TradeLeg, TradeSide
+    from strategies.hybrid_triangular_arb import (
+        ArbitrageCycle,
+        OrderBookQuote,
+        TradeLeg,
+        TradeSide,
+    )
+    from utils.amm_pricing import PoolReserves
 
 # Add src to path
 REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT / "src"))
+SRC_ROOT = str(REPO_ROOT / "src")
+if SRC_ROOT not in sys.path:
+    sys.path.insert(0, SRC_ROOT)
 
 logger = logging.getLogger(__name__)
 
@@ -49,9 +56,15 @@ class HybridArbBot:
 
         self.config = config
         self.rest_client = self._build_rest_client()
-        self.exchange_client = build_exchange_client(config)
+        # Wrap the same REST client so both share one connection pool.
+        self.exchange_client = build_exchange_client(
+            config, rest_client=self.rest_client
+        )
         self.mode = config.get("mode", "monitor")  # monitor, dry-run, or live
         self.min_profit_pct = Decimal(str(config.get("min_profit_pct", "0.5")))
+        # Float copy for the pre-check, less a margin so that cycles right at
+        # the threshold are still decided by the Decimal evaluation.
+        self.min_profit_pct_float = float(self.min_profit_pct) - 1e-7
         self.trade_amount = Decimal(str(config.get("trade_amount", "100")))
         self.min_notional_quote = Decimal(
             str(config.get("min_notional_quote", "1.0"))
@@ -65,11 +78,26 @@ class HybridArbBot:
                 )
             )
         )
+        # Limit price multipliers for pseudo-market orders, fixed for the run.
+        self._aggressive_buy_multiplier = (
+            Decimal("1") + self.orderbook_aggressive_limit_pct
+        )
+        self._aggressive_sell_multiplier = (
+            Decimal("1") - self.orderbook_aggressive_limit_pct
+        )
 
         # Market configuration
         self.orderbook_pairs = config.get("orderbook_pairs", [])
         self.pool_pair = config.get("pool_pair", "")
         self.base_currency = config.get("base_currency", "USDT")
+        # Pool tokens and the order book pair for each, in underscore format;
+        # fixed for the run, so parsed once rather than on every cycle.
+        self.pool_tokens: tuple[str, str] | None = None
+        pool_tokens = self.pool_pair.split("_")
+        if len(pool_tokens) == 2:
+            self.pool_tokens = (pool_tokens[0], pool_tokens[1])
+            self.token_a_pair = f"{pool_tokens[0]}_{self.base_currency}"
+            self.token_b_pair = f"{pool_tokens[1]}_{self.base_currency}"
         self.exit_symbol = config.get("exit_symbol")
         if not self.exit_symbol and self.orderbook_pairs:
             self.exit_symbol = self.orderbook_pairs[0]
@@ -78,11 +106,53 @@ class HybridArbBot:
         self.orderbook_fee = Decimal(str(config.get("orderbook_fee", "0.002")))
         self.pool_fee = Decimal(str(config.get("pool_fee", "0.003")))
 
+        # Optional WebSocket order books: tops are read from the stream while
+        # fresh, and a book change starts the next cycle early.
+        self.price_feed = None
+        self.price_feed_max_age = float(config.get("price_feed_max_age_sec", 5.0))
+        price_feed = config.get("price_feed", "rest")
+        if price_feed == "websocket":
+            from engine.price_feed import build_price_feed
+
+            self.price_feed = build_price_feed(config, self.orderbook_pairs)
+        elif price_feed != "rest":
+            logger.warning(
+                "price_feed=%s does not stream bid/ask; using REST order books",
+                price_feed,
+            )
+
+        # Pool reserves move far less often than the order books, so a fetched
+        # pool can be reused for a few seconds; our own swaps invalidate it.
+        # Opt-in: cached reserves also feed the swap leg's slippage checks.
+        self.pool_cache_ttl = float(config.get("pool_cache_ttl_sec", 0.0))
+        # symbol -> (time.monotonic() when fetched, parsed pool data)
+        self._pool_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+        # Market data requests are independent: fetch the order books and the
+        # pool concurrently so a cycle waits for the slowest round-trip
+        # instead of the sum of all of them. rpc_concurrency caps the requests
+        # in flight at once to stay under the exchange's rate limits.
+        fetch_workers = len(self.orderbook_pairs) + 1
+        rpc_concurrency = int(config.get("rpc_concurrency", 0))
+        if rpc_concurrency > 0:
+            fetch_workers = min(fetch_workers, rpc_concurrency)
+        self._fetch_executor = ThreadPoolExecutor(
+            max_workers=fetch_workers,
+            thread_name_prefix="hybrid-fetch",
+        )
+
+        # Market data behind the last build_cycles result; the cycles depend
+        # on nothing else that changes at runtime.
+        self._last_cycle_inputs: tuple[Any, ...] | None = None
+        self._last_cycles: list[ArbitrageCycle] = []
+
         # Statistics
         self.cycles_evaluated = 0
         self.opportunities_found = 0
         self.trades_executed = 0
         self.total_profit = Decimal("0")
+        # Cycles that stopped after some legs executed, leaving open exposure.
+        self.partial_cycles = 0
         self.profit_store = build_profit_store(config, self.exchange_client, self.mode)
         self.state_path = Path(config.get("state_path", "state/hybrid_arb_state.json"))
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
@@ -103,33 +173,47 @@ class HybridArbBot:
 
         return build_rest_client(self.config)
 
-    def fetch_orderbook_prices(self, symbol: str) -> dict[str, Decimal]:
+    def fetch_orderbook_prices(self, symbol: str) -> OrderBookQuote:
         """
         Fetch best bid/ask from order book.
 
         Returns:
-            Dictionary with 'bid' and 'ask' prices
+            OrderBookQuote with the bid and ask prices (both 0 on failure)
         """
+        from strategies.hybrid_triangular_arb import OrderBookQuote
+
         try:
+            if self.price_feed is not None:
+                top = self.price_feed.top(symbol, self.price_feed_max_age)
+                if top is not None:
+                    return OrderBookQuote(*top)
             bid, ask = self.exchange_client.get_orderbook_top(symbol)
-            return {"bid": bid, "ask": ask}
+            return OrderBookQuote(bid, ask)
         except Exception as e:
-            logger.warning(f"Failed to fetch prices for {symbol}: {e}")
-            return {"bid": Decimal("0"), "ask": Decimal("0")}
+            logger.warning("Failed to fetch prices for %s: %s", symbol, e)
+            return OrderBookQuote(Decimal("0"), Decimal("0"))
 
     def fetch_pool_data(self, symbol: str) -> dict[str, Any]:
         """
         Fetch liquidity pool data.
 
+        Successful fetches are cached for ``pool_cache_ttl_sec`` seconds.
+
         Returns:
             Dictionary with pool reserves and pricing info
         """
+        cached = self._pool_cache.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] < self.pool_cache_ttl:
+            return cached[1]
         try:
             pool_data = self.rest_client.get_liquidity_pool(symbol)
 
             # Debug logging to see what we actually got
-            logger.debug(f"Pool data type for {symbol}: {type(pool_data).__name__}")
-            logger.debug(f"Pool data content: {str(pool_data)[:200]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Pool data type for %s: %s", symbol, type(pool_data).__name__
+                )
+                logger.debug("Pool data content: %s", str(pool_data)[:200])
 
             # Ensure we got a valid dict response
             if not isinstance(pool_data, dict):
@@ -154,7 +238,9 @@ class HybridArbBot:
                 )
             except (ValueError, TypeError):
                 logger.debug(
-                    f"Invalid reserve_a value: {reserve_a_raw} ({type(reserve_a_raw).__name__})"
+                    "Invalid reserve_a value: %s (%s)",
+                    reserve_a_raw,
+                    type(reserve_a_raw).__name__,
                 )
                 reserve_a = Decimal("0")
 
@@ -166,7 +252,9 @@ class HybridArbBot:
                 )
             except (ValueError, TypeError):
                 logger.debug(
-                    f"Invalid reserve_b value: {reserve_b_raw} ({type(reserve_b_raw).__name__})"
+                    "Invalid reserve_b value: %s (%s)",
+                    reserve_b_raw,
+                    type(reserve_b_raw).__name__,
                 )
                 reserve_b = Decimal("0")
 
@@ -178,18 +266,21 @@ class HybridArbBot:
                 )
             except (ValueError, TypeError):
                 logger.debug(
-                    f"Invalid last_price value: {last_price_raw} ({type(last_price_raw).__name__})"
+                    "Invalid last_price value: %s (%s)",
+                    last_price_raw,
+                    type(last_price_raw).__name__,
                 )
                 last_price = Decimal("0")
 
             # If reserves not available, try to infer from ticker data
             if reserve_a == 0 or reserve_b == 0:
                 logger.warning(
-                    f"Pool {symbol} has no reserve data. "
-                    "Will use spot price only (no slippage calculation)."
+                    "Pool %s has no reserve data. "
+                    "Will use spot price only (no slippage calculation).",
+                    symbol,
                 )
 
-            return {
+            result = {
                 "reserve_a": reserve_a,
                 "reserve_b": reserve_b,
                 "token_a": pool_data.get("token_a", ""),
@@ -197,8 +288,10 @@ class HybridArbBot:
                 "last_price": last_price,
                 "raw": pool_data,
             }
+            self._pool_cache[symbol] = (time.monotonic(), result)
+            return result
         except Exception as e:
-            logger.warning(f"Failed to fetch pool data for {symbol}: {e}")
+            logger.warning("Failed to fetch pool data for %s: %s", symbol, e)
             return {
                 "reserve_a": Decimal("0"),
                 "reserve_b": Decimal("0"),
@@ -208,9 +301,54 @@ class HybridArbBot:
                 "raw": {},
             }
 
+    def cycle_return_bounds(
+        self,
+        orderbook_prices: dict[str, OrderBookQuote],
+        pool_data: dict[str, Any],
+    ) -> list[float] | None:
+        """
+        Float upper bounds on the return ratio of each cycle build_cycles makes.
+
+        Returns None when the market data cannot be screened (unexpected pool
+        pair format or missing order books); build_cycles reports those.
+        """
+        from strategies.hybrid_triangular_arb import cycle_return_bound
+
+        if self.pool_tokens is None:
+            return None
+        token_a_prices = orderbook_prices.get(self.token_a_pair)
+        token_b_prices = orderbook_prices.get(self.token_b_pair)
+        if token_a_prices is None or token_b_prices is None:
+            return None
+        # Token B received per token A at the pool's spot price
+        if pool_data["reserve_a"] > 0 and pool_data["reserve_b"] > 0:
+            a_to_b = float(pool_data["reserve_b"]) / float(pool_data["reserve_a"])
+        else:
+            a_to_b = float(pool_data["last_price"])
+        if a_to_b <= 0:
+            return [0.0, 0.0]
+        orderbook_fee = float(self.orderbook_fee)
+        pool_fee = float(self.pool_fee)
+        return [
+            cycle_return_bound(
+                float(token_a_prices.ask),
+                a_to_b,
+                float(token_b_prices.bid),
+                orderbook_fee,
+                pool_fee,
+            ),
+            cycle_return_bound(
+                float(token_b_prices.ask),
+                1.0 / a_to_b,
+                float(token_a_prices.bid),
+                orderbook_fee,
+                pool_fee,
+            ),
+        ]
+
     def build_cycles(
         self,
-        orderbook_prices: dict[str, dict[str, Decimal]],
+        orderbook_prices: dict[str, OrderBookQuote],
         pool_data: dict[str, Any],
     ) -> list[ArbitrageCycle]:
         """
@@ -222,25 +360,29 @@ class HybridArbBot:
         - Cycle 3: BTC → COSA (buy) → PIRATE (pool swap) → BTC (sell)
         - Cycle 4: BTC → PIRATE (buy) → COSA (pool swap) → BTC (sell)
         """
-        from strategies.hybrid_triangular_arb import (
-            TradeSide,
-            create_orderbook_leg,
-            create_pool_swap_leg,
-            evaluate_cycle,
+        from strategies.hybrid_triangular_arb import TradeSide
+        from utils.amm_pricing import PoolReserves
+
+        # Quiet markets often repeat the previous poll exactly; reuse its
+        # cycles instead of redoing the Decimal math.
+        inputs = (
+            tuple(orderbook_prices.items()),
+            pool_data["reserve_a"],
+            pool_data["reserve_b"],
+            pool_data.get("last_price"),
         )
-        from utils.amm_pricing import PoolReserves, get_swap_quote
+        if inputs == self._last_cycle_inputs:
+            return list(self._last_cycles)
 
         cycles = []
 
-        # Extract pool tokens (underscore format)
-        pool_tokens = self.pool_pair.split("_")
-        if len(pool_tokens) != 2:
+        if self.pool_tokens is None:
             logger.error(
                 f"Invalid pool pair format: {self.pool_pair} (expected underscore format)"
             )
             return cycles
 
-        token_a, token_b = pool_tokens
+        token_a, token_b = self.pool_tokens
 
         # Calculate pool effective prices with slippage
         pool_reserves = None
@@ -252,126 +394,142 @@ class HybridArbBot:
                 token_b_symbol=token_b,
             )
 
+        # Pool spot price (token B per token A) for when there are no reserves
+        last_price = pool_data["last_price"]
+
         # Build cycles for each base currency (USDT, BTC, etc.)
         for base in [self.base_currency]:
-            # Build order book pair names (underscore format)
-            token_a_pair = f"{token_a}_{base}"
-            token_b_pair = f"{token_b}_{base}"
+            token_a_pair = self.token_a_pair
+            token_b_pair = self.token_b_pair
 
             # Check if we have order book data for both pairs
-            if (
-                token_a_pair not in orderbook_prices
-                or token_b_pair not in orderbook_prices
-            ):
+            token_a_prices = orderbook_prices.get(token_a_pair)
+            token_b_prices = orderbook_prices.get(token_b_pair)
+            if token_a_prices is None or token_b_prices is None:
                 logger.warning(
-                    f"Missing order book data for {token_a_pair} or {token_b_pair}"
+                    "Missing order book data for %s or %s", token_a_pair, token_b_pair
                 )
                 continue
 
-            token_a_prices = orderbook_prices[token_a_pair]
-            token_b_prices = orderbook_prices[token_b_pair]
-
             # Cycle 1: BASE → Token A → Token B (pool) → BASE
             # Buy Token A, swap to Token B, sell Token B
-            if token_a_prices["ask"] > 0 and token_b_prices["bid"] > 0:
-                try:
-                    # Calculate pool swap price with slippage
-                    if pool_reserves:
-                        # Estimate how much Token A we'll have after first leg
-                        approx_token_a = self.trade_amount / token_a_prices["ask"]
-                        swap_quote = get_swap_quote(
-                            approx_token_a, pool_reserves, token_a, self.pool_fee
-                        )
-                        pool_effective_price = swap_quote.effective_price
-                        slippage_pct = swap_quote.price_impact
-                    else:
-                        # Use spot price if no reserves
-                        pool_effective_price = pool_data["last_price"]
-                        slippage_pct = Decimal("0")
-
-                    leg1 = create_orderbook_leg(
-                        symbol=token_a_pair,
-                        side=TradeSide.BUY,
-                        price=Decimal("1")
-                        / token_a_prices["ask"],  # Invert: get token per base
-                        input_currency=base,
-                        output_currency=token_a,
-                        fee_rate=self.orderbook_fee,
-                    )
-
-                    leg2 = create_pool_swap_leg(
-                        symbol=self.pool_pair,
-                        side=TradeSide.SELL,  # Swap Token A for Token B
-                        effective_price=pool_effective_price,
-                        input_currency=token_a,
-                        output_currency=token_b,
-                        fee_rate=self.pool_fee,
-                        slippage_pct=slippage_pct,
-                    )
-
-                    leg3 = create_orderbook_leg(
-                        symbol=token_b_pair,
-                        side=TradeSide.SELL,
-                        price=token_b_prices["bid"],  # Get base per token
-                        input_currency=token_b,
-                        output_currency=base,
-                        fee_rate=self.orderbook_fee,
-                    )
-
-                    cycle = evaluate_cycle(leg1, leg2, leg3, self.trade_amount)
+            if token_a_prices.ask > 0 and token_b_prices.bid > 0:
+                cycle = self._build_one_cycle(
+                    base=base,
+                    buy_token=token_a,
+                    sell_token=token_b,
+                    buy_pair=token_a_pair,
+                    sell_pair=token_b_pair,
+                    buy_ask=token_a_prices.ask,
+                    sell_bid=token_b_prices.bid,
+                    pool_side=TradeSide.SELL,  # Swap Token A for Token B
+                    pool_reserves=pool_reserves,
+                    spot_price=last_price,
+                )
+                if cycle is not None:
                     cycles.append(cycle)
-                except Exception as e:
-                    logger.debug(f"Failed to build cycle 1: {e}")
 
             # Cycle 2: BASE → Token B → Token A (pool) → BASE
             # Buy Token B, swap to Token A, sell Token A
-            if token_b_prices["ask"] > 0 and token_a_prices["bid"] > 0:
-                try:
-                    if pool_reserves:
-                        approx_token_b = self.trade_amount / token_b_prices["ask"]
-                        swap_quote = get_swap_quote(
-                            approx_token_b, pool_reserves, token_b, self.pool_fee
-                        )
-                        pool_effective_price = swap_quote.effective_price
-                        slippage_pct = swap_quote.price_impact
-                    else:
-                        pool_effective_price = Decimal("1") / pool_data["last_price"]
-                        slippage_pct = Decimal("0")
-
-                    leg1 = create_orderbook_leg(
-                        symbol=token_b_pair,
-                        side=TradeSide.BUY,
-                        price=Decimal("1") / token_b_prices["ask"],
-                        input_currency=base,
-                        output_currency=token_b,
-                        fee_rate=self.orderbook_fee,
-                    )
+            if token_b_prices.ask > 0 and token_a_prices.bid > 0:
+                cycle = self._build_one_cycle(
+                    base=base,
+                    buy_token=token_b,
+                    sell_token=token_a,
+                    buy_pair=token_b_pair,
+                    sell_pair=token_a_pair,
+                    buy_ask=token_b_prices.ask,
+                    sell_bid=token_a_prices.bid,
+                    pool_side=TradeSide.BUY,  # Swap Token B for Token A
+                    pool_reserves=pool_reserves,
+                    spot_price=(
+                        Decimal("1") / last_price if last_price > 0 else Decimal("0")
+                    ),
+                )
+                if cycle is not None:
+                    cycles.append(cycle)
 
-                    leg2 = create_pool_swap_leg(
-                        symbol=self.pool_pair,
-                        side=TradeSide.BUY,  # Swap Token B for Token A
-                        effective_price=pool_effective_price,
-                        input_currency=token_b,
-                        output_currency=token_a,
-                        fee_rate=self.pool_fee,
-                        slippage_pct=slippage_pct,
-                    )
+        self._last_cycle_inputs = inputs
+        self._last_cycles = cycles
+        return list(cycles)
 
-                    leg3 = create_orderbook_leg(
-                        symbol=token_a_pair,
-                        side=TradeSide.SELL,
-                        price=token_a_prices["bid"],
-                        input_currency=token_a,
-                        output_currency=base,
-                        fee_rate=self.orderbook_fee,
-                    )
+    def _build_one_cycle(
+        self,
+        base: str,
+        buy_token: str,
+        sell_token: str,
+        buy_pair: str,
+        sell_pair: str,
+        buy_ask: Decimal,
+        sell_bid: Decimal,
+        pool_side: TradeSide,
+        pool_reserves: PoolReserves | None,
+        spot_price: Decimal,
+    ) -> ArbitrageCycle | None:
+        """
+        Build BASE → buy_token → sell_token (pool) → BASE.
 
-                    cycle = evaluate_cycle(leg1, leg2, leg3, self.trade_amount)
-                    cycles.append(cycle)
-                except Exception as e:
-                    logger.debug(f"Failed to build cycle 2: {e}")
+        ``spot_price`` is sell_token received per buy_token, used for the pool
+        leg when the pool reports no reserves to quote slippage from. Returns
+        None if the pool cannot quote the swap.
+        """
+        from strategies.hybrid_triangular_arb import (
+            TradeSide,
+            create_orderbook_leg,
+            create_pool_swap_leg,
+            evaluate_cycle,
+        )
+        from utils.amm_pricing import get_swap_quote
+
+        # Buy token per base at the ask, shared by the estimate and leg 1
+        buy_token_per_base = Decimal("1") / buy_ask
+        # Calculate pool swap price with slippage
+        if pool_reserves:
+            # Estimate how much of the buy token we'll have after first leg
+            approx_amount = self.trade_amount * buy_token_per_base
+            try:
+                swap_quote = get_swap_quote(
+                    approx_amount, pool_reserves, buy_token, self.pool_fee
+                )
+            except ValueError as e:
+                logger.debug("Cannot quote %s swap: %s", buy_token, e)
+                return None
+            pool_effective_price = swap_quote.effective_price
+            slippage_pct = swap_quote.price_impact
+        else:
+            # Use spot price if no reserves
+            pool_effective_price = spot_price
+            slippage_pct = Decimal("0")
+
+        leg1 = create_orderbook_leg(
+            symbol=buy_pair,
+            side=TradeSide.BUY,
+            price=buy_token_per_base,  # Inverted: token per base
+            input_currency=base,
+            output_currency=buy_token,
+            fee_rate=self.orderbook_fee,
+        )
+
+        leg2 = create_pool_swap_leg(
+            symbol=self.pool_pair,
+            side=pool_side,
+            effective_price=pool_effective_price,
+            input_currency=buy_token,
+            output_currency=sell_token,
+            fee_rate=self.pool_fee,
+            slippage_pct=slippage_pct,
+        )
+
+        leg3 = create_orderbook_leg(
+            symbol=sell_pair,
+            side=TradeSide.SELL,
+            price=sell_bid,  # Get base per token
+            input_currency=sell_token,
+            output_currency=base,
+            fee_rate=self.orderbook_fee,
+        )
 
-        return cycles
+        return evaluate_cycle(leg1, leg2, leg3, self.trade_amount)
 
     def execute_cycle(self, cycle: ArbitrageCycle) -> bool:
         """
@@ -405,6 +563,7 @@ class HybridArbBot:
             # Execute leg 2
             success = self._execute_leg(cycle.leg2)
             if not success:
+                self.partial_cycles += 1
                 logger.error("Leg 2 failed, attempting to reverse leg 1")
                 # TODO: Implement reversal logic
                 return False
@@ -412,6 +571,7 @@ class HybridArbBot:
             # Execute leg 3
             success = self._execute_leg(cycle.leg3)
             if not success:
+                self.partial_cycles += 1
                 logger.error("Leg 3 failed, attempting to reverse previous legs")
                 # TODO: Implement reversal logic
                 return False
@@ -497,6 +657,8 @@ class HybridArbBot:
                 min_received = leg.output_amount * Decimal(
                     "0.99"
                 )  # 1% slippage tolerance
+                # The swap moves the reserves whether or not it succeeds here.
+                self._pool_cache.pop(leg.symbol, None)
                 result = self.rest_client.execute_pool_swap(
                     symbol=leg.symbol,
                     side="buy" if leg.side == TradeSide.BUY else "sell",
@@ -518,8 +680,8 @@ class HybridArbBot:
         if self.orderbook_aggressive_limit_pct <= 0:
             return price
         if side == TradeSide.BUY:
-            return price * (Decimal("1") + self.orderbook_aggressive_limit_pct)
-        return price * (Decimal("1") - self.orderbook_aggressive_limit_pct)
+            return price * self._aggressive_buy_multiplier
+        return price * self._aggressive_sell_multiplier
 
     def run_cycle(self) -> None:
         """Run one iteration of the arbitrage detection cycle."""
@@ -531,20 +693,43 @@ class HybridArbBot:
         try:
             # Fetch all market data
             logger.debug("Fetching market data...")
+            pool_future = self._fetch_executor.submit(
+                self.fetch_pool_data, self.pool_pair
+            )
+            price_futures = {
+                pair: self._fetch_executor.submit(self.fetch_orderbook_prices, pair)
+                for pair in self.orderbook_pairs
+            }
             orderbook_prices = {}
-            for pair in self.orderbook_pairs:
-                prices = self.fetch_orderbook_prices(pair)
+            for pair, future in price_futures.items():
+                prices = future.result()
                 orderbook_prices[pair] = prices
-                logger.debug(
-                    f"{pair}: bid={prices['bid']:.8f}, ask={prices['ask']:.8f}"
-                )
+                logger.debug("%s: bid=%.8f, ask=%.8f", pair, prices.bid, prices.ask)
 
-            pool_data = self.fetch_pool_data(self.pool_pair)
+            pool_data = pool_future.result()
             logger.debug(
-                f"{self.pool_pair} pool: "
-                f"reserves=({pool_data['reserve_a']:.4f}, {pool_data['reserve_b']:.4f})"
+                "%s pool: reserves=(%.4f, %.4f)",
+                self.pool_pair,
+                pool_data["reserve_a"],
+                pool_data["reserve_b"],
             )
 
+            # Float pre-check: when no cycle could clear the threshold even
+            # at the pool's spot price, skip building the Decimal cycles. At
+            # DEBUG every cycle is still built so that each can be listed.
+            if not logger.isEnabledFor(logging.DEBUG):
+                bounds = self.cycle_return_bounds(orderbook_prices, pool_data)
+                if bounds is not None:
+                    best_pct = (max(bounds) - 1.0) * 100
+                    if best_pct < self.min_profit_pct_float:
+                        self.cycles_evaluated += len(bounds)
+                        logger.info(
+                            "No opportunity: best cycle at most %+.3f%% "
+                            "[Below threshold]",
+                            best_pct,
+                        )
+                        return
+
             # Build and evaluate cycles
             cycles = self.build_cycles(orderbook_prices, pool_data)
             self.cycles_evaluated += len(cycles)
@@ -558,23 +743,28 @@ class HybridArbBot:
             if best_cycle is None:
                 return
 
-            # Log all cycles
-            for cycle in cycles:
-                profit_indicator = (
-                    "✓" if is_cycle_profitable(cycle, self.min_profit_pct) else "✗"
-                )
-                logger.debug(
-                    f"{profit_indicator} {cycle.cycle_id}: "
-                    f"{cycle.net_profit:+.4f} ({cycle.profit_pct:+.3f}%)"
-                )
+            # Log all cycles (only worth the profitability checks at DEBUG)
+            if logger.isEnabledFor(logging.DEBUG):
+                for cycle in cycles:
+                    profitable = is_cycle_profitable(cycle, self.min_profit_pct)
+                    profit_indicator = "✓" if profitable else "✗"
+                    logger.debug(
+                        "%s %s: %+.4f (%+.3f%%)",
+                        profit_indicator,
+                        cycle.cycle_id,
+                        cycle.net_profit,
+                        cycle.profit_pct,
+                    )
 
             # Check if profitable
             if is_cycle_profitable(best_cycle, self.min_profit_pct):
                 self.opportunities_found += 1
                 logger.info(
-                    f"🎯 OPPORTUNITY #{self.opportunities_found}: "
-                    f"{best_cycle.cycle_id} | "
-                    f"Profit: {best_cycle.net_profit:.4f} ({best_cycle.profit_pct:.3f}%)"
+                    "🎯 OPPORTUNITY #%d: %s | Profit: %.4f (%.3f%%)",
+                    self.opportunities_found,
+                    best_cycle.cycle_id,
+                    best_cycle.net_profit,
+                    best_cycle.profit_pct,
                 )
 
                 # Execute if not in monitor mode
@@ -582,13 +772,14 @@ class HybridArbBot:
                     self.execute_cycle(best_cycle)
             else:
                 logger.info(
-                    f"Best cycle: {best_cycle.cycle_id} | "
-                    f"Profit: {best_cycle.net_profit:.4f} ({best_cycle.profit_pct:.3f}%) "
-                    f"[Below threshold]"
+                    "Best cycle: %s | Profit: %.4f (%.3f%%) [Below threshold]",
+                    best_cycle.cycle_id,
+                    best_cycle.net_profit,
+                    best_cycle.profit_pct,
                 )
 
         except Exception as e:
-            logger.error(f"Error in run cycle: {e}", exc_info=True)
+            logger.error("Error in run cycle: %s", e, exc_info=True)
 
     def run(self) -> None:
         """Run the bot continuously."""
@@ -598,8 +789,13 @@ class HybridArbBot:
         logger.info("Press Ctrl+C to stop")
 
         try:
+            # Cycles start on a fixed monotonic schedule, so slow cycles and
+            # wall-clock jumps do not push every later cycle back.
+            next_tick = time.monotonic()
             while True:
-                start_time = time.time()
+                # A streamed update can start a cycle before its tick; the
+                # schedule then continues from this cycle.
+                next_tick = min(next_tick, time.monotonic())
                 self.run_cycle()
                 if self.profit_store is not None:
                     self.profit_store.process()
@@ -618,21 +814,32 @@ class HybridArbBot:
                             if handled:
                                 self.profit_store.mark_exit_handled()
                 self._save_state()
-                elapsed = time.time() - start_time
 
                 # Log statistics periodically
                 if self.cycles_evaluated % 100 == 0 and self.cycles_evaluated > 0:
                     logger.info(
-                        f"Stats: {self.cycles_evaluated} cycles evaluated, "
-                        f"{self.opportunities_found} opportunities, "
-                        f"{self.trades_executed} executed, "
-                        f"total profit: {self.total_profit:.4f}"
+                        "Stats: %d cycles evaluated, %d opportunities, "
+                        "%d executed, total profit: %.4f",
+                        self.cycles_evaluated,
+                        self.opportunities_found,
+                        self.trades_executed,
+                        self.total_profit,
                     )
 
                 # Sleep until next poll
-                sleep_time = max(0, self.poll_interval - elapsed)
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                next_tick += self.poll_interval
+                sleep_time = next_tick - time.monotonic()
+                if sleep_time < 0:
+                    logger.warning(
+                        "Cycle fell behind schedule by %.3fs; starting next now",
+                        -sleep_time,
+                    )
+                    next_tick -= sleep_time
+                elif sleep_time > 0:
+                    if self.price_feed is not None:
+                        self.price_feed.wait_for_update(sleep_time)
+                    else:
+                        time.sleep(sleep_time)
 
         except KeyboardInterrupt:
             logger.info("\nShutting down...")
@@ -643,6 +850,10 @@ class HybridArbBot:
                 f"total profit: {self.total_profit:.4f}"
             )
             self._save_state()
+        finally:
+            self._fetch_executor.shutdown(wait=False)
+            if self.price_feed is not None:
+                self.price_feed.stop()
 
     def _save_state(self) -> None:
         payload = {
@@ -651,6 +862,7 @@ class HybridArbBot:
             "opportunities_found": self.opportunities_found,
             "trades_executed": self.trades_executed,
             "total_profit": str(self.total_profit),
+            "partial_cycles": self.partial_cycles,
             "updated_at": time.time(),
         }
         self.state_path.write_text(
@@ -660,8 +872,10 @@ class HybridArbBot:
 
 def load_config(config_path: str) -> dict[str, Any]:
     """Load configuration from YAML file."""
+    from utils.yaml_loader import safe_load
+
     with open(config_path) as f:
-        return yaml.safe_load(f)
+        return safe_load(f)
 
 
 def main() -> None:
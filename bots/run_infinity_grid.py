@@ -28,11 +28,11 @@ import time
 from decimal import Decimal
 from pathlib import Path
 
-import yaml
-
 # Add src to path
 REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT / "src"))
+SRC_ROOT = str(REPO_ROOT / "src")
+if SRC_ROOT not in sys.path:
+    sys.path.insert(0, SRC_ROOT)
 
 LOGGER = logging.getLogger("nonkyc_bot.infinity_grid")
 
@@ -101,19 +101,51 @@ def build_config(raw_config: dict):
     )
 
 
+def _wait_for_no_open_orders(
+    client, symbol: str, timeout: float = 5.0, interval: float = 0.1
+) -> bool:
+    """Poll until the exchange lists no open orders for ``symbol``.
+
+    Returns False if orders are still listed after ``timeout`` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while client.list_open_orders(symbol):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(interval, remaining))
+    return True
+
+
 def run_infinity_grid(config: dict, state_path: str) -> None:
     """Run infinity grid bot."""
+    from engine.price_feed import build_price_feed
     from engine.rest_client_factory import build_exchange_client
+    from strategies.grid import derive_market_id
     from strategies.infinity_ladder_grid import InfinityLadderGridStrategy
     from utils.profit_store import build_profit_store
 
-    # Build exchange client using centralized factory
-    client = build_exchange_client(config)
-
     # Build grid config
     grid_config = build_config(config)
+
+    # Build exchange client using centralized factory, reading mid prices from
+    # a WebSocket stream when price_feed selects one
+    client = build_exchange_client(
+        config, build_price_feed(config, [grid_config.symbol])
+    )
     profit_store = build_profit_store(config, client, grid_config.mode)
 
+    # Cancel existing orders if requested, before the strategy adopts the
+    # exchange's open orders on startup
+    if grid_config.startup_cancel_all:
+        LOGGER.info("Cancelling all existing orders...")
+        try:
+            client.cancel_all(derive_market_id(grid_config.symbol), "all")
+            if not _wait_for_no_open_orders(client, grid_config.symbol):
+                LOGGER.warning("Open orders still listed after cancel-all.")
+        except Exception as exc:
+            LOGGER.warning(f"Failed to cancel all orders: {exc}")
+
     # Create strategy
     strategy = InfinityLadderGridStrategy(
         config=grid_config,
@@ -122,15 +154,6 @@ def run_infinity_grid(config: dict, state_path: str) -> None:
         profit_store=profit_store,
     )
 
-    # Cancel existing orders if requested
-    if grid_config.startup_cancel_all:
-        LOGGER.info("Cancelling all existing orders...")
-        try:
-            client.cancel_all_orders()
-            time.sleep(2)
-        except Exception as exc:
-            LOGGER.warning(f"Failed to cancel all orders: {exc}")
-
     # Seed the grid
     LOGGER.info("Seeding infinity grid...")
     strategy.seed_ladder()
@@ -161,8 +184,10 @@ def run_infinity_grid(config: dict, state_path: str) -> None:
 
 def run_infinity_grid_from_file(config_path: str) -> None:
     """Load config and run infinity grid."""
+    from utils.yaml_loader import safe_load
+
     with open(config_path) as f:
-        config = yaml.safe_load(f)
+        config = safe_load(f)
     state_path = config.get("state_path", "state/infinity_grid_state.json")
     Path(state_path).parent.mkdir(parents=True, exist_ok=True)
     run_infinity_grid(config, state_path)
@@ -171,6 +196,7 @@ def run_infinity_grid_from_file(config_path: str) -> None:
 def main() -> None:
     """Main entry point."""
     from utils.logging_config import setup_logging
+    from utils.yaml_loader import safe_load
 
     parser = argparse.ArgumentParser(description="Infinity Grid trading bot")
     parser.add_argument("config", help="Path to configuration file (YAML)")
@@ -197,7 +223,7 @@ def main() -> None:
 
     # Load config and set mode
     with open(args.config) as f:
-        config = yaml.safe_load(f)
+        config = safe_load(f)
 
     if args.monitor_only:
         config["mode"] = "monitor"
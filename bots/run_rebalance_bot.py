@@ -23,16 +23,17 @@ import json
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 # Add src to path
 REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT / "src"))
+SRC_ROOT = str(REPO_ROOT / "src")
+if SRC_ROOT not in sys.path:
+    sys.path.insert(0, SRC_ROOT)
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +76,9 @@ class RebalanceBot:
         # Order configuration
         self.order_type = config.get("rebalance_order_type", "limit")
         self.order_spread = Decimal(str(config.get("rebalance_order_spread", "0.002")))
+        # Limit price multipliers (buy below, sell above market), fixed per run.
+        self._buy_price_multiplier = Decimal("1") - self.order_spread
+        self._sell_price_multiplier = Decimal("1") + self.order_spread
         self.min_notional_quote = Decimal(
             str(config.get("min_notional_quote", "1.0"))
         )  # $1 minimum
@@ -87,6 +91,31 @@ class RebalanceBot:
         # Price source
         self.price_source = config.get("price_source", "mid")  # mid, last, bid, ask
 
+        # Optional WebSocket prices: read while fresh instead of a REST ticker
+        # per pair, and a large enough move starts the next check early.
+        self.price_feed = None
+        self.price_feed_max_age = float(config.get("price_feed_max_age_sec", 5.0))
+        self.price_change_delta = Decimal(
+            str(config.get("price_change_delta", self.rebalance_threshold_percent / 2))
+        )
+        price_feed = config.get("price_feed", "rest")
+        if price_feed != "rest":
+            self.price_feed = self._build_price_feed(price_feed)
+
+        # Balances only change when an order fills, so a recent fetch can be
+        # reused for a few seconds; placing an order invalidates it. Opt-in:
+        # an earlier limit order may fill while the cache is warm.
+        self.balance_cache_ttl = float(config.get("balance_cache_ttl_sec", 0.0))
+        # (time.monotonic() when fetched, balances keyed by asset)
+        self._balance_cache: tuple[float, dict[str, Decimal]] | None = None
+
+        # Balances and each pair's price are independent requests; fetch them
+        # concurrently so a check waits for the slowest, not the sum.
+        self._fetch_executor = ThreadPoolExecutor(
+            max_workers=len(self.asset_targets) + 1,
+            thread_name_prefix="rebalance-fetch",
+        )
+
         # Statistics
         self.checks_performed = 0
         self.rebalances_executed = 0
@@ -107,6 +136,25 @@ class RebalanceBot:
 
         return build_rest_client(self.config)
 
+    def _build_price_feed(self, price_feed: str):
+        """Start the configured feed if it streams ``price_source`` prices."""
+        from engine.price_feed import build_price_feed
+
+        # The orderbook feed has mid, bid and ask; the ticker feed last prices.
+        streamed = {"websocket": ("mid", "bid", "ask"), "ticker": ("last",)}
+        if self.price_source not in streamed.get(price_feed, ()):
+            logger.warning(
+                f"price_feed={price_feed} does not stream {self.price_source} "
+                "prices; using REST tickers"
+            )
+            return None
+        pairs = [
+            target.trading_pair
+            for target in self.asset_targets
+            if target.trading_pair and target.asset != self.quote_asset
+        ]
+        return build_price_feed(self.config, pairs)
+
     def _load_asset_targets(self) -> list[AssetTarget]:
         assets_config = self.config.get("rebalance_assets")
         if assets_config:
@@ -212,6 +260,9 @@ class RebalanceBot:
 
     def get_price_for_pair(self, trading_pair: str) -> Decimal | None:
         """Fetch current market price based on configured price source."""
+        price = self._streamed_price(trading_pair)
+        if price is not None:
+            return price
         try:
             ticker = self.rest_client.get_market_data(trading_pair)
 
@@ -243,18 +294,33 @@ class RebalanceBot:
             )
             return None
 
+    def _streamed_price(self, trading_pair: str) -> Decimal | None:
+        """Return the WebSocket price for ``trading_pair``, or None if stale."""
+        if self.price_feed is None:
+            return None
+        if self.price_source in ("bid", "ask"):
+            top = self.price_feed.top(trading_pair, self.price_feed_max_age)
+            if top is None:
+                return None
+            return top[0] if self.price_source == "bid" else top[1]
+        return self.price_feed.price(trading_pair, self.price_feed_max_age)
+
     def get_price(self) -> Decimal | None:
         """Fetch current market price based on configured price source."""
         return self.get_price_for_pair(self.trading_pair)
 
     def get_balances_map(self) -> dict[str, Decimal] | None:
         """Get balances keyed by asset symbol."""
+        cached = self._balance_cache
+        if cached is not None and time.monotonic() - cached[0] < self.balance_cache_ttl:
+            return dict(cached[1])
         try:
             balances = self.rest_client.get_balances()
             balance_map: dict[str, Decimal] = {}
             for balance in balances:
                 balance_map[balance.asset] = Decimal(balance.available)
-            return balance_map
+            self._balance_cache = (time.monotonic(), balance_map)
+            return dict(balance_map)
         except Exception as e:
             logger.error(f"Failed to fetch balances: {e}", exc_info=True)
             return None
@@ -333,9 +399,11 @@ class RebalanceBot:
                 symbol=symbol,
                 side=side.lower(),
                 order_type=self.order_type,
-                quantity=str(amount),
-                price=str(price) if self.order_type == "limit" else None,
+                quantity=amount,
+                price=price if self.order_type == "limit" else None,
             )
+            # The order moves balances whether or not it succeeds here.
+            self._balance_cache = None
             response = self.rest_client.place_order(order)
             logger.info(
                 f"Rebalance order placed: {response.order_id}, Status: {response.status}"
@@ -353,8 +421,16 @@ class RebalanceBot:
         try:
             self.checks_performed += 1
 
-            logger.debug("Fetching balances...")
-            balances = self.get_balances_map()
+            logger.debug("Fetching balances and prices...")
+            balances_future = self._fetch_executor.submit(self.get_balances_map)
+            price_futures = {
+                target.trading_pair: self._fetch_executor.submit(
+                    self.get_price_for_pair, target.trading_pair
+                )
+                for target in self.asset_targets
+                if target.asset != self.quote_asset and target.trading_pair
+            }
+            balances = balances_future.result()
             if balances is None:
                 logger.warning("Failed to fetch balances, skipping cycle")
                 return
@@ -373,7 +449,7 @@ class RebalanceBot:
                         f"Missing trading pair for asset {target.asset}, skipping cycle"
                     )
                     return
-                price = self.get_price_for_pair(target.trading_pair)
+                price = price_futures[target.trading_pair].result()
                 if price is None:
                     logger.warning(
                         f"Failed to fetch price for {target.trading_pair}, skipping cycle"
@@ -447,13 +523,9 @@ class RebalanceBot:
             # Sell: place order ABOVE market to get better price (maker)
             if self.order_type == "limit":
                 if rebalance_order.side == "buy":
-                    limit_price = rebalance_order.price * (
-                        Decimal("1") - self.order_spread
-                    )
+                    limit_price = rebalance_order.price * self._buy_price_multiplier
                 else:
-                    limit_price = rebalance_order.price * (
-                        Decimal("1") + self.order_spread
-                    )
+                    limit_price = rebalance_order.price * self._sell_price_multiplier
             else:
                 limit_price = rebalance_order.price
 
@@ -497,7 +569,7 @@ class RebalanceBot:
                 sleep_time = max(0, self.poll_interval - elapsed)
                 if sleep_time > 0:
                     logger.debug(f"Sleeping for {sleep_time:.1f} seconds...")
-                    time.sleep(sleep_time)
+                    self._wait_for_next_check(sleep_time)
 
         except KeyboardInterrupt:
             logger.info("\nShutting down...")
@@ -506,6 +578,39 @@ class RebalanceBot:
                 f"{self.rebalances_executed} rebalances executed"
             )
             self._save_state()
+        finally:
+            self._fetch_executor.shutdown(wait=False)
+            if self.price_feed is not None:
+                self.price_feed.stop()
+
+    def _wait_for_next_check(self, timeout: float) -> None:
+        """Sleep ``timeout`` seconds, ending early on a streamed price move.
+
+        Only a move of at least ``price_change_delta`` (relative) since the
+        wait began ends it, so small ticks do not trigger balance requests.
+        """
+        if self.price_feed is None:
+            time.sleep(timeout)
+            return
+        deadline = time.monotonic() + timeout
+        reference = self.price_feed.prices()
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if self.price_feed.wait_for_update(remaining) and self._prices_moved(
+                reference
+            ):
+                return
+
+    def _prices_moved(self, reference: dict[str, Decimal]) -> bool:
+        for pair, price in self.price_feed.prices().items():
+            previous = reference.get(pair)
+            if previous is None:
+                return True
+            if abs(price - previous) >= previous * self.price_change_delta:
+                return True
+        return False
 
     def _save_state(self) -> None:
         payload = {
@@ -521,8 +626,10 @@ class RebalanceBot:
 
 def load_config(config_path: str) -> dict[str, Any]:
     """Load configuration from YAML file."""
+    from utils.yaml_loader import safe_load
+
     with open(config_path) as f:
-        return yaml.safe_load(f)
+        return safe_load(f)
 
 
 def main() -> None:
@@ -13,7 +13,9 @@ if TYPE_CHECKING:
 
 # Add src to path so we can import the modules
 REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT / "src"))
+SRC_ROOT = str(REPO_ROOT / "src")
+if SRC_ROOT not in sys.path:
+    sys.path.insert(0, SRC_ROOT)
 
 # Replace with your actual API credentials
 API_KEY = "your_api_key_here"
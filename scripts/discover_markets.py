@@ -24,7 +24,9 @@ if TYPE_CHECKING:
 
 # Add src to path
 REPO_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(REPO_ROOT / "src"))
+SRC_ROOT = str(REPO_ROOT / "src")
+if SRC_ROOT not in sys.path:
+    sys.path.insert(0, SRC_ROOT)
 
 
 def discover_markets(rest_client: RestClient) -> list[dict[str, Any]]:
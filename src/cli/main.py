@@ -239,9 +239,9 @@ def load_yaml(config_path: Path) -> dict[str, Any]:
         raise RuntimeError(
             "YAML config parsing requires PyYAML. Install it with 'pip install pyyaml' or use JSON/TOML."
         )
-    import yaml  # type: ignore[import-not-found]
+    from utils.yaml_loader import safe_load
 
-    data = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    data = safe_load(config_path.read_text(encoding="utf-8"))
     if data is None:
         return {}
     if not isinstance(data, dict):
@@ -7,6 +7,7 @@ import time
 from decimal import Decimal
 from pathlib import Path
 
+from engine.price_feed import build_price_feed
 from engine.rest_client_factory import build_exchange_client
 from strategies.grid import (
     LadderGridConfig,
@@ -82,7 +83,9 @@ def build_strategy(config: dict, state_path: Path) -> LadderGridStrategy:
         balance_refresh_sec=float(normalized.get("balance_refresh_sec", 60)),
         mode=normalized.get("mode", "live"),
     )
-    exchange = build_exchange_client(normalized)
+    exchange = build_exchange_client(
+        normalized, build_price_feed(normalized, [ladder_config.symbol])
+    )
     profit_store = build_profit_store(normalized, exchange, ladder_config.mode)
     return LadderGridStrategy(
         exchange, ladder_config, state_path=state_path, profit_store=profit_store
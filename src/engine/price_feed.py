@@ -0,0 +1,306 @@
+"""Push-based prices from the NonKYC WebSocket orderbook and ticker streams."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from decimal import Decimal, InvalidOperation
+from typing import Any, Iterable
+
+from nonkyc_client.ws import WebSocketClient
+
+LOGGER = logging.getLogger("nonkyc_bot.engine.price_feed")
+
+SNAPSHOT_METHOD = "snapshotOrderbook"
+UPDATE_METHOD = "updateOrderbook"
+TICKER_METHOD = "ticker"
+
+
+def _parse_level(level: Any) -> tuple[Decimal, Decimal] | None:
+    # Levels arrive as {"price": ..., "quantity": ...} or [price, quantity].
+    if isinstance(level, dict):
+        price, quantity = level.get("price"), level.get("quantity")
+    elif isinstance(level, (list, tuple)) and len(level) >= 2:
+        price, quantity = level[0], level[1]
+    else:
+        return None
+    try:
+        return Decimal(str(price)), Decimal(str(quantity))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def _apply_levels(
+    side: dict[Decimal, Decimal],
+    levels: Any,
+    best: Decimal | None,
+    is_bid: bool,
+) -> Decimal | None:
+    """Apply ``levels`` to one side of a book and return its best price.
+
+    ``best`` is the side's best price before the update, or None to rescan.
+    Only removing the best level needs a scan of the remaining levels; the
+    result is None when the side is empty.
+    """
+    for level in levels or ():
+        parsed = _parse_level(level)
+        if parsed is None:
+            continue
+        price, quantity = parsed
+        if quantity > 0:
+            side[price] = quantity
+            if best is not None and (price > best if is_bid else price < best):
+                best = price
+        elif side.pop(price, None) is not None and price == best:
+            best = None
+    if best is None and side:
+        best = max(side) if is_bid else min(side)
+    return best
+
+
+class _StreamingPriceFeed(ABC):
+    """Latest prices for a set of pairs, pushed from a WebSocket stream.
+
+    The WebSocket client runs on its own event loop in a daemon thread. Each
+    price change wakes whoever is blocked in :meth:`wait_for_update`, so a
+    strategy loop re-evaluates as soon as a price moves instead of on a poll
+    timer. Subclasses subscribe to a channel and parse its notifications.
+    """
+
+    methods: tuple[str, ...] = ()
+    # Seconds to let further updates land after a wake-up, so a burst of
+    # messages is evaluated once rather than once per message.
+    coalesce: float = 0.0
+
+    def __init__(
+        self, pairs: Iterable[str], ws_client: WebSocketClient | None = None
+    ) -> None:
+        self.pairs = tuple(pairs)
+        self.ws_client = ws_client or WebSocketClient()
+        self._latest: dict[str, Decimal] = {}
+        # pair -> time.monotonic() of the last message carrying its price
+        self._updated_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._updated = threading.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Subscribe to every pair and start streaming in the background."""
+        if self._thread is not None:
+            return
+        for pair in self.pairs:
+            self._subscribe(pair)
+        for method in self.methods:
+            self.ws_client.register_handler(method, self.handle_message)
+        self.ws_client.set_error_handler(self._handle_error)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run, name="arb-price-feed", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Close the WebSocket and wait for the streaming thread to exit."""
+        if self._thread is None or self._loop is None:
+            return
+        if self._loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(
+                self.ws_client.close(), self._loop
+            )
+            try:
+                future.result(timeout)
+            except Exception as exc:  # pragma: no cover - defensive
+                LOGGER.debug("Error closing price feed: %s", exc)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def wait_for_update(self, timeout: float | None = None) -> bool:
+        """Block until any pair's price changes; return False on timeout.
+
+        After a change, waits a further :attr:`coalesce` seconds so that
+        updates arriving meanwhile are folded into this wake-up.
+        """
+        updated = self._updated.wait(timeout)
+        if updated and self.coalesce > 0:
+            time.sleep(self.coalesce)
+        self._updated.clear()
+        return updated
+
+    def prices(self) -> dict[str, Decimal]:
+        """Return the latest price for each pair that has one."""
+        with self._lock:
+            return dict(self._latest)
+
+    def price(self, pair: str, max_age: float | None = None) -> Decimal | None:
+        """Return ``pair``'s latest price, or None if unknown or stale.
+
+        A price counts as stale once no message has confirmed it for
+        ``max_age`` seconds, e.g. after the stream silently dropped.
+        """
+        with self._lock:
+            price = self._latest.get(pair)
+            if price is None or max_age is None:
+                return price
+            if time.monotonic() - self._updated_at[pair] > max_age:
+                return None
+            return price
+
+    @abstractmethod
+    def handle_message(self, payload: dict[str, Any]) -> None:
+        """Apply a notification for one of :attr:`methods`."""
+
+    @abstractmethod
+    def _subscribe(self, pair: str) -> None:
+        """Register the channel for ``pair`` with the WebSocket client."""
+
+    def _set_price(self, pair: str, price: Decimal) -> None:
+        with self._lock:
+            self._updated_at[pair] = time.monotonic()
+            if self._latest.get(pair) == price:
+                return
+            self._latest[pair] = price
+        self._updated.set()
+
+    def _handle_error(self, payload: dict[str, Any]) -> None:
+        LOGGER.warning("Price feed error: %s", payload)
+
+    def _run(self) -> None:
+        assert self._loop is not None
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._loop.run_until_complete(self.ws_client.run_forever())
+        except Exception as exc:  # pragma: no cover - defensive
+            LOGGER.warning("Price feed stopped: %s", exc)
+        finally:
+            self._loop.close()
+
+
+class OrderBookPriceFeed(_StreamingPriceFeed):
+    """Mid prices maintained from orderbook snapshots and updates.
+
+    The best bid and ask behind each mid price are kept as well, for
+    strategies that price each side of the book (see :meth:`top`).
+    """
+
+    methods = (SNAPSHOT_METHOD, UPDATE_METHOD)
+
+    def __init__(
+        self,
+        pairs: Iterable[str],
+        ws_client: WebSocketClient | None = None,
+        *,
+        depth: int | None = None,
+    ) -> None:
+        super().__init__(pairs, ws_client)
+        self.depth = depth
+        # pair -> (bids, asks), each mapping price to resting quantity.
+        self._books: dict[str, tuple[dict, dict]] = {
+            pair: ({}, {}) for pair in self.pairs
+        }
+        # pair -> (best bid, best ask)
+        self._tops: dict[str, tuple[Decimal, Decimal]] = {}
+        # pair -> best bid and ask of the local book, None for an empty side;
+        # kept up to date per update instead of rescanning the whole book.
+        self._best: dict[str, tuple[Decimal | None, Decimal | None]] = {}
+
+    def top(
+        self, pair: str, max_age: float | None = None
+    ) -> tuple[Decimal, Decimal] | None:
+        """Return ``pair``'s best bid and ask, or None if unknown or stale."""
+        with self._lock:
+            top = self._tops.get(pair)
+            if top is None or max_age is None:
+                return top
+            if time.monotonic() - self._updated_at[pair] > max_age:
+                return None
+            return top
+
+    def _subscribe(self, pair: str) -> None:
+        self.ws_client.subscribe_order_book(pair, depth=self.depth)
+
+    def handle_message(self, payload: dict[str, Any]) -> None:
+        """Apply an orderbook snapshot or update notification."""
+        params = payload.get("params") or payload.get("data")
+        if not isinstance(params, dict):
+            return
+        pair = params.get("symbol")
+        book = self._books.get(pair)
+        if book is None:
+            return
+        bids, asks = book
+        best_bid, best_ask = self._best.get(pair, (None, None))
+        if payload.get("method") == SNAPSHOT_METHOD:
+            bids.clear()
+            asks.clear()
+            best_bid = best_ask = None
+        best_bid = _apply_levels(bids, params.get("bids"), best_bid, True)
+        best_ask = _apply_levels(asks, params.get("asks"), best_ask, False)
+        self._best[pair] = (best_bid, best_ask)
+        if best_bid is None or best_ask is None:
+            return
+        if best_bid <= 0 or best_ask <= 0:
+            return
+        top = (best_bid, best_ask)
+        with self._lock:
+            top_changed = self._tops.get(pair) != top
+            self._tops[pair] = top
+        self._set_price(pair, (best_bid + best_ask) / 2)
+        if top_changed:
+            # The spread can move without moving the mid price.
+            self._updated.set()
+
+
+class TickerPriceFeed(_StreamingPriceFeed):
+    """Last-trade prices from the ticker channel, one notification per move.
+
+    Unlike the orderbook feed this needs no local book, and the price matches
+    what the REST ticker reports as ``last_price``.
+    """
+
+    methods = (TICKER_METHOD,)
+
+    def _subscribe(self, pair: str) -> None:
+        self.ws_client.subscribe_ticker(pair)
+
+    def handle_message(self, payload: dict[str, Any]) -> None:
+        """Apply a ticker notification."""
+        params = payload.get("params") or payload.get("data")
+        if not isinstance(params, dict) or params.get("symbol") not in self.pairs:
+            return
+        for key in ("last", "lastPrice", "last_price"):
+            value = params.get(key)
+            if value in (None, ""):
+                continue
+            try:
+                price = Decimal(str(value))
+            except (InvalidOperation, ValueError):
+                return
+            if price.is_finite() and price > 0:
+                self._set_price(params["symbol"], price)
+            return
+
+
+def build_price_feed(
+    config: dict[str, Any], pairs: Iterable[str]
+) -> _StreamingPriceFeed | None:
+    """Start the streaming feed selected by ``price_feed`` in ``config``.
+
+    ``websocket`` streams orderbook mid prices and ``ticker`` last-trade
+    prices; any other value (the default ``rest``) returns None.
+    ``price_feed_coalesce_ms`` sets the feed's :attr:`coalesce` window.
+    """
+    source = config.get("price_feed", "rest")
+    if source == "ticker":
+        feed: _StreamingPriceFeed = TickerPriceFeed(pairs)
+    elif source == "websocket":
+        feed = OrderBookPriceFeed(pairs)
+    else:
+        return None
+    feed.coalesce = float(config.get("price_feed_coalesce_ms", 25)) / 1000
+    feed.start()
+    LOGGER.info("Price feed: WebSocket %s stream", source)
+    return feed
@@ -12,7 +12,7 @@ from __future__ import annotations
 from typing import Any
 
 from nonkyc_client.auth import AuthSigner
-from nonkyc_client.constants import default_rest_base_url
+from nonkyc_client.constants import SERVER_TIME_URL, default_rest_base_url
 from nonkyc_client.rest import RestClient
 from nonkyc_client.rest_exchange import NonkycRestExchangeClient
 from utils.credentials import DEFAULT_SERVICE_NAME, load_api_credentials
@@ -33,8 +33,20 @@ def build_rest_client(config: dict[str, Any]) -> RestClient:
             - sort_params: bool (default: False) - Sort query params
             - sort_body: bool (default: False) - Sort body params
             - rest_timeout_sec: float (default: 10.0) - Request timeout
+            - rest_connect_timeout_sec: float (default: 3.0) - Timeout for
+              opening a pooled connection (keep_alive only)
             - rest_retries: int (default: 3) - Max retries
             - rest_backoff_factor: float (default: 0.5) - Backoff multiplier
+            - keep_alive: bool (default: True) - Reuse HTTP connections
+              (``rest_keep_alive`` is accepted as an alias)
+            - keep_alive_ping_sec: float (default: 0) - Interval for pinging
+              the API to keep connections warm; 0 disables the ping
+            - keep_alive_ping_url: str (default: SERVER_TIME_URL) - Ping URL;
+              a path is resolved against base_url
+            - rest_http2: bool (default: False) - Multiplex pooled requests
+              over HTTP/2; needs httpx[http2], otherwise HTTP/1.1 is used
+            - rest_pool_maxsize: int (default: 8) - Idle connections kept per
+              host, so concurrent requests do not re-handshake every cycle
             - use_server_time: bool (optional) - Use server time for nonce
             - debug_auth: bool (optional) - Debug authentication
 
@@ -64,9 +76,17 @@ def build_rest_client(config: dict[str, Any]) -> RestClient:
 
     # Timeouts and retries
     rest_timeout = config.get("rest_timeout_sec", 10.0)
+    rest_connect_timeout = config.get("rest_connect_timeout_sec", 3.0)
     rest_retries = config.get("rest_retries", 3)
     rest_backoff = config.get("rest_backoff_factor", 0.5)
 
+    # Connection reuse
+    keep_alive = config.get("keep_alive", config.get("rest_keep_alive", True))
+    keep_alive_ping = float(config.get("keep_alive_ping_sec", 0.0))
+    keep_alive_ping_url = config.get("keep_alive_ping_url", SERVER_TIME_URL)
+    http2 = bool(config.get("rest_http2", False))
+    pool_maxsize = int(config.get("rest_pool_maxsize", 8))
+
     # Optional settings
     use_server_time = config.get("use_server_time")
     debug_auth = config.get("debug_auth")
@@ -88,7 +108,7 @@ def build_rest_client(config: dict[str, Any]) -> RestClient:
     )
 
     # Create REST client
-    return RestClient(
+    client = RestClient(
         base_url=base_url,
         credentials=creds,
         signer=signer,
@@ -98,10 +118,23 @@ def build_rest_client(config: dict[str, Any]) -> RestClient:
         backoff_factor=float(rest_backoff),
         sign_absolute_url=sign_absolute_url,
         debug_auth=debug_auth,
+        keep_alive=bool(keep_alive),
+        http2=http2,
+        pool_maxsize=pool_maxsize,
+        connect_timeout=(
+            float(rest_connect_timeout) if rest_connect_timeout is not None else None
+        ),
     )
+    if keep_alive and keep_alive_ping > 0:
+        client.start_keep_alive(keep_alive_ping, keep_alive_ping_url)
+    return client
 
 
-def build_exchange_client(config: dict[str, Any]) -> NonkycRestExchangeClient:
+def build_exchange_client(
+    config: dict[str, Any],
+    price_feed: Any | None = None,
+    rest_client: RestClient | None = None,
+) -> NonkycRestExchangeClient:
     """
     Build exchange client from config - wraps REST client with exchange-specific logic.
 
@@ -109,6 +142,10 @@ def build_exchange_client(config: dict[str, Any]) -> NonkycRestExchangeClient:
 
     Args:
         config: Same as build_rest_client()
+        price_feed: Optional streaming price feed (see engine.price_feed) read
+            by get_mid_price while its price is fresh
+        rest_client: Optional client from build_rest_client() to wrap instead
+            of building a new one, so both share one connection pool
 
     Returns:
         NonkycRestExchangeClient: Exchange client wrapping REST client
@@ -118,5 +155,10 @@ def build_exchange_client(config: dict[str, Any]) -> NonkycRestExchangeClient:
         >>> client = build_exchange_client(config)
         >>> balances = client.get_balances()
     """
-    rest_client = build_rest_client(config)
-    return NonkycRestExchangeClient(rest_client)
+    if rest_client is None:
+        rest_client = build_rest_client(config)
+    return NonkycRestExchangeClient(
+        rest_client,
+        price_feed=price_feed,
+        price_feed_max_age=float(config.get("price_feed_max_age_sec", 5.0)),
+    )
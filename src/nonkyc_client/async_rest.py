@@ -14,6 +14,7 @@ from typing import Any, Mapping
 
 import aiohttp
 
+from nonkyc_client import json_codec
 from nonkyc_client.auth import ApiCredentials, AuthSigner
 from nonkyc_client.constants import default_rest_base_url
 from nonkyc_client.models import (
@@ -76,8 +77,12 @@ class AsyncRestClient:
         rate_limiter: Any | None = None,  # AsyncRateLimiter instance (optional)
         verify_ssl: bool = True,  # Enable SSL certificate verification
         ssl_context: ssl.SSLContext | None = None,  # Custom SSL context
+        connection_limit: int = 8,  # Max open connections in the owned session
+        dns_cache_ttl: int = 300,  # Seconds to cache DNS lookups
     ) -> None:
         self.base_url = base_url.rstrip("/")
+        self._connection_limit = connection_limit
+        self._dns_cache_ttl = dns_cache_ttl
         self.credentials = credentials
         self._rate_limiter = rate_limiter
         self._ssl_context = ssl_context
@@ -240,7 +245,7 @@ class AsyncRestClient:
 
         if not payload:
             return {}
-        return json.loads(payload)
+        return json_codec.loads(payload)
 
     async def close(self) -> None:
         if self._session is not None and self._owns_session:
@@ -251,9 +256,13 @@ class AsyncRestClient:
     async def _ensure_session(self) -> aiohttp.ClientSession:
         if self._session is None:
             timeout = aiohttp.ClientTimeout(total=self.timeout)
-            # Create TCP connector with SSL context
+            # Create TCP connector with SSL context. The session lives as long as
+            # the client, so its keep-alive connections and cached DNS lookups
+            # are reused by every request.
             connector = aiohttp.TCPConnector(
-                ssl=self._ssl_context if self._ssl_context is not None else False
+                ssl=self._ssl_context if self._ssl_context is not None else False,
+                limit=self._connection_limit,
+                ttl_dns_cache=self._dns_cache_ttl,
             )
             self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
         return self._session
@@ -435,6 +444,26 @@ class AsyncRestClient:
             raw_payload=payload,
         )
 
+    async def get_market_data_many(
+        self, symbols: list[str] | tuple[str, ...]
+    ) -> dict[str, MarketTicker]:
+        """Fetch tickers for ``symbols`` concurrently.
+
+        All requests are in flight at once, so the call takes about one
+        round-trip. Symbols whose request fails are left out of the result.
+        """
+        results = await asyncio.gather(
+            *(self.get_market_data(symbol) for symbol in symbols),
+            return_exceptions=True,
+        )
+        tickers: dict[str, MarketTicker] = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, BaseException):
+                logging.debug("Ticker fetch failed for %s: %s", symbol, result)
+                continue
+            tickers[symbol] = result
+        return tickers
+
 
 def _resolve_last_price(payload: Mapping[str, Any], symbol: str) -> str:
     for key in ("last_price", "last", "lastPrice", "price"):
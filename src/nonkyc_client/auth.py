@@ -45,13 +45,21 @@ class AuthSigner:
         self._nonce_multiplier = nonce_multiplier
         self._sort_params = sort_params
         self._sort_body = sort_body
+        self._hmac_key: tuple[str, hmac.HMAC] | None = None
 
     def sign(self, message: str, credentials: ApiCredentials) -> str:
-        return hmac.new(
-            credentials.api_secret.encode("utf8"),
-            message.encode("utf8"),
-            hashlib.sha256,
-        ).hexdigest()
+        # Keying HMAC hashes the padded secret twice; do that once per secret
+        # and copy the keyed state for each message.
+        cached = self._hmac_key
+        if cached is None or cached[0] != credentials.api_secret:
+            keyed = hmac.new(
+                credentials.api_secret.encode("utf8"), None, hashlib.sha256
+            )
+            cached = (credentials.api_secret, keyed)
+            self._hmac_key = cached
+        mac = cached[1].copy()
+        mac.update(message.encode("utf8"))
+        return mac.hexdigest()
 
     def serialize_body(self, body: Mapping[str, Any]) -> str:
         return json.dumps(
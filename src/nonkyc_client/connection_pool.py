@@ -0,0 +1,312 @@
+"""Persistent HTTP(S) connection pool for the synchronous REST client."""
+
+from __future__ import annotations
+
+import http.client
+import importlib.util
+import io
+import select
+import ssl
+import threading
+from typing import Any, Literal
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+from urllib.request import Request
+
+# httpx (with its h2 extra) is optional: only Http2ConnectionPool needs it.
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+# Only these are resent after a stale-connection error: the server may already
+# have acted on a POST (e.g. placed an order) before the connection dropped.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class PooledResponse:
+    """Fully-read HTTP response returned by :class:`KeepAliveConnectionPool`.
+
+    The body is read eagerly so the underlying connection can go straight back
+    to the pool; the object mirrors the parts of the ``urlopen`` response API
+    that :class:`~nonkyc_client.rest.RestClient` relies on.
+    """
+
+    def __init__(self, status: int, headers: Any, body: bytes) -> None:
+        self.status = status
+        self.headers = headers
+        self._body = body
+
+    def read(self) -> bytes:
+        return self._body
+
+    def __enter__(self) -> "PooledResponse":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> Literal[False]:
+        return False
+
+
+class KeepAliveConnectionPool:
+    """Thread-safe pool of keep-alive connections keyed by scheme/host/port.
+
+    ``urlopen`` reuses an idle connection when one is available, so repeated
+    requests to the API skip the TCP and TLS handshakes. Idle connections that
+    the server has already closed are detected before reuse and replaced.
+    ``connect_timeout`` bounds opening a new connection separately from the
+    per-request read timeout, so an unreachable host fails fast.
+    """
+
+    def __init__(self, maxsize: int = 4, connect_timeout: float | None = None) -> None:
+        self._maxsize = maxsize
+        self._connect_timeout = connect_timeout
+        self._idle: dict[
+            tuple[str, str, int | None], list[http.client.HTTPConnection]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def urlopen(
+        self,
+        request: Request,
+        timeout: float = 10.0,
+        context: ssl.SSLContext | None = None,
+    ) -> PooledResponse:
+        """Send ``request`` over a pooled connection.
+
+        Raises ``HTTPError`` for status codes >= 400 and ``URLError`` for other
+        socket errors, matching :func:`urllib.request.urlopen`.
+        """
+        parts = urlsplit(request.full_url)
+        key = (parts.scheme, parts.hostname or "", parts.port)
+        selector = parts.path or "/"
+        if parts.query:
+            selector = f"{selector}?{parts.query}"
+        headers = dict(request.header_items())
+
+        connection, reused = self._checkout(key, timeout, context)
+        try:
+            response = self._request(connection, request, selector, headers)
+        except _STALE_CONNECTION_ERRORS:
+            connection.close()
+            if not reused or request.get_method() not in IDEMPOTENT_METHODS:
+                raise
+            # The server closed an idle connection between our liveness check
+            # and the request; retry once on a fresh connection.
+            connection = self._connect(key, timeout, context)
+            try:
+                response = self._request(connection, request, selector, headers)
+            except BaseException:
+                connection.close()
+                raise
+        except BaseException:
+            connection.close()
+            raise
+
+        try:
+            body = response.read()
+        except BaseException:
+            connection.close()
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            self._checkin(key, connection)
+
+        if response.status >= 400:
+            raise HTTPError(
+                request.full_url,
+                response.status,
+                response.reason,
+                response.headers,
+                io.BytesIO(body),
+            )
+        return PooledResponse(response.status, response.headers, body)
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle = [conn for conns in self._idle.values() for conn in conns]
+            self._idle.clear()
+        for connection in idle:
+            connection.close()
+
+    def _request(
+        self,
+        connection: http.client.HTTPConnection,
+        request: Request,
+        selector: str,
+        headers: dict[str, str],
+    ) -> http.client.HTTPResponse:
+        try:
+            connection.request(
+                request.get_method(), selector, body=request.data, headers=headers
+            )
+            return connection.getresponse()
+        except (TimeoutError, *_STALE_CONNECTION_ERRORS):
+            raise
+        except (OSError, http.client.HTTPException) as exc:
+            raise URLError(exc) from exc
+
+    def _checkout(
+        self,
+        key: tuple[str, str, int | None],
+        timeout: float,
+        context: ssl.SSLContext | None,
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                connection = idle.pop() if idle else None
+            if connection is None:
+                return self._connect(key, timeout, context), False
+            if _is_connection_dropped(connection):
+                connection.close()
+                continue
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            return connection, True
+
+    def _checkin(
+        self,
+        key: tuple[str, str, int | None],
+        connection: http.client.HTTPConnection,
+    ) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self._maxsize:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _connect(
+        self,
+        key: tuple[str, str, int | None],
+        timeout: float,
+        context: ssl.SSLContext | None,
+    ) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        connection: http.client.HTTPConnection
+        connect_timeout = self._connect_timeout
+        if connect_timeout is None:
+            connect_timeout = timeout
+        if scheme == "https":
+            connection = http.client.HTTPSConnection(
+                host, port, timeout=connect_timeout, context=context
+            )
+        elif scheme == "http":
+            connection = http.client.HTTPConnection(host, port, timeout=connect_timeout)
+        else:
+            raise URLError(f"unknown url type: {scheme}")
+        if connect_timeout == timeout:
+            return connection
+        try:
+            connection.connect()
+        except TimeoutError:
+            connection.close()
+            raise
+        except OSError as exc:
+            connection.close()
+            raise URLError(exc) from exc
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        return connection
+
+
+def http2_available() -> bool:
+    """Return True if httpx and its h2 extra are installed."""
+    return httpx is not None and importlib.util.find_spec("h2") is not None
+
+
+class Http2ConnectionPool:
+    """HTTP/2 counterpart of :class:`KeepAliveConnectionPool`, backed by httpx.
+
+    Requests share one multiplexed connection per host, so concurrent calls
+    (e.g. the per-pair price fetches) run as parallel streams instead of each
+    holding a pooled HTTP/1.1 connection. Errors are raised as ``HTTPError``,
+    ``URLError`` and ``TimeoutError`` exactly like the HTTP/1.1 pool, so the
+    REST client handles both the same way. Requires :func:`http2_available`.
+    """
+
+    def __init__(self, maxsize: int = 4, connect_timeout: float | None = None) -> None:
+        if not http2_available():
+            raise RuntimeError("HTTP/2 support requires httpx[http2].")
+        self._maxsize = maxsize
+        self._connect_timeout = connect_timeout
+        self._client: Any = None
+        self._lock = threading.Lock()
+
+    def urlopen(
+        self,
+        request: Request,
+        timeout: float = 10.0,
+        context: ssl.SSLContext | None = None,
+    ) -> PooledResponse:
+        """Send ``request`` over the shared HTTP/2 connection."""
+        connect_timeout = self._connect_timeout
+        if connect_timeout is None:
+            connect_timeout = timeout
+        try:
+            response = self._get_client(context).request(
+                request.get_method(),
+                request.full_url,
+                content=request.data,
+                headers=dict(request.header_items()),
+                timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            )
+        except httpx.TimeoutException as exc:
+            raise TimeoutError(str(exc)) from exc
+        except httpx.HTTPError as exc:
+            raise URLError(exc) from exc
+        body = response.content
+        if response.status_code >= 400:
+            raise HTTPError(
+                request.full_url,
+                response.status_code,
+                response.reason_phrase,
+                response.headers,  # type: ignore[arg-type]
+                io.BytesIO(body),
+            )
+        return PooledResponse(response.status_code, response.headers, body)
+
+    def close(self) -> None:
+        """Close the shared connection."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def _get_client(self, context: ssl.SSLContext | None) -> Any:
+        # The SSL context is fixed per REST client, so the first request's
+        # context configures the shared httpx client.
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    http2=True,
+                    verify=context if context is not None else True,
+                    limits=httpx.Limits(max_keepalive_connections=self._maxsize),
+                )
+            return self._client
+
+
+def _is_connection_dropped(connection: http.client.HTTPConnection) -> bool:
+    """Return True if an idle connection was closed by the peer.
+
+    An idle keep-alive socket should never be readable; readability means the
+    server sent EOF (or unexpected data) and the connection cannot be reused.
+    """
+    sock = connection.sock
+    if sock is None:
+        return False
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
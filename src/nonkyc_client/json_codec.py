@@ -0,0 +1,24 @@
+"""JSON decoding for API responses, using orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses this, so callers catch one type either way.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(payload: str | bytes) -> Any:
+    """Parse a JSON document from ``str`` or UTF-8 ``bytes``.
+
+    Bytes are parsed directly, without decoding to ``str`` first.
+    """
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
@@ -66,11 +66,15 @@ class OrderRequest(BaseModel):
     @field_validator("quantity", "price", mode="before")
     @classmethod
     def validate_amounts(cls, v: Any) -> str | None:
-        """Validate amounts are valid positive decimals."""
+        """Validate amounts are valid positive decimals.
+
+        ``Decimal`` values are checked as-is and stringified once here, so
+        callers can pass them straight through instead of pre-formatting.
+        """
         if v is None:
             return None
         try:
-            decimal_val = Decimal(str(v))
+            decimal_val = v if isinstance(v, Decimal) else Decimal(str(v))
             if decimal_val <= 0:
                 raise ValueError("Amount must be positive")
             return str(v)
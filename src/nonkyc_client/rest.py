@@ -10,6 +10,7 @@ import random
 import re
 import socket
 import ssl
+import threading
 import time
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
@@ -17,8 +18,15 @@ from typing import Any, Mapping
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
+from nonkyc_client import json_codec
 from nonkyc_client.auth import ApiCredentials, AuthSigner, SignedHeaders
-from nonkyc_client.constants import default_rest_base_url
+from nonkyc_client.connection_pool import (
+    IDEMPOTENT_METHODS,
+    Http2ConnectionPool,
+    KeepAliveConnectionPool,
+    http2_available,
+)
+from nonkyc_client.constants import SERVER_TIME_URL, default_rest_base_url
 from nonkyc_client.models import (
     Balance,
     MarketTicker,
@@ -60,6 +68,14 @@ class TransientApiError(RestError):
     """Raised for transient REST errors that may succeed on retry."""
 
 
+class ConnectionDroppedError(TransientApiError):
+    """Raised when the connection drops before a response is read.
+
+    The exchange may already have acted on the request, so only idempotent
+    requests are retried automatically.
+    """
+
+
 # Cloudflare error codes that indicate transient infrastructure issues
 CLOUDFLARE_TRANSIENT_ERROR_CODES = {
     "1000",  # DNS points to prohibited IP
@@ -95,6 +111,10 @@ class RestClient:
         rate_limiter: Any | None = None,  # RateLimiter instance (optional)
         verify_ssl: bool = True,  # Enable SSL certificate verification
         ssl_context: ssl.SSLContext | None = None,  # Custom SSL context
+        keep_alive: bool = False,  # Reuse persistent HTTP connections
+        connect_timeout: float | None = None,  # Pooled connect timeout
+        http2: bool = False,  # Multiplex pooled requests over HTTP/2 (httpx)
+        pool_maxsize: int = 4,  # Idle pooled connections kept per host
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.credentials = credentials
@@ -144,11 +164,82 @@ class RestClient:
         else:
             self.sign_absolute_url = sign_absolute_url
         self._last_cancel_all_response: dict[str, Any] | None = None
+        self._connection_pool: KeepAliveConnectionPool | Http2ConnectionPool | None
+        self._connection_pool = None
+        if keep_alive and http2 and http2_available():
+            self._connection_pool = Http2ConnectionPool(
+                maxsize=pool_maxsize, connect_timeout=connect_timeout
+            )
+        elif keep_alive:
+            if http2:
+                logging.warning(
+                    "HTTP/2 requested but httpx[http2] is not installed; "
+                    "using HTTP/1.1 keep-alive connections."
+                )
+            self._connection_pool = KeepAliveConnectionPool(
+                maxsize=pool_maxsize, connect_timeout=connect_timeout
+            )
+        self._keep_alive_stop: threading.Event | None = None
 
     @property
     def last_cancel_all_response(self) -> dict[str, Any] | None:
         return self._last_cancel_all_response
 
+    def start_keep_alive(
+        self, interval: float = 30.0, url: str = SERVER_TIME_URL
+    ) -> None:
+        """Ping ``url`` every ``interval`` seconds to keep pooled sockets warm.
+
+        Servers and load balancers close idle connections, which would make the
+        next order pay a fresh TCP/TLS handshake. Connections are pooled per
+        host, so only those to ``url``'s host are kept warm; a relative ``url``
+        is resolved against ``base_url``. The ping is unsigned and its result is
+        ignored. No-op unless the client was built with keep_alive.
+        """
+        if self._connection_pool is None or self._keep_alive_stop is not None:
+            return
+        self._keep_alive_stop = threading.Event()
+        thread = threading.Thread(
+            target=self._keep_alive_loop,
+            args=(self._keep_alive_stop, interval, url),
+            name="rest-keep-alive",
+            daemon=True,
+        )
+        thread.start()
+
+    def _keep_alive_loop(
+        self, stop: threading.Event, interval: float, url: str
+    ) -> None:
+        if "://" not in url:
+            url = self.build_url(url)
+        headers = {
+            "Accept": "application/json",
+            "User-Agent": "Mozilla/5.0 (compatible; nonkyc-bot/1.0)",
+        }
+        while not stop.wait(interval):
+            try:
+                with self._urlopen(
+                    Request(url=url, method="GET", headers=headers)
+                ) as response:
+                    response.read()
+            except (OSError, http.client.HTTPException) as exc:
+                logging.debug("Keep-alive ping to %s failed: %s", url, exc)
+
+    def close(self) -> None:
+        """Stop the keep-alive ping and close persistent connections."""
+        if self._keep_alive_stop is not None:
+            self._keep_alive_stop.set()
+            self._keep_alive_stop = None
+        if self._connection_pool is not None:
+            self._connection_pool.close()
+
+    def _urlopen(self, http_request: Request) -> Any:
+        if self._connection_pool is not None:
+            return self._connection_pool.urlopen(
+                http_request, timeout=self.timeout, context=self._ssl_context
+            )
+        return urlopen(http_request, timeout=self.timeout, context=self._ssl_context)
+
     def build_url(self, path: str) -> str:
         return f"{self.base_url}/{path.lstrip('/')}"
 
@@ -167,6 +258,14 @@ class RestClient:
                     raise
                 delay = exc.retry_after or self._compute_backoff(attempts)
                 time.sleep(delay)
+            except ConnectionDroppedError:
+                # Resending a POST could place or cancel an order twice.
+                if request.method.upper() not in IDEMPOTENT_METHODS:
+                    raise
+                attempts += 1
+                if attempts > self.max_retries:
+                    raise
+                time.sleep(self._compute_backoff(attempts))
             except TransientApiError:
                 attempts += 1
                 if attempts > self.max_retries:
@@ -228,10 +327,8 @@ class RestClient:
             url=url, method=request.method.upper(), headers=headers, data=data_bytes
         )
         try:
-            with urlopen(
-                http_request, timeout=self.timeout, context=self._ssl_context
-            ) as response:
-                payload = response.read().decode("utf8")
+            with self._urlopen(http_request) as response:
+                payload = response.read()
         except HTTPError as exc:
             if exc.code == 429:
                 retry_after = self._parse_retry_after(exc.headers.get("Retry-After"))
@@ -259,7 +356,7 @@ class RestClient:
             ConnectionResetError,
             BrokenPipeError,
         ) as exc:
-            raise TransientApiError(
+            raise ConnectionDroppedError(
                 "Network connection dropped while contacting API"
             ) from exc
         except URLError as exc:
@@ -267,7 +364,7 @@ class RestClient:
 
         if not payload:
             return {}
-        return json.loads(payload)
+        return json_codec.loads(payload)
 
     def _compute_backoff(self, attempt: int) -> float:
         base = self.backoff_factor * (2 ** (attempt - 1))
@@ -504,10 +601,8 @@ class RestClient:
                 )
         http_request = Request(url=url, method="GET", headers=headers)
         try:
-            with urlopen(
-                http_request, timeout=self.timeout, context=self._ssl_context
-            ) as response:
-                payload = response.read().decode("utf8")
+            with self._urlopen(http_request) as response:
+                payload = response.read()
         except HTTPError as exc:
             if exc.code == 429:
                 retry_after = self._parse_retry_after(exc.headers.get("Retry-After"))
@@ -537,13 +632,13 @@ class RestClient:
             ConnectionResetError,
             BrokenPipeError,
         ) as exc:
-            raise TransientApiError(
+            raise ConnectionDroppedError(
                 "Network connection dropped while contacting API"
             ) from exc
         except URLError as exc:
             raise TransientApiError("Network error while contacting API") from exc
 
-        response = {} if not payload else json.loads(payload)
+        response = {} if not payload else json_codec.loads(payload)
         payload_data = self._extract_payload(response) or {}
         if isinstance(payload_data, list):
             resolved_payload: dict[str, Any] = {"orders": payload_data}
@@ -11,10 +11,23 @@ from nonkyc_client.rest import RestClient, RestError, RestRequest
 
 
 class NonkycRestExchangeClient(ExchangeClient):
-    def __init__(self, rest_client: RestClient) -> None:
+    def __init__(
+        self,
+        rest_client: RestClient,
+        price_feed: Any | None = None,
+        price_feed_max_age: float = 5.0,
+    ) -> None:
         self._rest = rest_client
+        # Optional streaming feed (see engine.price_feed); get_mid_price reads
+        # it while fresh and falls back to the REST ticker otherwise.
+        self.price_feed = price_feed
+        self.price_feed_max_age = price_feed_max_age
 
     def get_mid_price(self, symbol: str) -> Decimal:
+        if self.price_feed is not None:
+            price = self.price_feed.price(symbol, self.price_feed_max_age)
+            if price is not None:
+                return price
         ticker = self._rest.get_market_data(symbol)
         if ticker.bid is not None and ticker.ask is not None:
             return (Decimal(ticker.bid) + Decimal(ticker.ask)) / Decimal("2")
@@ -52,8 +65,8 @@ class NonkycRestExchangeClient(ExchangeClient):
             symbol=symbol,
             side=side,
             order_type="limit",
-            price=str(price),
-            quantity=str(quantity),
+            price=price,
+            quantity=quantity,
             user_provided_id=client_id,
             strict_validate=strict_validate,
         )
@@ -72,7 +85,7 @@ class NonkycRestExchangeClient(ExchangeClient):
             side=side,
             order_type="market",
             price=None,
-            quantity=str(quantity),
+            quantity=quantity,
             user_provided_id=client_id,
         )
         try:
@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass, field
 from typing import Any, Mapping
 
 import aiohttp
 
+from nonkyc_client import json_codec
 from nonkyc_client.auth import ApiCredentials, AuthSigner
 from nonkyc_client.constants import WS_URL
 
@@ -74,6 +74,13 @@ class WebSocketClient:
         self.subscriptions.append(subscription)
         return subscription
 
+    def subscribe_ticker(self, symbol: str) -> Subscription:
+        subscription = Subscription(
+            channel="subscribeTicker", params={"symbol": symbol}
+        )
+        self.subscriptions.append(subscription)
+        return subscription
+
     def subscribe_trades(self, symbol: str) -> Subscription:
         subscription = Subscription(
             channel="subscribeTrades", params={"symbol": symbol}
@@ -188,13 +195,10 @@ class WebSocketClient:
             self._owns_session = False
 
     async def _handle_message(self, data: str | bytes) -> None:
-        if isinstance(data, bytes):
-            text = data.decode("utf8")
-        else:
-            text = data
         try:
-            payload = json.loads(text)
-        except json.JSONDecodeError:
+            payload = json_codec.loads(data)
+        except (json_codec.JSONDecodeError, UnicodeDecodeError):
+            text = data.decode("utf8", "replace") if isinstance(data, bytes) else data
             await self._dispatch_error({"error": "invalid_json", "payload": text})
             return
         await self._dispatch(payload)
@@ -6,8 +6,10 @@ import json
 import logging
 import time
 import uuid
+from collections import Counter
 from dataclasses import dataclass, field
 from decimal import ROUND_DOWN, Decimal
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING, Iterable
 
@@ -24,6 +26,9 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger("nonkyc_bot.strategy.ladder_grid")
 
+# (available, held) for an asset missing from the balances mapping.
+_NO_BALANCE = (Decimal("0"), Decimal("0"))
+
 
 @dataclass(frozen=True)
 class LadderGridConfig:
@@ -152,14 +157,12 @@ class LadderGridStrategy:
         buy_levels = self._build_levels(mid_price, "buy", self.config.n_buy_levels)
         sell_levels = self._build_levels(mid_price, "sell", self.config.n_sell_levels)
 
-        base, quote = self._split_symbol(self.config.symbol)
+        base, quote = self._assets
         base_balance = (
-            self._balances.get(base, (Decimal("0"), Decimal("0")))[0]
-            if self._balances
-            else Decimal("0")
+            self._balances.get(base, _NO_BALANCE)[0] if self._balances else Decimal("0")
         )
         quote_balance = (
-            self._balances.get(quote, (Decimal("0"), Decimal("0")))[0]
+            self._balances.get(quote, _NO_BALANCE)[0]
             if self._balances
             else Decimal("0")
         )
@@ -193,7 +196,7 @@ class LadderGridStrategy:
         self.save_state()
 
     def rebalance_startup(self) -> None:
-        base_asset, quote_asset = self._split_symbol(self.config.symbol)
+        base_asset, quote_asset = self._assets
         attempts = max(1, int(self.config.rebalance_max_attempts))
         last_balances: dict[str, tuple[Decimal, Decimal]] | None = None
         last_requirement: tuple[str, Decimal] | None = None
@@ -238,8 +241,8 @@ class LadderGridStrategy:
             return
         required_side, required_qty = last_requirement
         balances = last_balances or {}
-        base_balance = balances.get(base_asset, (Decimal("0"), Decimal("0")))
-        quote_balance = balances.get(quote_asset, (Decimal("0"), Decimal("0")))
+        base_balance = balances.get(base_asset, _NO_BALANCE)
+        quote_balance = balances.get(quote_asset, _NO_BALANCE)
         action = f"{required_side} {required_qty} {base_asset} for {quote_asset}"
         raise RuntimeError(
             "Startup rebalance failed after "
@@ -327,7 +330,7 @@ class LadderGridStrategy:
                 )
                 self.state.total_profit_quote += net_profit
                 if self.profit_store is not None:
-                    _, quote = self._split_symbol(self.config.symbol)
+                    _, quote = self._assets
                     self.profit_store.record_profit(net_profit, quote)
                 LOGGER.info(
                     "Sell net profit: %s (cumulative: %s)",
@@ -341,10 +344,15 @@ class LadderGridStrategy:
         self._place_order(new_side, new_price, filled_qty, cost_basis=cost_basis)
 
     def _reconcile_missing_levels(self) -> None:
+        counts = self._count_orders_by_side()
+        buys = counts["buy"]
+        sells = counts["sell"]
+        if buys >= self.config.n_buy_levels and sells >= self.config.n_sell_levels:
+            # The ladder is complete; fills are replaced as they are seen, so
+            # there is nothing to diff against a fresh mid price.
+            return
         mid_price = self.client.get_mid_price(self.config.symbol)
         self.state.last_mid = mid_price
-        buys = self._count_orders("buy")
-        sells = self._count_orders("sell")
         if buys < self.config.n_buy_levels:
             levels = self._build_levels(
                 mid_price, "buy", self.config.n_buy_levels - buys
@@ -377,8 +385,8 @@ class LadderGridStrategy:
             self.state.open_orders.pop(order_id, None)
         self.save_state()
         self._refresh_balances(now)
-        base, quote = self._split_symbol(self.config.symbol)
-        base_available = self._balances.get(base, (Decimal("0"), Decimal("0")))[0]
+        base, quote = self._assets
+        base_available = self._balances.get(base, _NO_BALANCE)[0]
         if base_available <= 0:
             LOGGER.info("Exit triggered but no %s balance to sell.", base)
             return
@@ -444,14 +452,12 @@ class LadderGridStrategy:
             (order.side, order.price) for order in self.state.open_orders.values()
         }
         results: list[tuple[str, Decimal]] = []
+        step = self._step_delta(mid_price)
+        if side != "sell":
+            step = -step
         level = 1
         while len(results) < levels:
-            price = (
-                self._apply_step(mid_price, level, upward=side == "sell")
-                if side == "sell"
-                else self._apply_step(mid_price, level, upward=False)
-            )
-            price = self._quantize_price(price)
+            price = self._quantize_price(mid_price + step * Decimal(level))
             key = (side, price)
             if key not in existing_prices:
                 results.append((side, price))
@@ -467,9 +473,9 @@ class LadderGridStrategy:
         target_ratio = self.config.rebalance_target_base_pct
         if not (Decimal("0") < target_ratio < Decimal("1")):
             raise ValueError("rebalance_target_base_pct must be between 0 and 1.")
-        base_asset, quote_asset = self._split_symbol(self.config.symbol)
-        base_balance = balances.get(base_asset, (Decimal("0"), Decimal("0")))[0]
-        quote_balance = balances.get(quote_asset, (Decimal("0"), Decimal("0")))[0]
+        base_asset, quote_asset = self._assets
+        base_balance = balances.get(base_asset, _NO_BALANCE)[0]
+        quote_balance = balances.get(quote_asset, _NO_BALANCE)[0]
         base_value = base_balance * mid_price
         total_value = base_value + quote_balance
         if total_value <= 0:
@@ -485,15 +491,18 @@ class LadderGridStrategy:
         return side, quantity
 
     def _apply_step(self, price: Decimal, level: int, *, upward: bool) -> Decimal:
+        delta = self._step_delta(price) * Decimal(level)
+        return price + delta if upward else price - delta
+
+    def _step_delta(self, price: Decimal) -> Decimal:
+        """Return the distance between adjacent levels around ``price``."""
         if self.config.step_mode == "pct":
             if self.config.step_pct is None:
                 raise ValueError("step_pct is required for pct step mode.")
-            delta = price * self.config.step_pct * Decimal(level)
-        else:
-            if self.config.step_abs is None:
-                raise ValueError("step_abs is required for abs step mode.")
-            delta = self.config.step_abs * Decimal(level)
-        return price + delta if upward else price - delta
+            return price * self.config.step_pct
+        if self.config.step_abs is None:
+            raise ValueError("step_abs is required for abs step mode.")
+        return self.config.step_abs
 
     def _validate_spacing(self, mid_price: Decimal) -> None:
         total_fee_rate = self.config.total_fee_rate
@@ -602,11 +611,11 @@ class LadderGridStrategy:
 
         # Check minimum balance
         if not self._has_sufficient_balance(side, price, quantity):
-            base, quote = self._split_symbol(self.config.symbol)
+            base, quote = self._assets
             required_asset = quote if side.lower() == "buy" else base
             required_amount = price * quantity if side.lower() == "buy" else quantity
             available = (
-                self._balances.get(required_asset, (Decimal("0"), Decimal("0")))[0]
+                self._balances.get(required_asset, _NO_BALANCE)[0]
                 if self._balances
                 else Decimal("0")
             )
@@ -696,16 +705,23 @@ class LadderGridStrategy:
             rounding=ROUND_DOWN
         ) * self.config.step_size
 
-    def _min_qty_for_notional(self, price: Decimal) -> Decimal:
-        min_with_fee = self.config.min_notional_quote * (
+    # The config is frozen, so values derived from it are resolved once.
+    @cached_property
+    def _assets(self) -> tuple[str, str]:
+        return self._split_symbol(self.config.symbol)
+
+    @cached_property
+    def _min_notional_with_fee(self) -> Decimal:
+        return self.config.min_notional_quote * (
             Decimal("1") + self.config.fee_buffer_pct
         )
-        return min_with_fee / price
 
-    def _count_orders(self, side: str) -> int:
-        return sum(
-            1 for order in self.state.open_orders.values() if order.side.lower() == side
-        )
+    def _min_qty_for_notional(self, price: Decimal) -> Decimal:
+        return self._min_notional_with_fee / price
+
+    def _count_orders_by_side(self) -> Counter[str]:
+        # One pass over the open orders for both sides.
+        return Counter(order.side.lower() for order in self.state.open_orders.values())
 
     def _refresh_balances(self, now: float) -> None:
         if now - self._last_balance_refresh < self.config.balance_refresh_sec:
@@ -718,11 +734,11 @@ class LadderGridStrategy:
     ) -> bool:
         if not self._balances:
             return True
-        base, quote = self._split_symbol(self.config.symbol)
+        base, quote = self._assets
         if side.lower() == "buy":
-            available = self._balances.get(quote, (Decimal("0"), Decimal("0")))[0]
+            available = self._balances.get(quote, _NO_BALANCE)[0]
             return available >= price * quantity
-        available = self._balances.get(base, (Decimal("0"), Decimal("0")))[0]
+        available = self._balances.get(base, _NO_BALANCE)[0]
         return available >= quantity
 
     @staticmethod
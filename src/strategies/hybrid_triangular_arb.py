@@ -7,6 +7,9 @@ from decimal import Decimal
 from enum import Enum
 from typing import NamedTuple
 
+_ONE = Decimal("1")
+_HUNDRED = Decimal("100")
+
 
 class LegType(Enum):
     """Type of trading leg in arbitrage cycle."""
@@ -40,6 +43,13 @@ class TradeLeg:
     slippage_pct: Decimal = Decimal("0")  # Price impact for pools
 
 
+class OrderBookQuote(NamedTuple):
+    """Best bid and ask of an order book pair."""
+
+    bid: Decimal
+    ask: Decimal
+
+
 class ArbitrageCycle(NamedTuple):
     """Complete arbitrage cycle with 3 legs."""
 
@@ -128,25 +138,14 @@ def calculate_leg_output(leg: TradeLeg, input_amount: Decimal) -> Decimal:
     if leg.price is None or leg.price <= 0:
         return Decimal("0")
 
-    # Apply price conversion
-    if leg.side == TradeSide.BUY:
-        # Buying: spend input to get output
-        # Example: Buy COSA with USDT at price 2 COSA/USDT (token per base)
-        output = input_amount * leg.price
-    else:
-        # Selling: sell input to get output
-        # Example: Sell COSA for USDT at price 0.5 USDT/COSA
-        # output = input * price
-        output = input_amount * leg.price
-
-    # Apply fee
-    output = output * (Decimal("1") - leg.fee_rate)
-
-    # Apply slippage for pool swaps
+    # Both sides multiply by the leg price: BUY legs carry token per base
+    # (e.g. 2 COSA/USDT), SELL legs base per token (e.g. 0.5 USDT/COSA).
+    # The fee and pool slippage fold into one retained fraction.
+    retained = _ONE - leg.fee_rate
     if leg.leg_type == LegType.POOL_SWAP:
-        output = output * (Decimal("1") - leg.slippage_pct / Decimal("100"))
+        retained *= _ONE - leg.slippage_pct / _HUNDRED
 
-    return output
+    return input_amount * leg.price * retained
 
 
 def evaluate_cycle(
@@ -192,9 +191,7 @@ def evaluate_cycle(
     # Calculate profit
     net_profit = final_amount - start_amount
     profit_pct = (
-        (net_profit / start_amount * Decimal("100"))
-        if start_amount > 0
-        else Decimal("0")
+        (net_profit / start_amount * _HUNDRED) if start_amount > 0 else Decimal("0")
     )
 
     # Generate cycle ID
@@ -253,6 +250,36 @@ def evaluate_cycle(
     )
 
 
+def cycle_return_bound(
+    buy_ask: float,
+    pool_spot_rate: float,
+    sell_bid: float,
+    orderbook_fee: float,
+    pool_fee: float,
+) -> float:
+    """
+    Upper bound on a cycle's return ratio, in float arithmetic.
+
+    Buying at ``buy_ask``, swapping at the pool's spot rate (output per input,
+    before fee and price impact) and selling at ``sell_bid`` returns at most
+    this multiple of the start amount: a real swap quote only does worse than
+    spot. A bound below ``1 + threshold`` rules the cycle out before any of
+    the Decimal work in :func:`evaluate_cycle`.
+
+    Returns:
+        Return ratio (e.g. 1.004 for +0.4%), or 0.0 for a non-positive price
+    """
+    if buy_ask <= 0 or pool_spot_rate <= 0 or sell_bid <= 0:
+        return 0.0
+    return (
+        pool_spot_rate
+        * sell_bid
+        / buy_ask
+        * (1.0 - orderbook_fee) ** 2
+        * (1.0 - pool_fee)
+    )
+
+
 def find_best_cycle(cycles: list[ArbitrageCycle]) -> ArbitrageCycle | None:
     """
     Find the most profitable cycle from a list.
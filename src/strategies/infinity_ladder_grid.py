@@ -20,6 +20,7 @@ import time
 import uuid
 from dataclasses import dataclass, field
 from decimal import ROUND_DOWN, ROUND_UP, Decimal
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -283,6 +284,16 @@ class InfinityLadderGridStrategy:
             return self.config.min_base_order_qty
         return None
 
+    @cached_property
+    def _min_base_quantized(self) -> Decimal | None:
+        """Hybrid-sizing minimum rounded up to the step size, once per config."""
+        min_base = self._resolve_min_base_order_qty()
+        if min_base is None or self.config.step_size <= 0:
+            return min_base
+        return (min_base / self.config.step_size).quantize(
+            Decimal("1"), rounding=ROUND_UP
+        ) * self.config.step_size
+
     def _resolve_order_quantity(self, side: str, price: Decimal) -> Decimal | None:
         """Resolve order quantity using side-specific sizing and exchange guards."""
         sizing_mode = self._resolve_sizing_mode(side).lower()
@@ -297,17 +308,11 @@ class InfinityLadderGridStrategy:
                 return None
             quantity = target_quote / price
             if sizing_mode == "hybrid":
-                min_base = self._resolve_min_base_order_qty()
-                if min_base is None:
+                min_base_quantized = self._min_base_quantized
+                if min_base_quantized is None:
                     raise ValueError(
                         "min_base_order_qty is required for hybrid sizing mode."
                     )
-                if self.config.step_size > 0:
-                    min_base_quantized = (min_base / self.config.step_size).quantize(
-                        Decimal("1"), rounding=ROUND_UP
-                    ) * self.config.step_size
-                else:
-                    min_base_quantized = min_base
                 quantity = max(min_base_quantized, quantity)
 
         quantity = self._quantize_quantity(quantity)
@@ -522,24 +527,32 @@ class InfinityLadderGridStrategy:
 
     def _build_buy_levels(self, mid_price: Decimal) -> list[tuple[str, Decimal]]:
         """Build buy levels below mid price down to lowest_buy_price."""
-        step = self._get_step_size(mid_price)
-        levels = []
-        for i in range(1, self.config.n_buy_levels + 1):
-            price = mid_price * (Decimal("1") - step * i)
-            if price >= self.state.lowest_buy_price:
-                levels.append(("buy", price))
-        return levels
+        prices = self._ladder_prices(mid_price, self.config.n_buy_levels, upward=False)
+        return [
+            ("buy", price) for price in prices if price >= self.state.lowest_buy_price
+        ]
 
     def _build_initial_sell_levels(
         self, mid_price: Decimal
     ) -> list[tuple[str, Decimal]]:
         """Build initial sell levels above mid price."""
-        step = self._get_step_size(mid_price)
-        levels = []
-        for i in range(1, self.config.initial_sell_levels + 1):
-            price = mid_price * (Decimal("1") + step * i)
-            levels.append(("sell", price))
-        return levels
+        prices = self._ladder_prices(
+            mid_price, self.config.initial_sell_levels, upward=True
+        )
+        return [("sell", price) for price in prices]
+
+    def _ladder_prices(
+        self, mid_price: Decimal, count: int, *, upward: bool
+    ) -> list[Decimal]:
+        """Return ``count`` level prices stepping away from ``mid_price``.
+
+        The per-level distance is computed once, so each level costs a single
+        multiply and add.
+        """
+        delta = mid_price * self._get_step_size(mid_price)
+        if not upward:
+            delta = -delta
+        return [mid_price + delta * i for i in range(1, count + 1)]
 
     def _validate_profitability(self, mid_price: Decimal) -> None:
         """Validate that grid spacing is sufficient for profitability."""
@@ -664,11 +677,12 @@ class InfinityLadderGridStrategy:
             if order.side == "buy"
         }
         self._sync_client_order_counter(list(self.state.open_orders.keys()))
-        step = self._get_step_size(mid_price)
         target_levels = [
-            self._quantize_price(mid_price * (Decimal("1") - step * i))
-            for i in range(1, self.config.n_buy_levels + 1)
-            if mid_price * (Decimal("1") - step * i) < self.state.lowest_buy_price
+            self._quantize_price(price)
+            for price in self._ladder_prices(
+                mid_price, self.config.n_buy_levels, upward=False
+            )
+            if price < self.state.lowest_buy_price
         ]
         levels_to_add = [
             price for price in target_levels if price not in existing_buy_prices
@@ -2,9 +2,21 @@
 
 from __future__ import annotations
 
+import math
+import re
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Iterable
+from typing import Iterable, Mapping, Sequence
+
+# Float screening margin: cycles within this of the threshold are still
+# evaluated exactly with Decimal.
+FLOAT_SCREEN_SLACK = 1e-9
+
+_PAIR_SEPARATOR = re.compile(r"[/_-]")
+
+# A triangle leg is (pair, invert): ``invert`` means quote -> base, i.e. buying
+# the base asset at rate 1 / price; otherwise base -> quote at the price.
+TriangleLeg = tuple[str, bool]
 
 
 @dataclass(frozen=True)
@@ -57,6 +69,219 @@ def evaluate_cycle(
     return amount
 
 
+def cycle_return_ratio(rates: Sequence[float], fee_factor: float) -> float:
+    """Return a cycle's gross return ratio in float arithmetic.
+
+    The result of chaining conversions collapses to the product of the leg
+    rates times ``fee_factor`` (``1 - fee_rate``) once per leg, so it can be
+    computed cheaply for every candidate before any Decimal work.
+    """
+    ratio = 1.0
+    for rate in rates:
+        ratio *= rate
+    return ratio * fee_factor ** len(rates)
+
+
+def scan_cycle_returns(
+    cycles: Iterable[tuple[str, str, str]],
+    rates: dict[str, Decimal | int | str],
+    fee_rate: Decimal | int | str,
+) -> list[tuple[float, tuple[str, str, str]]]:
+    """Return ``(return_ratio, cycle)`` for every cycle, best first.
+
+    Only the rates of pairs used by ``cycles`` are validated.
+    """
+    fee = _to_decimal(fee_rate)
+    if fee < 0:
+        raise ValueError("fee_rate must be non-negative")
+    fee_factor = 1.0 - float(fee)
+    float_rates: dict[str, float] = {}
+    scored = []
+    for cycle in cycles:
+        cycle_rates = []
+        for pair in cycle:
+            value = float_rates.get(pair)
+            if value is None:
+                value = float(_to_decimal(rates[pair]))
+                if value <= 0:
+                    raise ValueError("rates must be positive")
+                float_rates[pair] = value
+            cycle_rates.append(value)
+        scored.append((cycle_return_ratio(cycle_rates, fee_factor), cycle))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return scored
+
+
+def _split_pair(pair: str) -> tuple[str, str]:
+    base, quote = _PAIR_SEPARATOR.split(pair, maxsplit=1)
+    return base.upper(), quote.upper()
+
+
+def find_triangles(
+    pairs: Iterable[str], start_asset: str
+) -> list[tuple[TriangleLeg, TriangleLeg, TriangleLeg]]:
+    """Enumerate every three-leg cycle from ``start_asset`` back to itself.
+
+    ``pairs`` are market symbols such as ``ETH/USDT``, ``ETH-USDT`` or
+    ``ETH_USDT``; each market can be traded in either direction. The result is
+    meant to be built once per market list and scored with a
+    :class:`TriangleScanner` on every price update.
+    """
+    start = start_asset.upper()
+    edges: dict[str, list[tuple[str, TriangleLeg]]] = {}
+    for pair in pairs:
+        base, quote = _split_pair(pair)
+        edges.setdefault(base, []).append((quote, (pair, False)))
+        edges.setdefault(quote, []).append((base, (pair, True)))
+
+    triangles = []
+    for first_asset, first in edges.get(start, ()):
+        for second_asset, second in edges.get(first_asset, ()):
+            if second_asset in (start, first_asset):
+                continue
+            for third_asset, third in edges.get(second_asset, ()):
+                if third_asset == start and len({first[0], second[0], third[0]}) == 3:
+                    triangles.append((first, second, third))
+    return triangles
+
+
+class TriangleScanner:
+    """Score a fixed set of triangles against changing prices.
+
+    Built once per triangle list: each leg is compiled to an index into one
+    flat list of rates laid out as ``[p0, 1/p0, p1, 1/p1, ...]`` (one slot
+    per market and direction). A scan then fills that list once from the
+    prices and scores every triangle with three indexed loads and multiplies,
+    without any per-leg dict lookups.
+    """
+
+    def __init__(self, triangles: Sequence[Sequence[TriangleLeg]]) -> None:
+        self.triangles = list(triangles)
+        self.pairs: list[str] = []
+        slots: dict[str, int] = {}
+        self._legs: list[tuple[int, ...]] = []
+        for legs in self.triangles:
+            indices = []
+            for pair, invert in legs:
+                if pair not in slots:
+                    slots[pair] = len(self.pairs)
+                    self.pairs.append(pair)
+                indices.append(2 * slots[pair] + int(invert))
+            self._legs.append(tuple(indices))
+
+    def scan(
+        self,
+        prices: Mapping[str, Decimal | float | int | str],
+        fee_rate: Decimal | float | int | str,
+    ) -> list[float]:
+        """Return the fee-adjusted float return ratio of each triangle.
+
+        A triangle whose markets are not all priced scores ``0.0``.
+        """
+        fee_factor_cubed = (1.0 - float(fee_rate)) ** 3
+        rates = [0.0] * (2 * len(self.pairs))
+        for slot, pair in enumerate(self.pairs):
+            price = prices.get(pair)
+            value = 0.0 if price is None else float(price)
+            if value > 0:
+                rates[2 * slot] = value
+                rates[2 * slot + 1] = 1.0 / value
+        return [
+            rates[first] * rates[second] * rates[third] * fee_factor_cubed
+            for first, second, third in self._legs
+        ]
+
+    def best(
+        self,
+        prices: Mapping[str, Decimal | float | int | str],
+        fee_rate: Decimal | float | int | str,
+    ) -> tuple[float, tuple[TriangleLeg, ...]] | None:
+        """Return ``(return_ratio, triangle)`` for the highest-scoring triangle."""
+        if not self.triangles:
+            return None
+        scores = self.scan(prices, fee_rate)
+        index = max(range(len(scores)), key=scores.__getitem__)
+        return scores[index], tuple(self.triangles[index])
+
+
+def find_negative_cycle(
+    pairs: Iterable[str],
+    prices: Mapping[str, Decimal | float | int | str],
+    fee_rate: Decimal | float | int | str,
+) -> list[TriangleLeg] | None:
+    """Return the legs of a profitable cycle of any length, or None.
+
+    Every market gives two edges (base -> quote at the price, quote -> base at
+    its reciprocal) weighted ``-log(rate * (1 - fee_rate))``; a cycle whose
+    weights sum below zero returns more than it started with. Bellman-Ford
+    from a virtual source finds such a cycle in O(assets * markets).
+    """
+    log_fee = math.log(1.0 - float(fee_rate))
+    edges: list[tuple[str, str, float, TriangleLeg]] = []
+    for pair in pairs:
+        price = prices.get(pair)
+        if price is None or float(price) <= 0:
+            continue
+        base, quote = _split_pair(pair)
+        log_price = math.log(float(price))
+        edges.append((base, quote, -(log_price + log_fee), (pair, False)))
+        edges.append((quote, base, -(log_fee - log_price), (pair, True)))
+    if not edges:
+        return None
+
+    assets = {asset for edge in edges for asset in edge[:2]}
+    distance = dict.fromkeys(assets, 0.0)
+    predecessor: dict[str, tuple[str, TriangleLeg]] = {}
+    relaxed_asset = None
+    for _ in range(len(assets)):
+        relaxed_asset = None
+        for source, target, weight, leg in edges:
+            candidate = distance[source] + weight
+            if candidate < distance[target] - FLOAT_SCREEN_SLACK:
+                distance[target] = candidate
+                predecessor[target] = (source, leg)
+                relaxed_asset = target
+        if relaxed_asset is None:
+            return None
+
+    # Still relaxing after |assets| passes: walk back far enough to be
+    # certain of standing on the cycle, then collect it.
+    asset = relaxed_asset
+    for _ in range(len(assets)):
+        asset = predecessor[asset][0]
+    cycle: list[TriangleLeg] = []
+    current = asset
+    while True:
+        previous, leg = predecessor[current]
+        cycle.append(leg)
+        current = previous
+        if current == asset:
+            break
+    cycle.reverse()
+    return cycle
+
+
+class NegativeCycleDetector:
+    """Run :func:`find_negative_cycle` only when a watched price changes."""
+
+    def __init__(
+        self, pairs: Iterable[str], fee_rate: Decimal | float | int | str
+    ) -> None:
+        self.pairs = tuple(pairs)
+        self.fee_rate = fee_rate
+        self._last_prices: tuple | None = None
+        self._last_cycle: list[TriangleLeg] | None = None
+
+    def detect(
+        self, prices: Mapping[str, Decimal | float | int | str]
+    ) -> list[TriangleLeg] | None:
+        key = tuple(prices.get(pair) for pair in self.pairs)
+        if key != self._last_prices:
+            self._last_prices = key
+            self._last_cycle = find_negative_cycle(self.pairs, prices, self.fee_rate)
+        return self._last_cycle
+
+
 def find_profitable_cycle(
     *,
     cycles: Iterable[tuple[str, str, str]],
@@ -65,7 +290,11 @@ def find_profitable_cycle(
     fee_rate: Decimal | int | str,
     profit_threshold: Decimal | int | str,
 ) -> CyclePlan | None:
-    """Find a profitable cycle and return the order sequence."""
+    """Find a profitable cycle and return the order sequence.
+
+    Every cycle is first scored with the float return ratio; only cycles that
+    could clear ``profit_threshold`` are re-evaluated exactly in Decimal.
+    """
     threshold = _to_decimal(profit_threshold)
     if threshold < 0:
         raise ValueError("profit_threshold must be non-negative")
@@ -73,8 +302,12 @@ def find_profitable_cycle(
     best_plan: CyclePlan | None = None
     start = _to_decimal(start_amount)
     fee = _to_decimal(fee_rate)
+    float_threshold = float(threshold) - FLOAT_SCREEN_SLACK
 
-    for cycle in cycles:
+    for ratio, cycle in scan_cycle_returns(cycles, rates, fee):
+        if ratio - 1.0 < float_threshold:
+            # Scores are sorted, so no remaining cycle can qualify.
+            break
         final_amount = evaluate_cycle(
             start_amount=start,
             rates=rates,
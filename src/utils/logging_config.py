@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import logging.handlers
+import queue
 import sys
 import threading
 from typing import Any
 
+# Listener draining the log queue when setup_logging(queued=True) is used.
+_QUEUE_LISTENER: logging.handlers.QueueListener | None = None
+
 
 class StructuredFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
@@ -112,6 +118,7 @@ def setup_logging(
     structured: bool = False,
     sanitize: bool = True,
     log_file: str | None = None,
+    queued: bool = False,
 ) -> None:
     """
     Configure logging for the application.
@@ -121,10 +128,17 @@ def setup_logging(
         structured: Use JSON structured logging
         sanitize: Sanitize sensitive data from logs
         log_file: Optional file path for log output
+        queued: Hand records to a background thread that formats and writes
+            them, so logging calls never block on stdout or the log file
     """
+    global _QUEUE_LISTENER
+
     # Clear any existing handlers
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
+    if _QUEUE_LISTENER is not None:
+        _QUEUE_LISTENER.stop()
+        _QUEUE_LISTENER = None
 
     # Set level
     log_level = getattr(logging, level.upper(), logging.INFO)
@@ -168,6 +182,16 @@ def setup_logging(
                 "Failed to set up file logging to %s: %s", log_file, exc
             )
 
+    if queued:
+        handlers = list(root_logger.handlers)
+        root_logger.handlers.clear()
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _QUEUE_LISTENER = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _QUEUE_LISTENER.start()
+
     # Set specific logger levels
     # Silence overly verbose libraries
     logging.getLogger("aiohttp").setLevel(logging.WARNING)
@@ -175,6 +199,13 @@ def setup_logging(
     logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 
+@atexit.register
+def _stop_queue_listener() -> None:
+    # Flush records still queued when the process exits.
+    if _QUEUE_LISTENER is not None:
+        _QUEUE_LISTENER.stop()
+
+
 def get_logger(name: str) -> logging.LoggerAdapter:
     """
     Get a logger with extra context support.
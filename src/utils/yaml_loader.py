@@ -0,0 +1,26 @@
+"""YAML config loading through libyaml's C parser when it is available."""
+
+from __future__ import annotations
+
+import logging
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+LOGGER = logging.getLogger("nonkyc_bot.utils.yaml_loader")
+
+_LOGGED_LOADER = False
+
+
+def safe_load(stream: IO[str] | str) -> Any:
+    """Parse YAML like :func:`yaml.safe_load`, using the C loader if built."""
+    global _LOGGED_LOADER
+    if not _LOGGED_LOADER:
+        _LOGGED_LOADER = True
+        LOGGER.debug("Loading YAML with %s", SafeLoader.__name__)
+    return yaml.load(stream, Loader=SafeLoader)
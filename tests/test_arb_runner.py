@@ -27,12 +27,22 @@ def test_evaluate_profitability_executes_without_prompt(monkeypatch) -> None:
     current_balance = Decimal("100")
 
     def fake_execute_arbitrage(
-        client, config_arg, prices_arg, start_amount, mode="live"
+        client,
+        config_arg,
+        prices_arg,
+        start_amount,
+        mode="live",
+        min_quantities=None,
+        settings=None,
     ):
         called["value"] = True
         assert config_arg is config
+        # The settings parsed for the evaluation are passed through too.
+        assert settings is not None and settings.pair_ab == config["pair_ab"]
         assert prices_arg == prices
         assert start_amount == current_balance
+        # The minimums sized for the fee-adjusted check are passed through.
+        assert set(min_quantities) == set(prices)
         # Return a profitable amount
         return Decimal("120")
 
@@ -51,3 +61,186 @@ def test_evaluate_profitability_executes_without_prompt(monkeypatch) -> None:
 
     assert result == Decimal("120")
     assert called["value"] is True
+
+
+def test_evaluate_profitability_rejects_unprofitable_cycle_early(monkeypatch) -> None:
+    config = {
+        "asset_a": "USDT",
+        "asset_b": "ETH",
+        "asset_c": "BTC",
+        "pair_ab": "ETH/USDT",
+        "pair_bc": "ETH/BTC",
+        "pair_ac": "BTC/USDT",
+        "min_profitability": "0.001",
+        "fee_rate": "0.002",
+    }
+    prices = {
+        "ETH/USDT": Decimal("100"),
+        "ETH/BTC": Decimal("0.1"),
+        "BTC/USDT": Decimal("1000"),
+    }
+
+    def fail(*args, **kwargs):
+        raise AssertionError("unprofitable cycle should not reach Decimal checks")
+
+    monkeypatch.setattr(run_arb_bot, "execute_arbitrage", fail)
+
+    result = run_arb_bot.evaluate_profitability_and_execute(
+        client=object(),
+        config=config,
+        prices=prices,
+        current_balance=Decimal("100"),
+    )
+
+    assert result is None
+
+
+def test_execute_arbitrage_sizes_next_leg_from_fill() -> None:
+    from nonkyc_client.models import OrderResponse, OrderStatus
+
+    class _FillingClient:
+        def __init__(self) -> None:
+            self.orders = []
+
+        def place_order(self, order):
+            self.orders.append(order)
+            return OrderResponse(
+                order_id=str(len(self.orders)), symbol=order.symbol, status="New"
+            )
+
+        def get_order_status(self, order_id: str) -> OrderStatus:
+            order = self.orders[int(order_id) - 1]
+            # Leg 1 only fills half of what was requested.
+            filled = Decimal(order.quantity) / (2 if order_id == "1" else 1)
+            return OrderStatus(
+                order_id=order_id,
+                symbol=order.symbol,
+                status="Filled",
+                filled_quantity=str(filled),
+            )
+
+    config = {
+        "asset_a": "USDT",
+        "asset_b": "ETH",
+        "asset_c": "BTC",
+        "pair_ab": "ETH/USDT",
+        "pair_bc": "ETH/BTC",
+        "pair_ac": "BTC/USDT",
+        "min_profitability": "0.001",
+        "fee_rate": "0.002",
+        "min_notional_usd": "0.01",
+    }
+    prices = {
+        "ETH/USDT": Decimal("100"),
+        "ETH/BTC": Decimal("0.1"),
+        "BTC/USDT": Decimal("1000"),
+    }
+    client = _FillingClient()
+
+    result = run_arb_bot.execute_arbitrage(client, config, prices, Decimal("100"))
+
+    fee_factor = Decimal("0.998")
+    assert [order.symbol for order in client.orders] == list(prices)
+    assert Decimal(client.orders[0].quantity) == Decimal("1")
+    assert Decimal(client.orders[1].quantity) == Decimal("0.5") * fee_factor
+    assert result == Decimal("0.5") * fee_factor**3 * 100
+
+
+def test_wait_for_fill_uses_filled_place_order_response() -> None:
+    from nonkyc_client.models import OrderResponse
+
+    class _NoStatusClient:
+        def get_order_status(self, order_id: str):
+            raise AssertionError("filled orders should not be polled")
+
+    placed = OrderResponse(
+        order_id="1",
+        symbol="ETH/USDT",
+        status="Filled",
+        raw_payload={"filled": "0.75", "avgPrice": "101.5"},
+    )
+
+    fill = run_arb_bot._wait_for_fill(
+        _NoStatusClient(), "1", Decimal("1"), 1.0, 0.01, 0.1, placed=placed
+    )
+
+    assert fill == (Decimal("0.75"), Decimal("101.5"))
+
+
+def test_wait_for_fill_cancels_order_open_at_timeout(caplog) -> None:
+    import logging
+
+    from nonkyc_client.models import OrderCancelResult, OrderStatus
+
+    class _OpenOrderClient:
+        def __init__(self) -> None:
+            self.cancelled: list[str] = []
+
+        def get_order_status(self, order_id: str) -> OrderStatus:
+            return OrderStatus(
+                order_id=order_id,
+                symbol="ETH/USDT",
+                status="Partly Filled",
+                filled_quantity="0.25",
+            )
+
+        def cancel_order(self, order_id: str) -> OrderCancelResult:
+            self.cancelled.append(order_id)
+            return OrderCancelResult(order_id=order_id, success=True)
+
+    client = _OpenOrderClient()
+
+    with caplog.at_level(logging.ERROR):
+        fill = run_arb_bot._wait_for_fill(client, "7", Decimal("1"), 0.0, 0.01, 0.1)
+
+    assert fill is None
+    assert client.cancelled == ["7"]
+    assert any("partial fill of 0.25" in r.getMessage() for r in caplog.records)
+
+
+def test_execute_arbitrage_sizes_next_leg_from_fill_price() -> None:
+    from nonkyc_client.models import OrderResponse
+
+    fill_prices = {"ETH/USDT": "100", "ETH/BTC": "0.09", "BTC/USDT": "1000"}
+
+    class _MarketClient:
+        def __init__(self) -> None:
+            self.orders = []
+
+        def place_order(self, order):
+            self.orders.append(order)
+            return OrderResponse(
+                order_id=str(len(self.orders)),
+                symbol=order.symbol,
+                status="Filled",
+                raw_payload={
+                    "filled": order.quantity,
+                    "avgPrice": fill_prices[order.symbol],
+                },
+            )
+
+    config = {
+        "asset_a": "USDT",
+        "asset_b": "ETH",
+        "asset_c": "BTC",
+        "pair_ab": "ETH/USDT",
+        "pair_bc": "ETH/BTC",
+        "pair_ac": "BTC/USDT",
+        "min_profitability": "0.001",
+        "fee_rate": "0.002",
+        "min_notional_usd": "0.01",
+    }
+    prices = {
+        "ETH/USDT": Decimal("100"),
+        "ETH/BTC": Decimal("0.1"),
+        "BTC/USDT": Decimal("1000"),
+    }
+    client = _MarketClient()
+
+    result = run_arb_bot.execute_arbitrage(client, config, prices, Decimal("100"))
+
+    # Leg 2 filled at 0.09, not the quoted 0.1, and leg 3 sells what it paid.
+    fee_factor = Decimal("0.998")
+    btc_received = fee_factor * Decimal("0.09") * fee_factor
+    assert Decimal(client.orders[2].quantity) == btc_received
+    assert result == btc_received * 1000 * fee_factor
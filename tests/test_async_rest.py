@@ -220,3 +220,23 @@ async def test_async_rest_market_data_uses_bid_ask_mid_when_last_missing() -> No
     ticker = await client.get_market_data("ETH/USD")
 
     assert ticker.last_price == "205"
+
+
+@pytest.mark.asyncio
+async def test_async_rest_market_data_many_skips_failed_symbols() -> None:
+    session = FakeSession(
+        [
+            FakeResponse(200, {"data": {"symbol": "ETH/USD", "last_price": "200"}}),
+            FakeResponse(404, {"error": "unknown symbol"}),
+            FakeResponse(200, {"data": {"symbol": "BTC/USD", "last_price": "3000"}}),
+        ]
+    )
+    client = AsyncRestClient(base_url="https://api.example", session=session)
+
+    tickers = await client.get_market_data_many(["ETH/USD", "XXX/USD", "BTC/USD"])
+
+    assert {symbol: t.last_price for symbol, t in tickers.items()} == {
+        "ETH/USD": "200",
+        "BTC/USD": "3000",
+    }
+    assert len(session.requests) == 3
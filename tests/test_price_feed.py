@@ -0,0 +1,246 @@
+"""Tests for the WebSocket price feeds."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from engine.price_feed import OrderBookPriceFeed, TickerPriceFeed, build_price_feed
+from nonkyc_client.ws import WebSocketClient
+
+
+def _feed() -> OrderBookPriceFeed:
+    return OrderBookPriceFeed(
+        ["ETH/USDT", "ETH/BTC"], WebSocketClient(url="wss://ws.example")
+    )
+
+
+def test_snapshot_sets_mid_price_and_signals_update() -> None:
+    feed = _feed()
+    feed.handle_message(
+        {
+            "method": "snapshotOrderbook",
+            "params": {
+                "symbol": "ETH/USDT",
+                "bids": [{"price": "1999", "quantity": "1"}],
+                "asks": [{"price": "2001", "quantity": "2"}],
+            },
+        }
+    )
+
+    assert feed.prices() == {"ETH/USDT": Decimal("2000")}
+    assert feed.wait_for_update(0) is True
+    assert feed.wait_for_update(0) is False
+
+
+def test_update_applies_levels_and_removes_zero_quantity() -> None:
+    feed = _feed()
+    feed.handle_message(
+        {
+            "method": "snapshotOrderbook",
+            "params": {
+                "symbol": "ETH/BTC",
+                "bids": [["0.049", "1"], ["0.048", "1"]],
+                "asks": [["0.051", "1"]],
+            },
+        }
+    )
+    feed.handle_message(
+        {
+            "method": "updateOrderbook",
+            "params": {
+                "symbol": "ETH/BTC",
+                "bids": [{"price": "0.049", "quantity": "0"}],
+                "asks": [{"price": "0.050", "quantity": "3"}],
+            },
+        }
+    )
+
+    assert feed.prices() == {"ETH/BTC": Decimal("0.049")}
+
+
+def test_ignores_unknown_symbols() -> None:
+    feed = _feed()
+    feed.handle_message(
+        {
+            "method": "snapshotOrderbook",
+            "params": {
+                "symbol": "BTC/USDT",
+                "bids": [["1", "1"]],
+                "asks": [["2", "1"]],
+            },
+        }
+    )
+
+    assert feed.prices() == {}
+    assert feed.wait_for_update(0) is False
+
+
+def test_ticker_feed_tracks_last_price() -> None:
+    ws_client = WebSocketClient(url="wss://ws.example")
+    feed = TickerPriceFeed(["ETH/USDT"], ws_client)
+    feed._subscribe("ETH/USDT")
+    assert ws_client.subscription_payloads() == [
+        {"method": "subscribeTicker", "params": {"symbol": "ETH/USDT"}}
+    ]
+
+    feed.handle_message(
+        {"method": "ticker", "params": {"symbol": "ETH/USDT", "last": "2000.5"}}
+    )
+    feed.handle_message(
+        {"method": "ticker", "params": {"symbol": "BTC/USDT", "last": "40000"}}
+    )
+    feed.handle_message({"method": "ticker", "params": {"symbol": "ETH/USDT"}})
+
+    assert feed.prices() == {"ETH/USDT": Decimal("2000.5")}
+    assert feed.wait_for_update(0) is True
+
+
+def test_price_expires_without_new_messages(monkeypatch) -> None:
+    import engine.price_feed as price_feed
+
+    now = {"value": 100.0}
+    monkeypatch.setattr(price_feed.time, "monotonic", lambda: now["value"])
+    feed = TickerPriceFeed(["ETH/USDT"], WebSocketClient(url="wss://ws.example"))
+    feed.handle_message(
+        {"method": "ticker", "params": {"symbol": "ETH/USDT", "last": "2000"}}
+    )
+
+    now["value"] = 104.0
+    assert feed.price("ETH/USDT", max_age=5.0) == Decimal("2000")
+    now["value"] = 106.0
+    assert feed.price("ETH/USDT", max_age=5.0) is None
+    assert feed.price("ETH/USDT") == Decimal("2000")
+
+    # An unchanged price still confirms the entry is current.
+    feed.handle_message(
+        {"method": "ticker", "params": {"symbol": "ETH/USDT", "last": "2000"}}
+    )
+    assert feed.price("ETH/USDT", max_age=5.0) == Decimal("2000")
+
+
+def test_build_price_feed_defaults_to_rest() -> None:
+    assert build_price_feed({}, ["ETH/USDT"]) is None
+    assert build_price_feed({"price_feed": "rest"}, ["ETH/USDT"]) is None
+
+
+def test_orderbook_feed_tracks_best_bid_and_ask() -> None:
+    feed = _feed()
+    feed.handle_message(
+        {
+            "method": "snapshotOrderbook",
+            "params": {
+                "symbol": "ETH/USDT",
+                "bids": [["1999", "1"]],
+                "asks": [["2001", "1"]],
+            },
+        }
+    )
+    assert feed.wait_for_update(0) is True
+
+    # Widening the spread symmetrically leaves the mid price unchanged but
+    # still counts as an update.
+    feed.handle_message(
+        {
+            "method": "snapshotOrderbook",
+            "params": {
+                "symbol": "ETH/USDT",
+                "bids": [["1998", "1"]],
+                "asks": [["2002", "1"]],
+            },
+        }
+    )
+
+    assert feed.top("ETH/USDT") == (Decimal("1998"), Decimal("2002"))
+    assert feed.top("ETH/BTC") is None
+    assert feed.prices() == {"ETH/USDT": Decimal("2000")}
+    assert feed.wait_for_update(0) is True
+
+
+def test_wait_for_update_coalesces_burst(monkeypatch) -> None:
+    import engine.price_feed as price_feed
+
+    feed = _feed()
+    feed.coalesce = 0.025
+
+    def book(price: str) -> dict:
+        return {
+            "method": "snapshotOrderbook",
+            "params": {
+                "symbol": "ETH/USDT",
+                "bids": [[price, "1"]],
+                "asks": [[price, "1"]],
+            },
+        }
+
+    feed.handle_message(book("2000"))
+    # A message landing inside the window is folded into this wake-up.
+    monkeypatch.setattr(
+        price_feed.time, "sleep", lambda seconds: feed.handle_message(book("2001"))
+    )
+
+    assert feed.wait_for_update(0) is True
+    assert feed.prices() == {"ETH/USDT": Decimal("2001")}
+    assert feed.wait_for_update(0) is False
+
+
+def test_build_price_feed_sets_coalesce_window(monkeypatch) -> None:
+    monkeypatch.setattr(OrderBookPriceFeed, "start", lambda self: None)
+
+    feed = build_price_feed(
+        {"price_feed": "websocket", "price_feed_coalesce_ms": 50}, ["ETH/USDT"]
+    )
+
+    assert feed is not None
+    assert feed.coalesce == 0.05
+
+
+def test_orderbook_feed_top_matches_full_book_over_random_updates() -> None:
+    import random
+
+    rng = random.Random(7)
+    feed = _feed()
+    bids: dict[Decimal, Decimal] = {}
+    asks: dict[Decimal, Decimal] = {}
+
+    def levels(side: dict[Decimal, Decimal], low: int, high: int) -> list:
+        changes = []
+        for _ in range(rng.randint(0, 3)):
+            price = Decimal(rng.randint(low, high))
+            quantity = Decimal(rng.choice([0, 0, 1, 2]))
+            changes.append([str(price), str(quantity)])
+            if quantity:
+                side[price] = quantity
+            else:
+                side.pop(price, None)
+        return changes
+
+    for step in range(300):
+        method = "snapshotOrderbook" if step % 100 == 0 else "updateOrderbook"
+        if method == "snapshotOrderbook":
+            bids.clear()
+            asks.clear()
+        feed.handle_message(
+            {
+                "method": method,
+                "params": {
+                    "symbol": "ETH/USDT",
+                    "bids": levels(bids, 1990, 1999),
+                    "asks": levels(asks, 2001, 2010),
+                },
+            }
+        )
+        if bids and asks:
+            assert feed.top("ETH/USDT") == (max(bids), min(asks))
+
+
+def test_feed_missing_a_hook_fails_on_creation() -> None:
+    from engine.price_feed import _StreamingPriceFeed
+
+    class NoSubscribeFeed(_StreamingPriceFeed):
+        def handle_message(self, payload: dict) -> None:
+            return None
+
+    with pytest.raises(TypeError, match="_subscribe"):
+        NoSubscribeFeed(["ETH/USDT"], WebSocketClient(url="wss://ws.example"))
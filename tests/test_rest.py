@@ -7,15 +7,28 @@ import hmac
 import http.client
 import json
 import socket
+import threading
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any, Literal
 from unittest.mock import patch
-from urllib.error import URLError
+from urllib.error import HTTPError, URLError
+from urllib.request import Request
 
 import pytest
 
+from engine.rest_client_factory import build_exchange_client, build_rest_client
+from nonkyc_client import connection_pool
 from nonkyc_client.auth import ApiCredentials, AuthSigner
+from nonkyc_client.connection_pool import KeepAliveConnectionPool
+from nonkyc_client.constants import SERVER_TIME_URL
 from nonkyc_client.models import OrderRequest
-from nonkyc_client.rest import RestClient, RestRequest
+from nonkyc_client.rest import (
+    ConnectionDroppedError,
+    RestClient,
+    RestError,
+    RestRequest,
+)
 
 
 class FakeResponse:
@@ -128,6 +141,23 @@ def test_rest_post_signing_and_body_payload() -> None:
     assert response.order_id == "order-1"
 
 
+def test_order_request_accepts_decimal_amounts() -> None:
+    order = OrderRequest(
+        symbol="BTC/USD",
+        side="sell",
+        order_type="limit",
+        quantity=Decimal("0.50"),
+        price=Decimal("30000.1"),
+    )
+
+    assert order.quantity == "0.50"
+    assert order.to_payload()["price"] == "30000.1"
+    with pytest.raises(ValueError):
+        OrderRequest(
+            symbol="BTC/USD", side="sell", order_type="market", quantity=Decimal(0)
+        )
+
+
 def test_rest_createorder_signature_string_matches_known_good_format() -> None:
     credentials = ApiCredentials(api_key="sig-key", api_secret="sig-secret")
     signer = AuthSigner(time_provider=lambda: 1700000150.0)
@@ -571,6 +601,261 @@ def test_rest_market_data_uses_bid_ask_mid_when_last_missing() -> None:
     assert ticker.last_price == "105"
 
 
+class TestKeepAlivePool:
+    """Tests for persistent connections and the connection pools."""
+
+    def test_rest_keep_alive_reuses_connection(self) -> None:
+        client_ports: list[int] = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                client_ports.append(self.client_address[1])
+                if self.path.startswith("/missing"):
+                    body = b'{"error": "not found"}'
+                    self.send_response(404)
+                else:
+                    body = json.dumps({"data": {"path": self.path}}).encode("utf8")
+                    self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return None
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        client = RestClient(
+            base_url=f"http://127.0.0.1:{server.server_address[1]}",
+            keep_alive=True,
+            connect_timeout=1.0,
+        )
+        try:
+            first = client.send(RestRequest(method="GET", path="/ticker/ETH_USDT"))
+            second = client.send(
+                RestRequest(method="GET", path="/orderbook", params={"depth": 1})
+            )
+            with pytest.raises(RestError, match="HTTP error 404"):
+                client.send(RestRequest(method="GET", path="/missing"))
+            third = client.send(RestRequest(method="GET", path="/ticker/BTC_USDT"))
+        finally:
+            client.close()
+            server.shutdown()
+            server.server_close()
+
+        assert first["data"]["path"] == "/ticker/ETH_USDT"
+        assert second["data"]["path"] == "/orderbook?depth=1"
+        assert third["data"]["path"] == "/ticker/BTC_USDT"
+        assert len(client_ports) == 4
+        assert len(set(client_ports)) == 1
+
+    def test_keep_alive_pool_does_not_resend_post_on_dropped_connection(self) -> None:
+        posts: list[bytes] = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                body = b"{}"
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self) -> None:
+                # Act on the request, then drop the connection before replying.
+                posts.append(self.rfile.read(int(self.headers["Content-Length"])))
+                self.close_connection = True
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return None
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        pool = KeepAliveConnectionPool()
+        try:
+            pool.urlopen(Request(f"{url}/ticker"), timeout=5)
+            with pytest.raises(http.client.RemoteDisconnected):
+                pool.urlopen(
+                    Request(f"{url}/createorder", data=b'{"side": "buy"}'), timeout=5
+                )
+        finally:
+            pool.close()
+            server.shutdown()
+            server.server_close()
+
+        assert posts == [b'{"side": "buy"}']
+
+    def test_rest_send_does_not_retry_post_on_dropped_connection(self) -> None:
+        posts: list[bytes] = []
+        gets: list[str] = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                # Drop the first status request too: a GET is safe to resend.
+                gets.append(self.path)
+                if len(gets) == 2:
+                    self.close_connection = True
+                    return
+                body = b"{}"
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self) -> None:
+                # Act on the order, then drop the connection before replying.
+                posts.append(self.rfile.read(int(self.headers["Content-Length"])))
+                self.close_connection = True
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return None
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        client = RestClient(
+            base_url=f"http://127.0.0.1:{server.server_address[1]}",
+            keep_alive=True,
+            max_retries=3,
+            backoff_factor=0.0,
+        )
+        try:
+            client.send(RestRequest(method="GET", path="/ticker"))
+            with pytest.raises(ConnectionDroppedError):
+                client.send(
+                    RestRequest(
+                        method="POST", path="/createorder", body={"side": "buy"}
+                    )
+                )
+            client.send(RestRequest(method="GET", path="/getorder"))
+        finally:
+            client.close()
+            server.shutdown()
+            server.server_close()
+
+        assert len(posts) == 1
+        assert gets == ["/ticker", "/getorder", "/getorder"]
+
+    def test_http2_pool_maps_requests_and_errors(self, monkeypatch) -> None:
+        httpx = pytest.importorskip("httpx")
+        seen: list[Any] = []
+
+        def handler(request: Any) -> Any:
+            seen.append(request)
+            if request.url.path == "/missing":
+                return httpx.Response(404, content=b'{"error": "not found"}')
+            if request.url.path == "/slow":
+                raise httpx.ReadTimeout("timed out", request=request)
+            if request.url.path == "/down":
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, headers={"X-Test": "1"}, content=b'{"ok": 1}')
+
+        # The mock transport stands in for the h2-backed client.
+        monkeypatch.setattr(connection_pool, "http2_available", lambda: True)
+        pool = connection_pool.Http2ConnectionPool()
+        pool._client = httpx.Client(transport=httpx.MockTransport(handler))
+        url = "https://api.example"
+
+        response = pool.urlopen(
+            Request(
+                f"{url}/createorder?x=1",
+                data=b'{"side": "buy"}',
+                headers={"X-API-KEY": "key"},
+            )
+        )
+        assert response.status == 200
+        assert response.read() == b'{"ok": 1}'
+        assert response.headers["X-Test"] == "1"
+        assert seen[0].method == "POST"
+        assert str(seen[0].url) == f"{url}/createorder?x=1"
+        assert seen[0].content == b'{"side": "buy"}'
+        assert seen[0].headers["X-api-key"] == "key"
+
+        with pytest.raises(HTTPError) as excinfo:
+            pool.urlopen(Request(f"{url}/missing"))
+        assert excinfo.value.code == 404
+        assert excinfo.value.read() == b'{"error": "not found"}'
+        with pytest.raises(TimeoutError):
+            pool.urlopen(Request(f"{url}/slow"))
+        with pytest.raises(URLError):
+            pool.urlopen(Request(f"{url}/down"))
+
+        pool.close()
+        assert pool._client is None
+
+    def test_rest_keep_alive_ping_hits_configured_path(self) -> None:
+        pinged = threading.Event()
+        request_headers: list[str | None] = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                request_headers.append(self.headers.get("X-api-key"))
+                body = b"{}"
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                if self.path == "/getservertime":
+                    pinged.set()
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return None
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        client = RestClient(
+            base_url=f"http://127.0.0.1:{server.server_address[1]}",
+            credentials=ApiCredentials(api_key="key", api_secret="secret"),
+            keep_alive=True,
+        )
+        try:
+            client.start_keep_alive(interval=0.01, url="/getservertime")
+            assert pinged.wait(timeout=5)
+        finally:
+            client.close()
+            server.shutdown()
+            server.server_close()
+
+        assert request_headers[0] is None  # pings are not signed
+
+    def test_rest_http2_falls_back_to_keep_alive_without_httpx(
+        self, monkeypatch
+    ) -> None:
+        monkeypatch.setattr("nonkyc_client.rest.http2_available", lambda: False)
+
+        client = RestClient(base_url="https://api.example", keep_alive=True, http2=True)
+
+        assert isinstance(client._connection_pool, KeepAliveConnectionPool)
+
+    def test_build_exchange_client_shares_rest_client_pool(self) -> None:
+        config = {"sign_requests": False, "rest_pool_maxsize": 6}
+        rest_client = build_rest_client(config)
+        exchange_client = build_exchange_client(config, rest_client=rest_client)
+
+        assert exchange_client._rest is rest_client
+        assert rest_client._connection_pool._maxsize == 6
+
+    def test_build_rest_client_pings_server_time_only_when_enabled(self) -> None:
+        with patch.object(RestClient, "start_keep_alive") as start_keep_alive:
+            build_rest_client({"sign_requests": False})
+            start_keep_alive.assert_not_called()
+
+            build_rest_client({"sign_requests": False, "keep_alive_ping_sec": 15})
+            start_keep_alive.assert_called_once_with(15.0, SERVER_TIME_URL)
+
+
 class TestCloudflareErrorDetection:
     """Tests for Cloudflare transient error detection."""
 
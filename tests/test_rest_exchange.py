@@ -1,3 +1,6 @@
+from decimal import Decimal
+
+from nonkyc_client.models import MarketTicker
 from nonkyc_client.rest import RestError, RestRequest
 from nonkyc_client.rest_exchange import NonkycRestExchangeClient
 
@@ -17,3 +20,31 @@ def test_list_open_orders_returns_empty_on_not_found() -> None:
     open_orders = client.list_open_orders("BTC_USDT")
 
     assert open_orders == []
+
+
+class TickerRestClient:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_market_data(self, symbol: str) -> MarketTicker:
+        self.calls += 1
+        return MarketTicker(symbol=symbol, last_price="10", raw_payload={})
+
+
+class StubPriceFeed:
+    def __init__(self, price: Decimal | None) -> None:
+        self._price = price
+
+    def price(self, pair: str, max_age: float | None = None) -> Decimal | None:
+        return self._price
+
+
+def test_get_mid_price_prefers_fresh_streamed_price() -> None:
+    rest = TickerRestClient()
+    client = NonkycRestExchangeClient(rest, price_feed=StubPriceFeed(Decimal("11")))
+    assert client.get_mid_price("BTC_USDT") == Decimal("11")
+    assert rest.calls == 0
+
+    client.price_feed = StubPriceFeed(None)
+    assert client.get_mid_price("BTC_USDT") == Decimal("10")
+    assert rest.calls == 1
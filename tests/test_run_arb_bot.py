@@ -2,9 +2,28 @@
 
 from __future__ import annotations
 
-from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+from decimal import ROUND_DOWN, Decimal
 
-from bots.run_arb_bot import get_price
+import pytest
+
+from bots.run_arb_bot import (
+    _PRICE_CACHE,
+    _PRICE_RETRY_AFTER,
+    _build_cycle_settings,
+    _build_leg_order,
+    _current_prices,
+    _describe_cycle,
+    _float_cycle_ratio,
+    _make_rounder,
+    _price_failure_backoff,
+    _PricePrefetcher,
+    _prices_moved,
+    _should_skip_notional,
+    fetch_prices,
+    get_all_prices,
+    get_price,
+)
 from nonkyc_client.models import MarketTicker
 
 
@@ -72,3 +91,265 @@ def test_get_price_uses_orderbook_fallback() -> None:
     assert client.last_request is not None
     assert client.last_request.path == "/orderbook"
     assert client.last_request.params == {"ticker_id": "ETH-USDT", "depth": "1"}
+
+
+def test_fetch_prices_concurrently_omits_failed_pairs() -> None:
+    class _PerPairStubClient:
+        def get_market_data(self, symbol: str) -> MarketTicker:
+            if symbol == "BTC-USDT":
+                raise RuntimeError("boom")
+            return MarketTicker(
+                symbol=symbol,
+                last_price={"ETH-USDT": "3000", "ETH-BTC": "0.05"}[symbol],
+                raw_payload={},
+            )
+
+    pairs = ("ETH-USDT", "ETH-BTC", "BTC-USDT")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        prices = fetch_prices(_PerPairStubClient(), pairs, executor)
+
+    assert prices == {"ETH-USDT": Decimal("3000"), "ETH-BTC": Decimal("0.05")}
+
+
+def test_current_prices_fetches_stale_streamed_pairs_over_rest(monkeypatch) -> None:
+    import engine.price_feed as price_feed
+    from nonkyc_client.ws import WebSocketClient
+
+    class _RestClient:
+        def __init__(self) -> None:
+            self.symbols: list[str] = []
+
+        def get_market_data(self, symbol: str) -> MarketTicker:
+            self.symbols.append(symbol)
+            return MarketTicker(symbol=symbol, last_price="7", raw_payload={})
+
+    now = {"value": 100.0}
+    monkeypatch.setattr(price_feed.time, "monotonic", lambda: now["value"])
+    feed = price_feed.TickerPriceFeed(
+        ["ETH-USDT", "ETH-BTC"], WebSocketClient(url="wss://ws.example")
+    )
+    feed.handle_message(
+        {"method": "ticker", "params": {"symbol": "ETH-USDT", "last": "3000"}}
+    )
+    now["value"] = 103.0
+    feed.handle_message(
+        {"method": "ticker", "params": {"symbol": "ETH-BTC", "last": "0.05"}}
+    )
+    now["value"] = 106.0
+    client = _RestClient()
+
+    prices = _current_prices(client, ("ETH-USDT", "ETH-BTC"), feed, 5.0)
+
+    # ETH-USDT stopped streaming 6s ago, so its frozen price is not used.
+    assert prices == {"ETH-USDT": Decimal("7"), "ETH-BTC": Decimal("0.05")}
+    assert client.symbols == ["ETH-USDT"]
+
+
+def test_get_price_cache_reuses_fresh_price() -> None:
+    class _CountingClient:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def get_market_data(self, symbol: str) -> MarketTicker:
+            self.calls += 1
+            return MarketTicker(symbol=symbol, last_price="42", raw_payload={})
+
+    client = _CountingClient()
+    assert get_price(client, "CACHE-USDT", cache_ttl=60) == Decimal("42")
+    assert get_price(client, "CACHE-USDT", cache_ttl=60) == Decimal("42")
+    assert client.calls == 1
+    assert get_price(client, "CACHE-USDT") == Decimal("42")
+    assert client.calls == 2
+
+
+def test_get_all_prices_parses_tickers_in_one_request() -> None:
+    from typing import Any
+
+    from nonkyc_client.rest import RestRequest
+
+    class _TickersStubClient:
+        def __init__(self) -> None:
+            self.requests: list[RestRequest] = []
+
+        def send(self, request: RestRequest) -> list[dict[str, Any]]:
+            self.requests.append(request)
+            return [
+                {"ticker_id": "ETH_USDT", "last_price": "3000"},
+                {
+                    "ticker_id": "ETH_BTC",
+                    "last_price": "",
+                    "bid": "0.04",
+                    "ask": "0.06",
+                },
+                {"ticker_id": "DOGE_USDT", "last_price": "0.1"},
+            ]
+
+    client = _TickersStubClient()
+    prices = get_all_prices(client, ("ETH/USDT", "ETH-BTC", "BTC_USDT"))
+
+    assert prices == {"ETH/USDT": Decimal("3000"), "ETH-BTC": Decimal("0.05")}
+    assert [request.path for request in client.requests] == ["/tickers"]
+
+
+def test_make_rounder_rounds_order_quantity_down_to_tick() -> None:
+    value = Decimal("1.23456789")
+    assert _make_rounder(None, 4, ROUND_DOWN)(value) == Decimal("1.2345")
+    assert _make_rounder("0.05", None, ROUND_DOWN)(value) == Decimal("1.20")
+    assert _make_rounder(None, None, ROUND_DOWN)(value) == value
+
+
+def test_make_rounder_specialises_rounding_mode() -> None:
+    from decimal import ROUND_UP
+
+    value = Decimal("1.23456")
+    assert _make_rounder(None, 2, ROUND_UP)(value) == Decimal("1.24")
+    assert _make_rounder("0.05", None, ROUND_UP)(value) == Decimal("1.25")
+    assert _make_rounder("0", None, ROUND_UP)(value) == value
+
+
+def test_build_leg_order_copies_prototype_with_new_quantity() -> None:
+    settings = _build_cycle_settings(
+        {
+            "pair_ab": "ETH/USDT",
+            "pair_bc": "ETH/BTC",
+            "pair_ac": "BTC/USDT",
+            "fee_rate": "0.002",
+            "min_profitability": "0.001",
+            "userProvidedId": "arb",
+            "strictValidate": True,
+        }
+    )
+
+    first = _build_leg_order(settings, "ETH/USDT", "buy", "market", Decimal("0.5"))
+    second = _build_leg_order(settings, "ETH/USDT", "buy", "market", Decimal("0.7"))
+
+    assert first.to_payload() == {
+        "symbol": "ETH/USDT",
+        "side": "buy",
+        "type": "market",
+        "quantity": "0.5",
+        "userProvidedId": "arb",
+        "strictValidate": True,
+    }
+    assert second.quantity == "0.7"
+    with pytest.raises(ValueError):
+        _build_leg_order(settings, "ETH/USDT", "buy", "market", Decimal("0"))
+
+
+def test_should_skip_notional_uses_precomputed_min_quantity() -> None:
+    args = (Decimal("1"), Decimal("0.998"), "ETH/USDT", "buy")
+
+    assert not _should_skip_notional(
+        *args, Decimal("0.001"), Decimal("2000"), "market", Decimal("0.001")
+    )
+    # Below the rounded minimum the exact notional still decides.
+    assert not _should_skip_notional(
+        *args, Decimal("0.0009"), Decimal("2000"), "market", Decimal("0.001")
+    )
+    assert _should_skip_notional(
+        *args, Decimal("0.0001"), Decimal("2000"), "market", Decimal("0.001")
+    )
+
+
+def test_float_cycle_ratio_scores_the_configured_triangle() -> None:
+    settings = _build_cycle_settings(
+        {
+            "pair_ab": "ETH/USDT",
+            "pair_bc": "ETH/BTC",
+            "pair_ac": "BTC/USDT",
+            "min_profitability": "0.001",
+            "fee_rate": "0.002",
+        }
+    )
+    prices = {
+        "ETH/USDT": Decimal("2000"),
+        "ETH/BTC": Decimal("0.05"),
+        "BTC/USDT": Decimal("41000"),
+    }
+
+    ratio = _float_cycle_ratio(settings, prices)
+
+    assert ratio == pytest.approx(0.05 * 41000 / 2000 * 0.998**3)
+    # An unpriced leg scores zero instead of dividing by zero.
+    assert _float_cycle_ratio(settings, dict(prices, **{"ETH/USDT": 0})) == 0.0
+
+
+def test_price_prefetcher_keeps_cache_warm() -> None:
+    import time
+
+    class _CountingClient:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def get_market_data(self, symbol: str) -> MarketTicker:
+            self.calls += 1
+            return MarketTicker(symbol=symbol, last_price="7", raw_payload={})
+
+    client = _CountingClient()
+    prefetcher = _PricePrefetcher(client, ("PREFETCH-USDT",), ttl=0.2, lead=0.1)
+    prefetcher.start()
+    try:
+        deadline = time.monotonic() + 2.0
+        while client.calls < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert get_price(client, "PREFETCH-USDT", cache_ttl=0.2) == Decimal("7")
+    finally:
+        prefetcher.stop()
+
+    # The first fetch and at least one refresh happened in the background.
+    assert client.calls >= 2
+
+
+def test_price_prefetcher_wakes_on_price_move() -> None:
+    class _StepClient:
+        def __init__(self) -> None:
+            self.price = "100"
+
+        def get_market_data(self, symbol: str) -> MarketTicker:
+            return MarketTicker(symbol=symbol, last_price=self.price, raw_payload={})
+
+    client = _StepClient()
+    _PRICE_CACHE.pop("WAKE-USDT", None)
+    prefetcher = _PricePrefetcher(
+        client, ("WAKE-USDT",), ttl=10.0, lead=5.0, wake_delta=0.01
+    )
+    prefetcher._refresh("WAKE-USDT")
+    client.price = "100.5"
+    prefetcher._refresh("WAKE-USDT")
+    assert prefetcher.wait_for_update(0) is False
+
+    client.price = "102"
+    prefetcher._refresh("WAKE-USDT")
+    assert prefetcher.wait_for_update(0) is True
+    assert prefetcher.wait_for_update(0) is False
+
+
+def test_price_failure_backoff_grows_and_honours_retry_after() -> None:
+    assert 2.0 <= _price_failure_backoff(1) < 3.0
+    assert 8.0 <= _price_failure_backoff(3) < 9.0
+    assert 60.0 <= _price_failure_backoff(10) < 61.0
+    # A long outage keeps backing off instead of overflowing.
+    assert 60.0 <= _price_failure_backoff(5000) < 61.0
+
+    _PRICE_RETRY_AFTER["value"] = 120.0
+    assert _price_failure_backoff(1) == 120.0
+    # The Retry-After hint is consumed by the backoff that honoured it.
+    assert _PRICE_RETRY_AFTER["value"] is None
+
+
+def test_prices_moved_ignores_changes_within_delta() -> None:
+    reference = (Decimal("100"), Decimal("0.1"))
+
+    assert _prices_moved(reference, None, Decimal("0.001")) is True
+    assert _prices_moved(reference, reference, Decimal("0")) is False
+    assert _prices_moved((Decimal("100.01"), Decimal("0.1")), reference, 0) is True
+    nudged = (Decimal("100.05"), Decimal("0.1"))
+    assert _prices_moved(nudged, reference, Decimal("0.001")) is False
+    moved = (Decimal("100"), Decimal("0.1002"))
+    assert _prices_moved(moved, reference, Decimal("0.001")) is True
+
+
+def test_describe_cycle_follows_leg_directions() -> None:
+    legs = [("ETH/USDT", True), ("ETH/BTC", False), ("BTC/USDT", False)]
+
+    assert _describe_cycle(legs) == "USDT -> ETH -> BTC -> USDT"
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import time
 from decimal import Decimal
 from unittest.mock import Mock, patch
 
 import pytest
 
 import bots.run_hybrid_arb_bot as run_hybrid_arb_bot
+from strategies.hybrid_triangular_arb import OrderBookQuote
 
 
 @pytest.fixture
@@ -185,3 +187,270 @@ def test_execute_leg_buy_uses_inverted_price_and_output_qty(mock_config):
         expected_qty = Decimal("100") / expected_price
         assert call_kwargs["quantity"] == expected_qty
         assert call_kwargs["price"] == expected_price
+
+
+def test_run_cycle_fetches_market_data_concurrently(mock_config):
+    """Every order book and the pool are requested at the same time."""
+    import threading
+
+    pairs = mock_config["orderbook_pairs"]
+    # Only releases once every fetch is in flight; sequential fetches time out.
+    barrier = threading.Barrier(len(pairs) + 1, timeout=5)
+
+    def fetch_prices(symbol):
+        barrier.wait()
+        return OrderBookQuote(Decimal("1"), Decimal("1"))
+
+    def fetch_pool(symbol):
+        barrier.wait()
+        return {"reserve_a": Decimal("10000"), "reserve_b": Decimal("5000")}
+
+    with patch("engine.rest_client_factory.build_rest_client", return_value=Mock()):
+        bot = run_hybrid_arb_bot.HybridArbBot(mock_config)
+    bot.fetch_orderbook_prices = fetch_prices
+    bot.fetch_pool_data = fetch_pool
+    bot.build_cycles = Mock(return_value=[])
+
+    bot.run_cycle()
+
+    orderbook_prices, pool_data = bot.build_cycles.call_args.args
+    assert list(orderbook_prices) == pairs
+    assert pool_data["reserve_a"] == Decimal("10000")
+
+
+def test_fetch_orderbook_prices_prefers_streamed_top(mock_config):
+    mock_exchange_client = Mock()
+    mock_exchange_client.get_orderbook_top.return_value = (
+        Decimal("0.48"),
+        Decimal("0.52"),
+    )
+
+    with (
+        patch("engine.rest_client_factory.build_rest_client", return_value=Mock()),
+        patch(
+            "engine.rest_client_factory.build_exchange_client",
+            return_value=mock_exchange_client,
+        ),
+    ):
+        bot = run_hybrid_arb_bot.HybridArbBot(mock_config)
+    bot.price_feed = Mock()
+    bot.price_feed.top.side_effect = lambda symbol, max_age: (
+        (Decimal("0.49"), Decimal("0.51")) if symbol == "COSA/USDT" else None
+    )
+
+    assert bot.fetch_orderbook_prices("COSA/USDT") == OrderBookQuote(
+        Decimal("0.49"), Decimal("0.51")
+    )
+    # Pairs without a fresh streamed book fall back to REST.
+    assert bot.fetch_orderbook_prices("COSA/BTC") == OrderBookQuote(
+        Decimal("0.48"), Decimal("0.52")
+    )
+
+
+def test_run_cycle_skips_decimal_cycles_below_bound(mock_config):
+    """A cycle that cannot clear the threshold at spot is never built."""
+    config = dict(
+        mock_config,
+        orderbook_pairs=["COSA_USDT", "PIRATE_USDT"],
+        pool_pair="COSA_PIRATE",
+    )
+    with patch("engine.rest_client_factory.build_rest_client", return_value=Mock()):
+        bot = run_hybrid_arb_bot.HybridArbBot(config)
+    market = {
+        "COSA_USDT": OrderBookQuote(Decimal("0.49"), Decimal("0.51")),
+        "PIRATE_USDT": OrderBookQuote(Decimal("0.99"), Decimal("1.01")),
+    }
+    bot.fetch_orderbook_prices = market.__getitem__
+    bot.fetch_pool_data = lambda symbol: {
+        "reserve_a": Decimal("10000"),
+        "reserve_b": Decimal("5000"),
+        "last_price": Decimal("0.5"),
+    }
+    bot.build_cycles = Mock(return_value=[])
+
+    bot.run_cycle()
+
+    bot.build_cycles.assert_not_called()
+    assert bot.cycles_evaluated == 2
+
+    # A pool mispriced against the order books has to be evaluated exactly.
+    bot.fetch_pool_data = lambda symbol: {
+        "reserve_a": Decimal("10000"),
+        "reserve_b": Decimal("6000"),
+        "last_price": Decimal("0.6"),
+    }
+    bot.run_cycle()
+
+    bot.build_cycles.assert_called_once()
+
+
+def test_fetch_pool_data_is_cached_until_ttl_or_swap(mock_config, mock_rest_client):
+    from strategies.hybrid_triangular_arb import LegType, TradeLeg, TradeSide
+
+    now = {"value": 100.0}
+    mock_config["pool_cache_ttl_sec"] = 5
+    with (
+        patch(
+            "engine.rest_client_factory.build_rest_client",
+            return_value=mock_rest_client,
+        ),
+        patch.object(run_hybrid_arb_bot.time, "monotonic", lambda: now["value"]),
+    ):
+        bot = run_hybrid_arb_bot.HybridArbBot(mock_config)
+        first = bot.fetch_pool_data("COSA/PIRATE")
+        now["value"] = 104.0
+        assert bot.fetch_pool_data("COSA/PIRATE") is first
+        assert mock_rest_client.get_liquidity_pool.call_count == 1
+
+        now["value"] = 106.0
+        bot.fetch_pool_data("COSA/PIRATE")
+        assert mock_rest_client.get_liquidity_pool.call_count == 2
+
+        # Our own swap changes the reserves, so the next fetch goes to the API.
+        bot.mode = "live"
+        bot._execute_leg(
+            TradeLeg(
+                leg_type=LegType.POOL_SWAP,
+                symbol="COSA/PIRATE",
+                side=TradeSide.SELL,
+                input_currency="COSA",
+                output_currency="PIRATE",
+                input_amount=Decimal("10"),
+                output_amount=Decimal("5"),
+                price=Decimal("0.5"),
+                fee_rate=Decimal("0.003"),
+            )
+        )
+        bot.fetch_pool_data("COSA/PIRATE")
+        assert mock_rest_client.get_liquidity_pool.call_count == 3
+
+
+def test_rpc_concurrency_caps_parallel_fetches(mock_config):
+    import threading
+
+    in_flight = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def fetch_prices(symbol):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        time.sleep(0.05)
+        with lock:
+            in_flight["now"] -= 1
+        return OrderBookQuote(Decimal("1"), Decimal("1"))
+
+    mock_config["rpc_concurrency"] = 2
+    with patch("engine.rest_client_factory.build_rest_client", return_value=Mock()):
+        bot = run_hybrid_arb_bot.HybridArbBot(mock_config)
+    bot.fetch_orderbook_prices = fetch_prices
+    bot.fetch_pool_data = lambda symbol: {"reserve_a": Decimal("0")}
+    bot.build_cycles = Mock(return_value=[])
+
+    bot.run_cycle()
+
+    assert in_flight["max"] == 2
+
+
+def _live_cycle():
+    from strategies.hybrid_triangular_arb import (
+        TradeSide,
+        create_orderbook_leg,
+        create_pool_swap_leg,
+        evaluate_cycle,
+    )
+
+    leg1 = create_orderbook_leg(
+        "COSA_USDT", TradeSide.BUY, Decimal("2"), "USDT", "COSA"
+    )
+    leg2 = create_pool_swap_leg(
+        "COSA_PIRATE", TradeSide.SELL, Decimal("0.5"), "COSA", "PIRATE"
+    )
+    leg3 = create_orderbook_leg(
+        "PIRATE_USDT", TradeSide.SELL, Decimal("1.01"), "PIRATE", "USDT"
+    )
+    return evaluate_cycle(leg1, leg2, leg3, Decimal("100"))
+
+
+def test_execute_cycle_stops_after_failed_leg2(mock_config):
+    mock_config["mode"] = "live"
+    with patch("engine.rest_client_factory.build_rest_client", return_value=Mock()):
+        bot = run_hybrid_arb_bot.HybridArbBot(mock_config)
+    cycle = _live_cycle()
+    order = []
+
+    def execute_leg(leg):
+        order.append(leg.symbol)
+        return leg is not cycle.leg2
+
+    bot._execute_leg = execute_leg
+
+    assert bot.execute_cycle(cycle) is False
+    # Leg 3 is never sent once leg 2 has failed.
+    assert order == ["COSA_USDT", "COSA_PIRATE"]
+    assert bot.partial_cycles == 1
+    assert bot.trades_executed == 0
+
+
+def test_run_keeps_a_fixed_schedule(mock_config, tmp_path):
+    mock_config["state_path"] = str(tmp_path / "state.json")
+    with patch("engine.rest_client_factory.build_rest_client", return_value=Mock()):
+        bot = run_hybrid_arb_bot.HybridArbBot(mock_config)
+    bot.profit_store = None
+    clock = {"now": 100.0}
+    cycle_starts = []
+    # The second cycle overruns the 2 s interval; the others take 0.5 s.
+    durations = iter([0.5, 2.5, 0.5, 0.5])
+
+    def run_cycle():
+        cycle_starts.append(clock["now"])
+        duration = next(durations, None)
+        if duration is None:
+            raise KeyboardInterrupt
+        clock["now"] += duration
+
+    def sleep(seconds):
+        clock["now"] += seconds
+
+    bot.run_cycle = run_cycle
+    with (
+        patch.object(run_hybrid_arb_bot.time, "monotonic", lambda: clock["now"]),
+        patch.object(run_hybrid_arb_bot.time, "sleep", sleep),
+    ):
+        bot.run()
+
+    assert cycle_starts == [100.0, 102.0, 104.5, 106.5, 108.5]
+
+
+def test_build_cycles_reuses_result_for_unchanged_market(mock_config):
+    import strategies.hybrid_triangular_arb as hybrid_triangular_arb
+
+    config = dict(
+        mock_config,
+        orderbook_pairs=["COSA_USDT", "PIRATE_USDT"],
+        pool_pair="COSA_PIRATE",
+    )
+    with patch("engine.rest_client_factory.build_rest_client", return_value=Mock()):
+        bot = run_hybrid_arb_bot.HybridArbBot(config)
+    market = {
+        "COSA_USDT": OrderBookQuote(Decimal("0.49"), Decimal("0.51")),
+        "PIRATE_USDT": OrderBookQuote(Decimal("0.99"), Decimal("1.01")),
+    }
+    pool = {
+        "reserve_a": Decimal("10000"),
+        "reserve_b": Decimal("5000"),
+        "last_price": Decimal("0.5"),
+    }
+
+    with patch.object(
+        hybrid_triangular_arb,
+        "evaluate_cycle",
+        wraps=hybrid_triangular_arb.evaluate_cycle,
+    ) as evaluate_cycle:
+        first = bot.build_cycles(market, pool)
+        assert bot.build_cycles(dict(market), dict(pool)) == first
+        assert evaluate_cycle.call_count == 2
+
+        market["COSA_USDT"] = OrderBookQuote(Decimal("0.48"), Decimal("0.51"))
+        bot.build_cycles(market, pool)
+        assert evaluate_cycle.call_count == 4
@@ -188,3 +188,107 @@ def test_rebalance_bot_multi_asset_selects_quote_pair():
         assert args[1] == Decimal("3.625")
         assert args[2] == Decimal("2004")
         assert kwargs["trading_pair"] == "ETH_USDT"
+
+
+def test_rebalance_bot_prefers_streamed_price(mock_config, mock_rest_client):
+    with patch(
+        "engine.rest_client_factory.build_rest_client", return_value=mock_rest_client
+    ):
+        bot = run_rebalance_bot.RebalanceBot(mock_config)
+    bot.price_feed = Mock()
+    bot.price_feed.price.return_value = Decimal("2100")
+    bot.price_feed.top.return_value = (Decimal("2099"), Decimal("2101"))
+
+    assert bot.get_price() == Decimal("2100")
+    bot.price_source = "ask"
+    assert bot.get_price() == Decimal("2101")
+    mock_rest_client.get_market_data.assert_not_called()
+
+    # A stale stream falls back to the REST ticker.
+    bot.price_feed.top.return_value = None
+    assert bot.get_price() == Decimal("2001")
+
+
+def test_rebalance_bot_skips_feed_without_matching_prices(mock_config):
+    mock_config.update({"price_feed": "ticker", "price_source": "mid"})
+    with (
+        patch("engine.rest_client_factory.build_rest_client", return_value=Mock()),
+        patch("engine.price_feed.build_price_feed") as build_price_feed,
+    ):
+        bot = run_rebalance_bot.RebalanceBot(mock_config)
+
+    assert bot.price_feed is None
+    build_price_feed.assert_not_called()
+
+
+def test_wait_for_next_check_ends_on_large_price_move(mock_config):
+    with patch("engine.rest_client_factory.build_rest_client", return_value=Mock()):
+        bot = run_rebalance_bot.RebalanceBot(mock_config)
+    assert bot.price_change_delta == Decimal("0.025")
+    prices = iter(
+        [
+            {"ETH/USDT": Decimal("2000")},  # reference
+            {"ETH/USDT": Decimal("2010")},  # +0.5%: keep waiting
+            {"ETH/USDT": Decimal("2060")},  # +3%: check now
+        ]
+    )
+    bot.price_feed = Mock()
+    bot.price_feed.prices.side_effect = lambda: next(prices)
+    bot.price_feed.wait_for_update.return_value = True
+
+    bot._wait_for_next_check(60)
+
+    assert bot.price_feed.wait_for_update.call_count == 2
+
+
+def test_run_cycle_fetches_balances_and_prices_concurrently(mock_config):
+    import threading
+
+    mock_config["rebalance_assets"] = [
+        {"asset": "ETH", "target_percent": "0.4", "trading_pair": "ETH_USDT"},
+        {"asset": "BTC", "target_percent": "0.4", "trading_pair": "BTC_USDT"},
+    ]
+    # Only releases once every fetch is in flight; sequential fetches time out.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def get_balances_map():
+        barrier.wait()
+        return {"ETH": Decimal("1"), "BTC": Decimal("0.1"), "USDT": Decimal("1000")}
+
+    def get_price_for_pair(trading_pair):
+        barrier.wait()
+        return {"ETH_USDT": Decimal("2000"), "BTC_USDT": Decimal("30000")}[trading_pair]
+
+    with patch("engine.rest_client_factory.build_rest_client", return_value=Mock()):
+        bot = run_rebalance_bot.RebalanceBot(mock_config)
+    bot.get_balances_map = get_balances_map
+    bot.get_price_for_pair = get_price_for_pair
+    bot.execute_rebalance = Mock(return_value=False)
+
+    bot.run_cycle()
+
+    assert bot.execute_rebalance.called
+
+
+def test_balances_are_cached_until_an_order_is_placed(mock_config):
+    mock_config["mode"] = "live"
+    mock_config["balance_cache_ttl_sec"] = 60
+    rest_client = Mock()
+    rest_client.get_balances.return_value = [
+        Mock(asset="ETH", available="1"),
+        Mock(asset="USDT", available="2000"),
+    ]
+    rest_client.place_order.return_value = Mock(order_id="1", status="New")
+    with patch(
+        "engine.rest_client_factory.build_rest_client", return_value=rest_client
+    ):
+        bot = run_rebalance_bot.RebalanceBot(mock_config)
+
+    expected = {"ETH": Decimal("1"), "USDT": Decimal("2000")}
+    assert bot.get_balances_map() == expected
+    assert bot.get_balances_map() == expected
+    assert rest_client.get_balances.call_count == 1
+
+    assert bot.execute_rebalance("buy", Decimal("0.1"), Decimal("2000"))
+    assert bot.get_balances_map() == expected
+    assert rest_client.get_balances.call_count == 2
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from decimal import Decimal
 
+import pytest
+
 from strategies import (
     adaptive_capped_martingale,
     grid,
+    hybrid_triangular_arb,
     infinity_ladder_grid,
     market_maker,
     rebalance,
@@ -87,6 +90,118 @@ def test_triangular_arb_rejects_unprofitable_cycle_with_fees() -> None:
     assert plan is None
 
 
+def test_triangular_arb_validates_only_rates_and_fee_in_use() -> None:
+    rates = {"A/B": Decimal("1"), "B/C": Decimal("1"), "C/A": Decimal("1")}
+    cycle = ("A/B", "B/C", "C/A")
+    # A pair outside every cycle is ignored, even with an invalid rate.
+    plan = triangular_arb.find_profitable_cycle(
+        cycles=[cycle],
+        rates={**rates, "D/E": Decimal("0")},
+        start_amount=Decimal("1"),
+        fee_rate=Decimal("0"),
+        profit_threshold=Decimal("0"),
+    )
+    assert plan is not None
+
+    with pytest.raises(ValueError, match="rates must be positive"):
+        triangular_arb.scan_cycle_returns([cycle], {**rates, "B/C": 0}, 0)
+    # An invalid fee is rejected even when every cycle is screened out.
+    with pytest.raises(ValueError, match="fee_rate must be non-negative"):
+        triangular_arb.find_profitable_cycle(
+            cycles=[cycle],
+            rates=rates,
+            start_amount=Decimal("1"),
+            fee_rate=Decimal("-0.01"),
+            profit_threshold=Decimal("0.5"),
+        )
+
+
+def test_triangular_arb_picks_best_of_many_cycles() -> None:
+    rates = {
+        "A/B": Decimal("2"),
+        "B/C": Decimal("3"),
+        "C/A": Decimal("0.2"),
+        "C/A2": Decimal("0.25"),
+        "C/A3": Decimal("0.1"),
+    }
+    cycles = [("A/B", "B/C", "C/A"), ("A/B", "B/C", "C/A2"), ("A/B", "B/C", "C/A3")]
+    scored = triangular_arb.scan_cycle_returns(cycles, rates, Decimal("0"))
+    assert [cycle for _, cycle in scored] == [cycles[1], cycles[0], cycles[2]]
+
+    plan = triangular_arb.find_profitable_cycle(
+        cycles=cycles,
+        rates=rates,
+        start_amount=Decimal("1"),
+        fee_rate=Decimal("0"),
+        profit_threshold=Decimal("0.1"),
+    )
+    assert plan is not None
+    assert plan.cycle == cycles[1]
+    assert plan.profit_ratio == Decimal("0.5")
+
+
+def test_triangular_arb_finds_and_scores_triangles_from_markets() -> None:
+    markets = ["ETH/USDT", "ETH-BTC", "BTC_USDT", "LTC/USDT", "LTC/BTC"]
+    triangles = triangular_arb.find_triangles(markets, "usdt")
+
+    assert (("ETH/USDT", True), ("ETH-BTC", False), ("BTC_USDT", False)) in triangles
+    assert (("BTC_USDT", True), ("ETH-BTC", True), ("ETH/USDT", False)) in triangles
+    assert len(triangles) == 4
+
+    prices = {
+        "ETH/USDT": Decimal("2000"),
+        "ETH-BTC": Decimal("0.05"),
+        "BTC_USDT": Decimal("41000"),
+        "LTC/USDT": Decimal("100"),
+    }
+    scanner = triangular_arb.TriangleScanner(triangles)
+    scores = scanner.scan(prices, Decimal("0"))
+    by_triangle = dict(zip(triangles, scores))
+    forward = (("ETH/USDT", True), ("ETH-BTC", False), ("BTC_USDT", False))
+    assert by_triangle[forward] == pytest.approx(1.025)
+    # LTC/BTC has no price, so LTC triangles cannot win.
+    assert all(
+        score == 0.0
+        for triangle, score in by_triangle.items()
+        if any(pair == "LTC/BTC" for pair, _ in triangle)
+    )
+
+    ratio, best = scanner.best(prices, Decimal("0.002"))
+    assert best == forward
+    assert ratio == pytest.approx(1.025 * 0.998**3)
+    assert triangular_arb.TriangleScanner([]).best(prices, 0) is None
+
+    moved = dict(prices, **{"BTC_USDT": Decimal("40000")})
+    assert dict(zip(triangles, scanner.scan(moved, 0)))[forward] == pytest.approx(1.0)
+
+
+def test_triangular_arb_negative_cycle_detection() -> None:
+    markets = ["ETH/USDT", "ETH/BTC", "BTC/USDT", "LTC/BTC"]
+    prices = {
+        "ETH/USDT": Decimal("2000"),
+        "ETH/BTC": Decimal("0.05"),
+        "BTC/USDT": Decimal("41000"),
+        "LTC/BTC": Decimal("0.002"),
+    }
+
+    cycle = triangular_arb.find_negative_cycle(markets, prices, Decimal("0.002"))
+    assert cycle is not None
+    assert len(cycle) == 3
+    # Whichever leg the cycle starts on, it buys ETH with USDT and sells it
+    # through BTC back to USDT.
+    assert set(cycle) == {("ETH/USDT", True), ("ETH/BTC", False), ("BTC/USDT", False)}
+
+    fair = dict(prices, **{"BTC/USDT": Decimal("40000")})
+    assert triangular_arb.find_negative_cycle(markets, fair, Decimal("0.002")) is None
+    # No priced market means no edges, let alone a cycle.
+    assert triangular_arb.find_negative_cycle(markets, {}, Decimal("0.002")) is None
+
+    detector = triangular_arb.NegativeCycleDetector(markets, Decimal("0.002"))
+    assert detector.detect(prices) == cycle
+    assert detector.detect(dict(prices)) is detector.detect(prices)
+    assert detector.detect(fair) is None
+
+
 def test_grid_description() -> None:
     assert "grid" in grid.describe().lower() or "Grid" in grid.describe()
 
@@ -99,3 +214,47 @@ def test_market_maker_description() -> None:
 def test_adaptive_capped_martingale_description() -> None:
     description = adaptive_capped_martingale.describe().lower()
     assert "martingale" in description
+
+
+def test_hybrid_cycle_return_bound_covers_pool_quote() -> None:
+    from utils.amm_pricing import PoolReserves, get_swap_quote
+
+    reserves = PoolReserves(Decimal("10000"), Decimal("6000"), "COSA", "PIRATE")
+    fee = Decimal("0.002")
+    pool_fee = Decimal("0.003")
+    token_a_per_base = Decimal("1") / Decimal("0.51")
+    quote = get_swap_quote(Decimal("100") * token_a_per_base, reserves, "COSA")
+    legs = (
+        hybrid_triangular_arb.create_orderbook_leg(
+            "COSA_USDT",
+            hybrid_triangular_arb.TradeSide.BUY,
+            token_a_per_base,
+            "USDT",
+            "COSA",
+            fee,
+        ),
+        hybrid_triangular_arb.create_pool_swap_leg(
+            "COSA_PIRATE",
+            hybrid_triangular_arb.TradeSide.SELL,
+            quote.effective_price,
+            "COSA",
+            "PIRATE",
+            pool_fee,
+            quote.price_impact,
+        ),
+        hybrid_triangular_arb.create_orderbook_leg(
+            "PIRATE_USDT",
+            hybrid_triangular_arb.TradeSide.SELL,
+            Decimal("0.99"),
+            "PIRATE",
+            "USDT",
+            fee,
+        ),
+    )
+    cycle = hybrid_triangular_arb.evaluate_cycle(*legs, Decimal("100"))
+
+    bound = hybrid_triangular_arb.cycle_return_bound(0.51, 0.6, 0.99, 0.002, 0.003)
+
+    assert float(cycle.expected_return) / 100 <= bound
+    assert bound == pytest.approx(0.6 * 0.99 / 0.51 * 0.998**2 * 0.997)
+    assert hybrid_triangular_arb.cycle_return_bound(0, 0.6, 0.99, 0, 0) == 0.0
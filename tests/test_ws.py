@@ -152,3 +152,18 @@ async def test_ws_connect_once_sends_payloads_and_dispatches() -> None:
         {"method": "subscribeTrades", "params": {"symbol": "BTC/USD"}},
     ]
     assert received == [message]
+
+
+@pytest.mark.asyncio
+async def test_ws_parses_binary_frames_and_reports_invalid_json() -> None:
+    client = WebSocketClient(url="wss://ws.example")
+    received: list[dict[str, Any]] = []
+    errors: list[dict[str, Any]] = []
+    client.register_handler("ticker", received.append)
+    client.set_error_handler(errors.append)
+
+    await client._handle_message(b'{"method": "ticker", "params": {"last": "1"}}')
+    await client._handle_message(b"not json")
+
+    assert received == [{"method": "ticker", "params": {"last": "1"}}]
+    assert errors == [{"error": "invalid_json", "payload": "not json"}]